@@ -0,0 +1,34 @@
+"""add_ibkr_trades_history_index
+
+Revision ID: b7d41e9a2c53
+Revises: fe94ecebcec0
+Create Date: 2026-10-18 10:12:44.531207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e9a2c53'
+down_revision: Union[str, None] = 'fe94ecebcec0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves keyset pagination of a user's history in (created_at DESC, id) order
+    op.create_index(
+        'idx_ibkr_trades_user_created_at_id',
+        'ibkr_trades',
+        ['user_id', sa.text('created_at DESC'), 'id']
+    )
+    # Covered by the leading column of the new index
+    op.drop_index('idx_ibkr_trades_user_id', table_name='ibkr_trades')
+
+
+def downgrade() -> None:
+    op.create_index('idx_ibkr_trades_user_id', 'ibkr_trades', ['user_id'])
+    op.drop_index('idx_ibkr_trades_user_created_at_id', table_name='ibkr_trades')
@@ -0,0 +1,80 @@
+"""Microbenchmark: MemoryCache vs StripedMemoryCache under concurrent get/set.
+
+Run from the repository root:
+
+    python -m benchmarks.cache_benchmark
+"""
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.infrastructure.adapters.external.memory_cache import MemoryCache
+from src.infrastructure.adapters.external.striped_memory_cache import StripedMemoryCache
+
+CONCURRENCY_LEVELS = [1_000, 10_000, 100_000]
+KEY_SPACE = 5_000
+READ_RATIO = 0.9
+
+
+async def _worker(cache, key: str, is_read: bool):
+    if is_read:
+        value = await cache.get(key)
+        if value is None:
+            await cache.set(key, {"price": "1.00"}, 180)
+    else:
+        await cache.set(key, {"price": "1.00"}, 180)
+
+
+async def run_async(cache_factory, operations: int) -> float:
+    cache = cache_factory()
+    rng = random.Random(42)
+    plan = [(f"price:T{rng.randrange(KEY_SPACE)}", rng.random() < READ_RATIO) for _ in range(operations)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(cache, key, is_read) for key, is_read in plan))
+    return time.perf_counter() - start
+
+
+def run_threaded(operations: int, threads: int = 8) -> float:
+    cache = StripedMemoryCache(max_entries=KEY_SPACE)
+    errors = []
+
+    def work(seed: int):
+        rng = random.Random(seed)
+        try:
+            for _ in range(operations // threads):
+                key = f"price:T{rng.randrange(KEY_SPACE)}"
+                if cache.get_nowait(key) is None:
+                    cache.set_nowait(key, {"price": "1.00"}, 180)
+        except Exception as e:
+            errors.append(e)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, range(threads)))
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(f"threaded run failed: {errors[0]!r}")
+    return elapsed
+
+
+def main():
+    backends = {
+        "MemoryCache": lambda: MemoryCache(max_entries=KEY_SPACE),
+        "StripedMemoryCache": lambda: StripedMemoryCache(max_entries=KEY_SPACE),
+    }
+
+    print(f"{'backend':<20} {'ops':>8} {'seconds':>9} {'ops/sec':>12}")
+    for operations in CONCURRENCY_LEVELS:
+        for name, factory in backends.items():
+            elapsed = asyncio.run(run_async(factory, operations))
+            print(f"{name:<20} {operations:>8} {elapsed:>9.3f} {operations / elapsed:>12,.0f}")
+
+    operations = CONCURRENCY_LEVELS[-1]
+    elapsed = run_threaded(operations)
+    print(f"{'Striped (8 threads)':<20} {operations:>8} {elapsed:>9.3f} {operations / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: building Trade and StockBalance entities from rows, validated vs constructed.
+
+Rows are dicts holding the values asyncpg returns for these columns (str,
+Decimal, timezone-aware datetime), so it runs offline. For 10k and 1M rows
+reports the per-row cost of pydantic validation, of model_construct and of
+the row_mapping fast path the Postgres repositories use, plus the memory the
+resulting entities retain.
+
+Run from the repository root:
+
+    python -m benchmarks.entity_mapping_benchmark
+"""
+import gc
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.trade import Trade, TradeType
+from src.infrastructure.adapters.persistence.postgres.row_mapping import to_stock_balance, to_trade
+
+ROW_COUNTS = [10_000, 1_000_000]
+
+
+def trade_rows(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            'id': str(uuid.uuid4()), 'user_id': 'bench-user', 'ticker': f"T{i % 50}", 'trade_type': 'buy',
+            'quantity': Decimal("3.0000"), 'price': Decimal("101.23"), 'total_amount': Decimal("303.69"), 'created_at': now
+        }
+        for i in range(count)
+    ]
+
+
+def stock_balance_rows(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            'id': str(uuid.uuid4()), 'user_id': 'bench-user', 'ticker': f"T{i}", 'quantity': Decimal("3.0000"),
+            'average_price': Decimal("101.23"), 'current_price': Decimal("101.23"), 'created_at': now, 'updated_at': now
+        }
+        for i in range(count)
+    ]
+
+
+def validated_trade(row) -> Trade:
+    return Trade(**{**row, 'trade_type': TradeType(row['trade_type'])})
+
+
+def constructed_trade(row) -> Trade:
+    return Trade.model_construct(**{**row, 'trade_type': TradeType(row['trade_type'])})
+
+
+def validated_stock_balance(row) -> StockBalance:
+    return StockBalance(**row)
+
+
+def constructed_stock_balance(row) -> StockBalance:
+    return StockBalance.model_construct(**row)
+
+
+def measure(mapper, rows) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    entities = [mapper(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del entities
+
+    # Separate pass: tracemalloc slows allocation down, so it would skew the timing
+    gc.collect()
+    tracemalloc.start()
+    entities = [mapper(row) for row in rows]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return {"us_per_row": elapsed / len(rows) * 1e6, "bytes_per_row": retained / len(rows)}
+
+
+def main():
+    cases = [
+        ("Trade", trade_rows, [("validated", validated_trade), ("model_construct", constructed_trade), ("row_mapping", to_trade)]),
+        ("StockBalance", stock_balance_rows, [
+            ("validated", validated_stock_balance),
+            ("model_construct", constructed_stock_balance),
+            ("row_mapping", to_stock_balance)
+        ])
+    ]
+    print(f"{'entity':<13} {'rows':>9} {'path':<16} {'us/row':>7} {'bytes/row':>10}")
+    for count in ROW_COUNTS:
+        for entity, build_rows, mappers in cases:
+            rows = build_rows(count)
+            for name, mapper in mappers:
+                result = measure(mapper, rows)
+                print(f"{entity:<13} {count:>9} {name:<16} {result['us_per_row']:>7.2f} {result['bytes_per_row']:>10.0f}")
+            del rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Benchmark: TradeService on the memory ledger vs the Postgres single-statement path.
+
+Runs the same buy/sell mix as trade_execution_benchmark through the memory
+repositories, with and without fsync, sequentially and concurrently. It checks
+that cash and position match the trade log, then times startup from the
+WAL alone and from a snapshot. The Postgres path runs too when DATABASE_URL
+points at a migrated database.
+
+    python -m benchmarks.ledger_benchmark
+    DATABASE_URL=postgresql://... python -m benchmarks.ledger_benchmark
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from decimal import Decimal
+
+from fastapi import HTTPException
+
+from benchmarks.trade_execution_benchmark import INITIAL_CASH, PRICE, FixedPriceProvider
+from src.application.services.balance_service import BalanceService
+from src.application.services.price_service import PriceService
+from src.application.services.trade_service import TradeService
+from src.domain.entities.trade import TradeType
+from src.domain.entities.user import User
+from src.infrastructure.adapters.external.memory_cache import MemoryCache
+from src.infrastructure.adapters.persistence.memory import (
+    MemoryBalanceRepository,
+    MemoryStockBalanceRepository,
+    MemoryTradeExecutionRepository,
+    MemoryTradeRepository,
+    MemoryUserRepository
+)
+from src.infrastructure.adapters.persistence.postgres import (
+    PostgresBalanceRepository,
+    PostgresStockBalanceRepository,
+    PostgresTradeExecutionRepository,
+    PostgresTradeRepository,
+    PostgresUserRepository
+)
+from src.infrastructure.config.memory_ledger import MemoryLedger
+from src.infrastructure.config.postgres_database import postgres_db
+
+MEMORY_TRADES = 20_000
+POSTGRES_TRADES = 2_000
+CONCURRENCY_LEVELS = (1, 50, 200)
+
+
+def build(backend: str, ledger: MemoryLedger = None) -> dict:
+    if backend == "memory":
+        return {
+            "users": MemoryUserRepository(ledger),
+            "balances": MemoryBalanceRepository(ledger),
+            "positions": MemoryStockBalanceRepository(ledger),
+            "trades": MemoryTradeRepository(ledger),
+            "execution": MemoryTradeExecutionRepository(ledger)
+        }
+    return {
+        "users": PostgresUserRepository(),
+        "balances": PostgresBalanceRepository(),
+        "positions": PostgresStockBalanceRepository(),
+        "trades": PostgresTradeRepository(),
+        "execution": PostgresTradeExecutionRepository()
+    }
+
+
+async def run(repositories: dict, trades: int, concurrency: int) -> dict:
+    user = await repositories["users"].create(
+        User(email=f"bench-{uuid.uuid4()}@example.com", api_key=f"bench-{uuid.uuid4()}")
+    )
+    balance_service = BalanceService(repositories["balances"])
+    await balance_service.create_balance(user.id, INITIAL_CASH)
+    service = TradeService(
+        repositories["trades"],
+        repositories["positions"],
+        balance_service,
+        PriceService(FixedPriceProvider(), MemoryCache()),
+        repositories["execution"]
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def trade(i: int):
+        nonlocal rejected
+        # Two buys for every sell keeps the position open for the whole run
+        trade_type = TradeType.SELL if i % 3 == 2 else TradeType.BUY
+        async with semaphore:
+            try:
+                await service.execute_trade(user.id, "BENCH", trade_type, Decimal("1"), PRICE)
+            except HTTPException:
+                rejected += 1
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(trade(i) for i in range(trades)))
+        elapsed = time.perf_counter() - start
+
+        balance = await balance_service.get_balance(user.id)
+        position = await repositories["positions"].find_by_user_id_and_ticker(user.id, "BENCH")
+        log = await repositories["trades"].find_by_user_id(user.id)
+        sign = {TradeType.BUY: 1, TradeType.SELL: -1}
+        quantity = position.quantity if position else Decimal("0")
+        return {
+            "trades_per_sec": round(trades / elapsed, 1),
+            "executed": len(log),
+            "rejected": rejected,
+            # Cash and position must both match the trade log
+            "consistent": quantity == sum(sign[t.trade_type] * t.quantity for t in log)
+            and INITIAL_CASH - balance.cash_balance == sum(sign[t.trade_type] * t.total_amount for t in log)
+        }
+    finally:
+        if not isinstance(repositories["users"], MemoryUserRepository):
+            async with postgres_db.acquire() as connection:
+                await connection.execute("DELETE FROM ibkr_users WHERE id = $1", user.id)
+
+
+def report(path: str, concurrency: int, result: dict) -> None:
+    print(
+        f"{path:<20} {concurrency:>11} {result['trades_per_sec']:>11} {result['executed']:>9} "
+        f"{result['rejected']:>9} {str(result['consistent']):>11}"
+    )
+
+
+async def time_startup(directory: str) -> float:
+    ledger = MemoryLedger(directory)
+    start = time.perf_counter()
+    await ledger.open()
+    elapsed = time.perf_counter() - start
+    await ledger.close()
+    return elapsed
+
+
+async def main():
+    print(f"{'path':<20} {'concurrency':>11} {'trades/sec':>11} {'executed':>9} {'rejected':>9} {'consistent':>11}")
+    directory = tempfile.mkdtemp(prefix="ledger-benchmark-")
+    try:
+        for fsync in (True, False):
+            for concurrency in CONCURRENCY_LEVELS:
+                path = os.path.join(directory, f"fsync-{fsync}-{concurrency}")
+                ledger = MemoryLedger(path, fsync=fsync)
+                await ledger.open()
+                result = await run(build("memory", ledger), MEMORY_TRADES, concurrency)
+                report(f"memory fsync={'on' if fsync else 'off'}", concurrency, result)
+                # Every trade is on disk by now: a copy is what a crash would leave behind
+                shutil.copytree(path, path + "-crashed")
+                await ledger.close()
+
+        if os.getenv("DATABASE_URL"):
+            await postgres_db.connect()
+            try:
+                for concurrency in CONCURRENCY_LEVELS:
+                    report("postgres", concurrency, await run(build("postgres"), POSTGRES_TRADES, concurrency))
+            finally:
+                await postgres_db.disconnect()
+
+        path = os.path.join(directory, f"fsync-True-{CONCURRENCY_LEVELS[-1]}")
+        replay_seconds = await time_startup(path + "-crashed")
+        snapshot_seconds = await time_startup(path)
+        print(
+            f"\nstartup with {MEMORY_TRADES} trades: WAL replay {replay_seconds * 1000:.0f} ms, "
+            f"snapshot load {snapshot_seconds * 1000:.0f} ms"
+        )
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
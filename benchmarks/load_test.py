@@ -0,0 +1,360 @@
+"""Offline load test: drives the real FastAPI app in-process and reports JSON.
+
+Requests go through httpx's ASGI transport into `main.app`, with the app
+lifespan running, so routing, auth, services and repositories are the real
+ones. The price provider is replaced with StubPriceProvider, which has
+configurable latency and error rate. It sits behind the real
+CompositePriceProvider, so no network is used. Scenarios:
+
+    price_polling   GET /api/v1/price/{ticker} over a ticker universe
+    mixed_trading   POST /api/v1/trade, two buys for every sell, several users
+                    (a sell of a ticker the user does not hold yet is a 400)
+    portfolio_cost  GET /api/v1/portfolio for a user with many holdings
+    portfolio_live  the same with ?valuation=live
+    auth_storm      GET /api/v1/balance from many users plus unknown API keys
+
+Each scenario reports throughput, latency percentiles, status codes, upstream
+price calls and Postgres round trips per request. Write the JSON with
+--output and compare it between commits.
+
+The repositories are the ones PERSISTENCE_BACKEND selects. Postgres needs a
+migrated database in DATABASE_URL (`alembic upgrade head`), and the seeded
+users are deleted at the end. The memory ledger runs in a throwaway LEDGER_DIR
+unless you set one:
+
+    DATABASE_URL=postgresql://... python -m benchmarks.load_test --output postgres.json
+    PERSISTENCE_BACKEND=memory python -m benchmarks.load_test --output memory.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Settings are read at import time: keep background work and log output out of the measurements
+os.environ.setdefault("PRICE_PREFETCH_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "CRITICAL")
+THROWAWAY_LEDGER_DIR = None
+if os.getenv("PERSISTENCE_BACKEND") == "memory" and not os.getenv("LEDGER_DIR"):
+    THROWAWAY_LEDGER_DIR = os.environ["LEDGER_DIR"] = tempfile.mkdtemp(prefix="load-test-ledger-")
+
+import httpx
+
+import main
+from src.application.ports.price_provider import PriceProvider, PriceProviderUnavailable
+from src.application.services.balance_service import BalanceService
+from src.application.services.portfolio_service import PortfolioService
+from src.application.services.price_service import PriceService
+from src.application.services.trade_service import TradeService
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.user import User
+from src.infrastructure.adapters.external.composite_price_provider import CompositePriceProvider
+from src.infrastructure.adapters.persistence.postgres.row_mapping import STOCK_BALANCE_COLUMNS
+from src.infrastructure.adapters.web import portfolio_controller, price_controller, trade_controller
+from src.infrastructure.config.cache import price_cache
+from src.infrastructure.config.memory_ledger import memory_ledger
+from src.infrastructure.config.postgres_database import postgres_db
+from src.infrastructure.config.repositories import (
+    create_balance_repository,
+    create_portfolio_repository,
+    create_stock_balance_repository,
+    create_trade_execution_repository,
+    create_trade_repository,
+    create_user_repository,
+    uses_memory_ledger
+)
+from src.infrastructure.config.settings import settings
+
+SCENARIOS = ["price_polling", "mixed_trading", "portfolio_cost", "portfolio_live", "auth_storm"]
+INITIAL_CASH = Decimal("1000000000")
+
+
+class StubPriceProvider(PriceProvider):
+    """Deterministic prices after a configurable delay; fails error_rate of the calls"""
+
+    def __init__(self, latency_ms: float, error_rate: float, seed: int):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    @staticmethod
+    def price_for(ticker: str) -> Decimal:
+        return Decimal(100 + sum(map(ord, ticker)) % 400).quantize(Decimal("0.01"))
+
+    async def _upstream(self) -> None:
+        self.calls += 1
+        # +-20% jitter around the configured latency
+        await asyncio.sleep(self.latency_ms / 1000 * self.rng.uniform(0.8, 1.2))
+        if self.rng.random() < self.error_rate:
+            raise PriceProviderUnavailable("stub upstream error")
+
+    async def get_price(self, ticker: str) -> Optional[Tuple[Decimal, str]]:
+        await self._upstream()
+        return self.price_for(ticker), "stub"
+
+    async def get_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        await self._upstream()
+        return {ticker: (self.price_for(ticker), "stub") for ticker in tickers}
+
+
+def dependency_overrides(provider: StubPriceProvider) -> Dict[Callable, Callable]:
+    """Controller dependencies rebuilt around the stub provider, on the configured repositories"""
+
+    def price_service() -> PriceService:
+        return PriceService(
+            CompositePriceProvider([provider]),
+            price_cache,
+            soft_ttl=settings.price_soft_ttl_seconds,
+            hard_ttl=settings.price_hard_ttl_seconds
+        )
+
+    def trade_service() -> TradeService:
+        return TradeService(
+            create_trade_repository(),
+            create_stock_balance_repository(),
+            BalanceService(create_balance_repository()),
+            price_service(),
+            create_trade_execution_repository()
+        )
+
+    def portfolio_service() -> PortfolioService:
+        return PortfolioService(
+            create_stock_balance_repository(),
+            create_portfolio_repository(),
+            price_service(),
+            valuation_batch_size=settings.portfolio_valuation_batch_size,
+            valuation_concurrency=settings.portfolio_valuation_concurrency
+        )
+
+    return {
+        price_controller.get_price_service: price_service,
+        trade_controller.get_trade_service: trade_service,
+        portfolio_controller.get_portfolio_service: portfolio_service
+    }
+
+
+class Seeder:
+    """Creates benchmark users through the repositories and deletes them afterwards"""
+
+    def __init__(self):
+        self.user_ids: List[str] = []
+
+    async def create_user(self, holdings: int = 0) -> str:
+        api_key = f"bench-{uuid.uuid4()}"
+        user = await create_user_repository().create(User(email=f"{api_key}@example.com", api_key=api_key))
+        await BalanceService(create_balance_repository()).create_balance(user.id, INITIAL_CASH)
+        if holdings:
+            now = datetime.now(timezone.utc)
+            records = [
+                (str(uuid.uuid4()), user.id, f"H{i}", Decimal("10"), Decimal("100"), Decimal("100"), now, now)
+                for i in range(holdings)
+            ]
+            if uses_memory_ledger():
+                await memory_ledger.commit([
+                    memory_ledger.put_position(StockBalance(**dict(zip(STOCK_BALANCE_COLUMNS.split(', '), record))))
+                    for record in records
+                ])
+            else:
+                async with postgres_db.acquire() as connection:
+                    await connection.copy_records_to_table(
+                        "ibkr_stock_balances", records=records, columns=STOCK_BALANCE_COLUMNS.split(', ')
+                    )
+        self.user_ids.append(user.id)
+        return api_key
+
+    async def cleanup(self) -> None:
+        # A throwaway ledger directory is removed as a whole after the run
+        if uses_memory_ledger():
+            return
+        async with postgres_db.acquire() as connection:
+            await connection.execute("DELETE FROM ibkr_users WHERE id = ANY($1::text[])", self.user_ids)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    provider: StubPriceProvider,
+    make_request: Callable[[int], Tuple[str, str, Optional[dict], dict]],
+    requests: int,
+    concurrency: int
+) -> dict:
+    latencies: List[float] = []
+    status_codes: Dict[str, int] = {}
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            method, url, body, headers = make_request(index)
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body, headers=headers)
+                code = str(response.status_code)
+                if response.status_code >= 500:
+                    errors += 1
+            except Exception:
+                code = "exception"
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+            status_codes[code] = status_codes.get(code, 0) + 1
+
+    queries_before = postgres_db.queries
+    commits_before = memory_ledger.group_commits
+    calls_before = provider.calls
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    # Query loggers are called back on the next loop iteration
+    await asyncio.sleep(0)
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "status_codes": status_codes,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 3),
+            "p95": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99": round(percentile(latencies, 0.99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3)
+        },
+        "db_round_trips_per_request": round((postgres_db.queries - queries_before) / requests, 3),
+        "wal_group_commits_per_request": round((memory_ledger.group_commits - commits_before) / requests, 3),
+        "upstream_price_calls": provider.calls - calls_before
+    }
+
+
+async def build_scenario(name: str, args, seeder: Seeder, rng: random.Random):
+    """Seed what the scenario needs and return its request factory"""
+    if name == "price_polling":
+        api_key = await seeder.create_user()
+        headers = {"Authorization": f"Bearer {api_key}"}
+        return lambda i: ("GET", f"/api/v1/price/P{rng.randrange(args.tickers)}", None, headers)
+
+    if name == "mixed_trading":
+        api_keys = [await seeder.create_user() for _ in range(args.users)]
+
+        def trade(i: int):
+            ticker = f"T{rng.randrange(10)}"
+            action = "sell" if i % 3 == 2 else "buy"
+            body = {"ticker": ticker, "action": action, "quantity": 1, "price": float(StubPriceProvider.price_for(ticker))}
+            return "POST", "/api/v1/trade", body, {"Authorization": f"Bearer {rng.choice(api_keys)}"}
+        return trade
+
+    if name in ("portfolio_cost", "portfolio_live"):
+        api_key = await seeder.create_user(holdings=args.holdings)
+        headers = {"Authorization": f"Bearer {api_key}"}
+        url = "/api/v1/portfolio?valuation=live" if name == "portfolio_live" else "/api/v1/portfolio"
+        return lambda i: ("GET", url, None, headers)
+
+    if name == "auth_storm":
+        api_keys = [await seeder.create_user() for _ in range(args.users)]
+
+        def balance(i: int):
+            # One in five requests carries a key nobody has, as a credential-stuffing client would
+            api_key = f"unknown-{uuid.uuid4()}" if rng.random() < 0.2 else rng.choice(api_keys)
+            return "GET", "/api/v1/balance", None, {"Authorization": f"Bearer {api_key}"}
+        return balance
+
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+async def run(args) -> dict:
+    provider = StubPriceProvider(args.provider_latency_ms, args.provider_error_rate, args.seed)
+    main.app.dependency_overrides.update(dependency_overrides(provider))
+    rng = random.Random(args.seed)
+    seeder = Seeder()
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "backend": settings.persistence_backend,
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "provider_latency_ms": args.provider_latency_ms,
+            "provider_error_rate": args.provider_error_rate,
+            "tickers": args.tickers,
+            "users": args.users,
+            "holdings": args.holdings,
+            "seed": args.seed
+        },
+        "scenarios": {}
+    }
+
+    async with main.lifespan(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+                for name in args.scenarios:
+                    make_request = await build_scenario(name, args, seeder, rng)
+                    report["scenarios"][name] = await run_scenario(
+                        client, provider, make_request, args.requests, args.concurrency
+                    )
+                    print(f"{name}: {json.dumps(report['scenarios'][name])}", file=sys.stderr)
+        finally:
+            if seeder.user_ids:
+                await seeder.cleanup()
+            main.app.dependency_overrides.clear()
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="requests in flight")
+    parser.add_argument("--provider-latency-ms", type=float, default=50)
+    parser.add_argument("--provider-error-rate", type=float, default=0.0)
+    parser.add_argument("--tickers", type=int, default=500, help="ticker universe for price_polling")
+    parser.add_argument("--users", type=int, default=50, help="users for mixed_trading and auth_storm")
+    parser.add_argument("--holdings", type=int, default=1000, help="holdings for the portfolio scenarios")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main_cli():
+    args = parse_args()
+    if not uses_memory_ledger() and not settings.database_url:
+        sys.exit("DATABASE_URL must point at a migrated Postgres, or set PERSISTENCE_BACKEND=memory")
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        if THROWAWAY_LEDGER_DIR:
+            shutil.rmtree(THROWAWAY_LEDGER_DIR, ignore_errors=True)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,97 @@
+"""Benchmark: mapping find_by_user_id rows to entities, str round trip vs shared row mapping.
+
+Needs a migrated Postgres in DATABASE_URL (`alembic upgrade head`). Creates a
+throwaway user with ROWS trades (loaded with COPY), fetches them the way
+PostgresTradeRepository.find_by_user_id does, then times mapping the same
+records with the old `Decimal(str(row[...]))` conversion and with
+row_mapping.to_trade, and deletes the user.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.row_mapping_benchmark
+"""
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from src.domain.entities.trade import Trade, TradeType
+from src.domain.entities.user import User
+from src.infrastructure.adapters.persistence.postgres import PostgresTradeRepository, PostgresUserRepository
+from src.infrastructure.adapters.persistence.postgres.row_mapping import TRADE_COLUMNS, to_trade
+from src.infrastructure.config.postgres_database import postgres_db
+
+ROWS = 100_000
+REPEATS = 5
+
+
+def legacy_to_trade(row) -> Trade:
+    return Trade(
+        id=row['id'],
+        user_id=row['user_id'],
+        ticker=row['ticker'],
+        trade_type=TradeType(row['trade_type']),
+        quantity=Decimal(str(row['quantity'])),
+        price=Decimal(str(row['price'])),
+        total_amount=Decimal(str(row['total_amount'])),
+        created_at=row['created_at']
+    )
+
+
+async def create_user() -> str:
+    user = await PostgresUserRepository().create(
+        User(email=f"bench-{uuid.uuid4()}@example.com", api_key=f"bench-{uuid.uuid4()}")
+    )
+    now = datetime.utcnow()
+    records = [
+        (str(uuid.uuid4()), user.id, f"T{i % 50}", "buy", Decimal("3"), Decimal("101.2345"), Decimal("303.7035"), now)
+        for i in range(ROWS)
+    ]
+    async with postgres_db.acquire() as connection:
+        await connection.copy_records_to_table("ibkr_trades", records=records, columns=TRADE_COLUMNS.split(', '))
+    return user.id
+
+
+async def delete_user(user_id: str) -> None:
+    async with postgres_db.acquire() as connection:
+        await connection.execute("DELETE FROM ibkr_users WHERE id = $1", user_id)
+
+
+def time_mapping(mapper, rows) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        trades = [mapper(row) for row in rows]
+        timings.append(time.perf_counter() - start)
+    assert len(trades) == len(rows)
+    return statistics.median(timings)
+
+
+async def main():
+    await postgres_db.connect()
+    user_id = await create_user()
+    try:
+        async with postgres_db.acquire() as connection:
+            start = time.perf_counter()
+            rows = await connection.fetch(f"SELECT {TRADE_COLUMNS} FROM ibkr_trades WHERE user_id = $1", user_id)
+            fetch_seconds = time.perf_counter() - start
+
+        assert all(legacy_to_trade(row) == to_trade(row) for row in rows[:1000])
+
+        start = time.perf_counter()
+        await PostgresTradeRepository().find_by_user_id(user_id)
+        repository_seconds = time.perf_counter() - start
+
+        print(f"{len(rows)} rows, fetch {fetch_seconds * 1000:.0f} ms, median of {REPEATS} mapping runs")
+        print(f"{'mapping':<22} {'total_ms':>9} {'us/row':>7}")
+        for name, mapper in (("Decimal(str(...))", legacy_to_trade), ("row_mapping.to_trade", to_trade)):
+            seconds = time_mapping(mapper, rows)
+            print(f"{name:<22} {seconds * 1000:>9.0f} {seconds / len(rows) * 1e6:>7.2f}")
+        print(f"{'find_by_user_id':<22} {repository_seconds * 1000:>9.0f} {repository_seconds / len(rows) * 1e6:>7.2f}")
+    finally:
+        await delete_user(user_id)
+        await postgres_db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
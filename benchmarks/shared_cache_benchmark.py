@@ -0,0 +1,96 @@
+"""Benchmark: per-process price cache vs the SQLite-WAL cache shared by all workers.
+
+Simulates WORKERS worker processes each serving the same skewed ticker mix
+through a cache-aside lookup (get, and on a miss an upstream fetch followed by
+set). Reports the hit ratio across all workers, the upstream fetches that
+caused, and get latency.
+
+Run from the repository root:
+
+    python -m benchmarks.shared_cache_benchmark
+"""
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from src.infrastructure.adapters.external.sqlite_cache import SqliteCache
+from src.infrastructure.adapters.external.striped_memory_cache import StripedMemoryCache
+
+WORKER_COUNTS = [1, 4, 8]
+REQUESTS_PER_WORKER = 20_000
+KEY_SPACE = 2_000
+TTL_SECONDS = 180
+
+
+def build_cache(backend: str, path: str):
+    if backend == "sqlite":
+        return SqliteCache(path, max_entries=KEY_SPACE)
+    return StripedMemoryCache(max_entries=KEY_SPACE)
+
+
+async def serve(backend: str, path: str, seed: int) -> dict:
+    cache = build_cache(backend, path)
+    rng = random.Random(seed)
+    # A few tickers get most of the traffic, as with real watchlists
+    weights = [1 / (rank + 1) for rank in range(KEY_SPACE)]
+    tickers = rng.choices([f"T{i}" for i in range(KEY_SPACE)], weights=weights, k=REQUESTS_PER_WORKER)
+
+    latencies = []
+    upstream = 0
+    for ticker in tickers:
+        start = time.perf_counter()
+        value = await cache.get(f"price:{ticker}")
+        latencies.append(time.perf_counter() - start)
+        if value is None:
+            upstream += 1
+            await cache.set(
+                f"price:{ticker}",
+                {"ticker": ticker, "price": Decimal("101.25"), "source": "bench", "timestamp": datetime.now()},
+                TTL_SECONDS
+            )
+    if backend == "sqlite":
+        cache.close()
+    return {"upstream": upstream, "latencies": latencies}
+
+
+def worker(args) -> dict:
+    return asyncio.run(serve(*args))
+
+
+def run(backend: str, workers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "price_cache.db")
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.map(worker, [(backend, path, seed) for seed in range(workers)])
+
+    requests = workers * REQUESTS_PER_WORKER
+    upstream = sum(r["upstream"] for r in results)
+    latencies = sorted(latency for r in results for latency in r["latencies"])
+    return {
+        "hit_ratio": round(1 - upstream / requests, 4),
+        "upstream": upstream,
+        "get_p50_us": round(statistics.median(latencies) * 1e6, 1),
+        "get_p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 1)
+    }
+
+
+def main():
+    print(f"{REQUESTS_PER_WORKER} requests per worker over {KEY_SPACE} tickers")
+    print(f"{'backend':<14} {'workers':>7} {'hit_ratio':>10} {'upstream':>9} {'get_p50_us':>11} {'get_p99_us':>11}")
+    for workers in WORKER_COUNTS:
+        for backend in ("per-process", "sqlite"):
+            result = run(backend, workers)
+            print(
+                f"{backend:<14} {workers:>7} {result['hit_ratio']:>10} {result['upstream']:>9} "
+                f"{result['get_p50_us']:>11} {result['get_p99_us']:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark: TradeService on the per-repository path vs the single-statement path.
+
+Needs a migrated Postgres in DATABASE_URL (`alembic upgrade head`). Creates a
+throwaway user, runs the same buy/sell mix through both paths sequentially and
+concurrently, checks the resulting cash and position, and deletes the user.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.trade_execution_benchmark
+"""
+import asyncio
+import time
+import uuid
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.application.ports.price_provider import PriceProvider
+from src.application.services.balance_service import BalanceService
+from src.application.services.price_service import PriceService
+from src.application.services.trade_service import TradeService
+from src.domain.entities.trade import TradeType
+from src.domain.entities.user import User
+from src.infrastructure.adapters.external.memory_cache import MemoryCache
+from src.infrastructure.adapters.persistence.postgres import (
+    PostgresBalanceRepository,
+    PostgresStockBalanceRepository,
+    PostgresTradeExecutionRepository,
+    PostgresTradeRepository,
+    PostgresUserRepository
+)
+from src.infrastructure.config.postgres_database import postgres_db
+
+TRADES = 400
+CONCURRENCY = 20
+PRICE = Decimal("100.00")
+INITIAL_CASH = Decimal("100000000")
+
+
+class FixedPriceProvider(PriceProvider):
+    async def get_price(self, ticker: str) -> Optional[Tuple[Decimal, str]]:
+        return (PRICE, "fixed")
+
+
+def build_trade_service(transactional: bool) -> TradeService:
+    return TradeService(
+        PostgresTradeRepository(),
+        PostgresStockBalanceRepository(),
+        BalanceService(PostgresBalanceRepository()),
+        PriceService(FixedPriceProvider(), MemoryCache()),
+        PostgresTradeExecutionRepository() if transactional else None
+    )
+
+
+async def create_user() -> str:
+    user = await PostgresUserRepository().create(
+        User(email=f"bench-{uuid.uuid4()}@example.com", api_key=f"bench-{uuid.uuid4()}")
+    )
+    await BalanceService(PostgresBalanceRepository()).create_balance(user.id, INITIAL_CASH)
+    return user.id
+
+
+async def delete_user(user_id: str) -> None:
+    async with postgres_db.acquire() as connection:
+        await connection.execute("DELETE FROM ibkr_users WHERE id = $1", user_id)
+
+
+async def run(transactional: bool, concurrency: int) -> dict:
+    user_id = await create_user()
+    service = build_trade_service(transactional)
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+    errors = 0
+
+    async def trade(i: int):
+        nonlocal rejected, errors
+        # Two buys for every sell keeps the position open for the whole run
+        trade_type = TradeType.SELL if i % 3 == 2 else TradeType.BUY
+        async with semaphore:
+            try:
+                await service.execute_trade(user_id, "BENCH", trade_type, Decimal("1"), PRICE)
+            except HTTPException:
+                rejected += 1
+            except Exception:
+                # e.g. the per-repository path racing itself into a unique violation
+                errors += 1
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(trade(i) for i in range(TRADES)))
+        elapsed = time.perf_counter() - start
+
+        balance = await BalanceService(PostgresBalanceRepository()).get_balance(user_id)
+        position = await PostgresStockBalanceRepository().find_by_user_id_and_ticker(user_id, "BENCH")
+        trades = await PostgresTradeRepository().find_by_user_id(user_id)
+        sign = {TradeType.BUY: 1, TradeType.SELL: -1}
+        expected_quantity = sum(sign[t.trade_type] * t.quantity for t in trades)
+        expected_cash_spent = sum(sign[t.trade_type] * t.total_amount for t in trades)
+        quantity = position.quantity if position else Decimal("0")
+        cash_spent = INITIAL_CASH - balance.cash_balance
+        return {
+            "trades_per_sec": round(TRADES / elapsed, 1),
+            "executed": len(trades),
+            "rejected": rejected,
+            "errors": errors,
+            # Cash and position must both match the trade log; lost updates show up as a mismatch
+            "consistent": quantity == expected_quantity and cash_spent == expected_cash_spent
+        }
+    finally:
+        await delete_user(user_id)
+
+
+async def main():
+    await postgres_db.connect()
+    try:
+        print(f"{'path':<16} {'concurrency':>11} {'trades/sec':>11} {'executed':>9} {'rejected':>9} {'errors':>7} {'consistent':>11}")
+        for concurrency in (1, CONCURRENCY):
+            for transactional in (False, True):
+                result = await run(transactional, concurrency)
+                path = "single-statement" if transactional else "per-repository"
+                print(
+                    f"{path:<16} {concurrency:>11} {result['trades_per_sec']:>11} {result['executed']:>9} "
+                    f"{result['rejected']:>9} {result['errors']:>7} {str(result['consistent']):>11}"
+                )
+    finally:
+        await postgres_db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
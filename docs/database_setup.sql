@@ -46,7 +46,8 @@ CREATE INDEX IF NOT EXISTS idx_ibkr_users_api_key ON ibkr_users(api_key);
 CREATE INDEX IF NOT EXISTS idx_ibkr_balances_user_id ON ibkr_balances(user_id);
 CREATE INDEX IF NOT EXISTS idx_ibkr_stock_balances_user_id ON ibkr_stock_balances(user_id);
 CREATE INDEX IF NOT EXISTS idx_ibkr_stock_balances_user_ticker ON ibkr_stock_balances(user_id, ticker);
-CREATE INDEX IF NOT EXISTS idx_ibkr_trades_user_id ON ibkr_trades(user_id);
+-- Serves keyset pagination of a user's history in (created_at DESC, id) order
+CREATE INDEX IF NOT EXISTS idx_ibkr_trades_user_created_at_id ON ibkr_trades(user_id, created_at DESC, id);
 CREATE INDEX IF NOT EXISTS idx_ibkr_trades_created_at ON ibkr_trades(created_at);
 
 -- Create trigger to update updated_at timestamp
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,18 +10,59 @@ from src.infrastructure.adapters.web import (
     balance_controller,
     price_controller,
     portfolio_controller,
-    trade_controller
+    trade_controller,
+    stream_controller,
+    metrics_controller
 )
+from src.infrastructure.adapters.external.alphavantage_price_provider import AlphavantageProvider
+from src.infrastructure.adapters.external.yahoo_price_provider import YahooPriceProvider
+from src.infrastructure.config.cache import price_cache
+from src.infrastructure.config.http_client import http_clients
+from src.infrastructure.config.memory_ledger import memory_ledger
+from src.infrastructure.config.metrics import loop_lag_monitor
+from src.infrastructure.config.postgres_database import postgres_db
+from src.infrastructure.config.price_prefetch import price_prefetcher
+from src.infrastructure.config.price_stream import price_stream
 from src.infrastructure.config.settings import settings
+from src.infrastructure.config.system_metrics import system_metrics
 from src.infrastructure.config.logging_config import setup_logging
+from src.infrastructure.middleware.metrics import MetricsMiddleware
 
 load_dotenv()
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.persistence_backend == "memory":
+        await memory_ledger.open()
+        memory_ledger.start_snapshots(settings.ledger_snapshot_interval_seconds)
+    elif settings.database_url:
+        await postgres_db.connect()
+    await http_clients.connect(YahooPriceProvider.client_name, AlphavantageProvider.client_name)
+    price_cache.start_expiry(settings.price_cache_cleanup_interval_seconds)
+    system_metrics.start(settings.health_sample_interval_seconds)
+    loop_lag_monitor.start(settings.metrics_loop_lag_interval_seconds)
+    if settings.price_prefetch_enabled:
+        price_prefetcher.start(settings.price_prefetch_interval_seconds)
+    yield
+    await price_prefetcher.stop()
+    await price_stream.stop()
+    await price_cache.stop_expiry()
+    if hasattr(price_cache, "close"):
+        price_cache.close()
+    await system_metrics.stop()
+    await loop_lag_monitor.stop()
+    await http_clients.disconnect()
+    await memory_ledger.close()
+    await postgres_db.disconnect()
+
+
 app = FastAPI(
     title="IBKR Broker Simulator",
     description="A simulated broker for stocks and crypto trading",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -29,12 +72,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(health_controller.router, tags=["Health"])
+app.include_router(metrics_controller.router, tags=["Metrics"])
 app.include_router(balance_controller.router, prefix="/api", tags=["Balance"])
 app.include_router(price_controller.router, prefix="/api", tags=["Price"])
 app.include_router(portfolio_controller.router, prefix="/api", tags=["Portfolio"])
 app.include_router(trade_controller.router, prefix="/api", tags=["Trade"])
+app.include_router(stream_controller.router, prefix="/api", tags=["Stream"])
 
 
 if __name__ == "__main__":
@@ -7,6 +7,11 @@ class Cache(ABC):
     async def get(self, key: str) -> Optional[Any]:
         pass
 
+    @abstractmethod
+    async def peek(self, key: str) -> Optional[Any]:
+        """Like get, but leaves hit/miss counters and eviction order untouched"""
+        pass
+
     @abstractmethod
     async def set(self, key: str, value: Any, ttl_seconds: int = 180) -> None:
         pass
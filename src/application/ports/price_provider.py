@@ -1,9 +1,31 @@
+import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+
+class PriceProviderUnavailable(Exception):
+    """Raised when the upstream itself is failing (rate limit, 5xx, timeout).
+
+    Distinct from returning None, which means the upstream answered but has no
+    price for the ticker.
+    """
 
 
 class PriceProvider(ABC):
     @abstractmethod
     async def get_price(self, ticker: str) -> Optional[Tuple[Decimal, str]]:
-        pass
\ No newline at end of file
+        pass
+
+    async def get_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        """Fetch several tickers at once; tickers without a price are left out.
+
+        Providers with a multi-symbol upstream should override this. The default
+        fans out to get_price concurrently.
+        """
+        results = await asyncio.gather(*(self.get_price(ticker) for ticker in tickers), return_exceptions=True)
+        return {
+            ticker: result
+            for ticker, result in zip(tickers, results)
+            if result is not None and not isinstance(result, BaseException)
+        }
\ No newline at end of file
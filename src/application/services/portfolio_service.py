@@ -1,11 +1,96 @@
-from typing import List
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+from src.application.services.price_service import PriceService
+from src.domain.entities.portfolio import HoldingValuation, Portfolio, PortfolioValuation
 from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.stock_price import StockPrice
+from src.domain.repositories.portfolio_repository import PortfolioRepository
 from src.domain.repositories.stock_balance_repository import StockBalanceRepository
 
 
 class PortfolioService:
-    def __init__(self, stock_balance_repository: StockBalanceRepository):
+    def __init__(
+        self,
+        stock_balance_repository: StockBalanceRepository,
+        portfolio_repository: Optional[PortfolioRepository] = None,
+        price_service: Optional[PriceService] = None,
+        valuation_batch_size: int = 50,
+        valuation_concurrency: int = 4
+    ):
         self.stock_balance_repository = stock_balance_repository
+        self.portfolio_repository = portfolio_repository
+        self.price_service = price_service
+        self.valuation_batch_size = valuation_batch_size
+        self.valuation_concurrency = valuation_concurrency
 
     async def get_portfolio(self, user_id: str) -> List[StockBalance]:
-        return await self.stock_balance_repository.find_by_user_id(user_id)
\ No newline at end of file
+        return await self.stock_balance_repository.find_by_user_id(user_id)
+
+    async def get_portfolio_summary(self, user_id: str) -> Portfolio:
+        """Cash, holdings and invested value from the portfolio read model"""
+        if self.portfolio_repository is None:
+            raise RuntimeError("PortfolioService was built without a portfolio repository")
+        return await self.portfolio_repository.find_by_user_id(user_id)
+
+    async def get_valuation(self, user_id: str) -> PortfolioValuation:
+        """Mark every holding to market and compute unrealized P&L on Decimal"""
+        if self.price_service is None:
+            raise RuntimeError("PortfolioService was built without a price service")
+
+        portfolio = await self.get_portfolio_summary(user_id)
+        prices = await self._price_tickers(list(dict.fromkeys(sb.ticker for sb in portfolio.holdings)))
+
+        now = datetime.now()
+        holdings: List[HoldingValuation] = []
+        total_market_value = Decimal("0")
+        total_unrealized_pnl = Decimal("0")
+        for sb in portfolio.holdings:
+            cost_basis = sb.quantity * sb.average_price
+            stock_price = prices.get(sb.ticker)
+            if stock_price is None:
+                holdings.append(HoldingValuation(holding=sb, cost_basis=cost_basis))
+                continue
+
+            market_value = sb.quantity * stock_price.price
+            unrealized_pnl = market_value - cost_basis
+            holdings.append(HoldingValuation(
+                holding=sb,
+                cost_basis=cost_basis,
+                market_price=stock_price.price,
+                market_value=market_value,
+                unrealized_pnl=unrealized_pnl,
+                unrealized_pnl_percent=(unrealized_pnl / cost_basis * 100).quantize(Decimal("0.01")) if cost_basis else None,
+                price_source=stock_price.source,
+                quote_age_seconds=round((now - stock_price.timestamp).total_seconds(), 3),
+                price_stale=stock_price.stale
+            ))
+            total_market_value += market_value
+            total_unrealized_pnl += unrealized_pnl
+
+        return PortfolioValuation(
+            portfolio=portfolio,
+            holdings=holdings,
+            total_market_value=total_market_value,
+            total_unrealized_pnl=total_unrealized_pnl,
+            unpriced_tickers=[h.holding.ticker for h in holdings if h.market_price is None]
+        )
+
+    async def _price_tickers(self, tickers: List[str]) -> Dict[str, StockPrice]:
+        """Price tickers through the batch path, a bounded number of batches at a time.
+
+        PriceService coalesces concurrent misses per ticker, so concurrent
+        valuations cost at most one upstream fetch per distinct ticker.
+        """
+        semaphore = asyncio.Semaphore(self.valuation_concurrency)
+
+        async def price_batch(batch: List[str]) -> Dict[str, StockPrice]:
+            async with semaphore:
+                return await self.price_service.get_current_prices(batch)
+
+        batches = [tickers[i:i + self.valuation_batch_size] for i in range(0, len(tickers), self.valuation_batch_size)]
+        prices: Dict[str, StockPrice] = {}
+        for result in await asyncio.gather(*(price_batch(batch) for batch in batches)):
+            prices.update(result)
+        return prices
\ No newline at end of file
@@ -0,0 +1,126 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+from src.application.services.price_service import PriceService, price_demand
+from src.application.services.ticker_demand import TickerDemand
+from src.domain.repositories.ticker_activity_repository import TickerActivityRepository
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PricePrefetcher:
+    """Keeps hot tickers warm in the price cache.
+
+    Each cycle the hot set is the held and recently traded tickers from the
+    database plus the most requested tickers. Those not cached, or due to
+    turn stale within lead_seconds, are refreshed in batches of batch_size,
+    and at most budget_requests batches go upstream per cycle. The run
+    interval should not exceed lead_seconds, or entries can go stale
+    between cycles.
+    """
+
+    def __init__(
+        self,
+        price_service_factory: Callable[[], PriceService],
+        ticker_activity_repository: Optional[TickerActivityRepository] = None,
+        demand: Optional[TickerDemand] = None,
+        lead_seconds: float = 30,
+        budget_requests: int = 10,
+        batch_size: int = 20,
+        max_tickers: int = 200,
+        trade_lookback_hours: float = 24
+    ):
+        self.price_service_factory = price_service_factory
+        self.ticker_activity_repository = ticker_activity_repository
+        self.demand = demand if demand is not None else price_demand
+        self.lead_seconds = lead_seconds
+        self.budget_requests = budget_requests
+        self.batch_size = batch_size
+        self.max_tickers = max_tickers
+        self.trade_lookback_hours = trade_lookback_hours
+        self._task: Optional[asyncio.Task] = None
+        self.cycles = 0
+        self.hot_tickers = 0
+        self.refreshed = 0
+        self.over_budget = 0
+        self.errors = 0
+
+    async def hot_set(self) -> List[str]:
+        """Database activity first, then request demand, without duplicates"""
+        tickers: List[str] = []
+        if self.ticker_activity_repository is not None:
+            try:
+                traded_since = datetime.utcnow() - timedelta(hours=self.trade_lookback_hours)
+                tickers = await self.ticker_activity_repository.find_hot_tickers(traded_since, self.max_tickers)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Prefetch could not load hot tickers from the database: {str(e)}")
+        return list(dict.fromkeys(tickers + self.demand.top(self.max_tickers)))[:self.max_tickers]
+
+    async def run_once(self) -> int:
+        """Run one prefetch cycle; returns the number of tickers refreshed"""
+        price_service = self.price_service_factory()
+        hot = await self.hot_set()
+        self.demand.decay()
+
+        due = []
+        refresh_after = price_service.soft_ttl - self.lead_seconds
+        for ticker in hot:
+            age = await price_service.cached_age(ticker)
+            if age is None or age >= refresh_after:
+                due.append((ticker, age))
+
+        # Uncached tickers first, then the ones closest to going stale
+        due.sort(key=lambda item: float("inf") if item[1] is None else item[1], reverse=True)
+        tickers = [ticker for ticker, _ in due]
+        batches = [tickers[i:i + self.batch_size] for i in range(0, len(tickers), self.batch_size)]
+
+        refreshed = 0
+        for batch in batches[:self.budget_requests]:
+            try:
+                refreshed += len(await price_service.refresh_prices(batch))
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Prefetch batch failed for {batch}: {str(e)}")
+
+        skipped = sum(len(batch) for batch in batches[self.budget_requests:])
+        self.cycles += 1
+        self.hot_tickers = len(hot)
+        self.refreshed += refreshed
+        self.over_budget += skipped
+        logger.info(f"Prefetch cycle: {len(hot)} hot, {len(due)} due, {refreshed} refreshed, {skipped} over budget")
+        return refreshed
+
+    def start(self, interval_seconds: float = 30):
+        """Run a cycle on the running loop every interval_seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_periodically(interval_seconds))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_periodically(self, interval_seconds: float):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Prefetch cycle failed: {str(e)}")
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "cycles": self.cycles,
+            "hot_tickers": self.hot_tickers,
+            "refreshed": self.refreshed,
+            "over_budget": self.over_budget,
+            "errors": self.errors
+        }
@@ -1,33 +1,83 @@
+import asyncio
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional, Set
 from src.application.ports.cache import Cache
 from src.application.ports.price_provider import PriceProvider
+from src.application.services.single_flight import SingleFlight
+from src.application.services.ticker_demand import TickerDemand
 from src.domain.entities.stock_price import StockPrice
 from datetime import datetime
 from src.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Shared across PriceService instances, which are built per request
+price_fetches = SingleFlight()
+
+# Which tickers callers ask for, read by the prefetch scheduler
+price_demand = TickerDemand()
+
+# Strong references to background revalidations so they are not garbage collected
+_background_refreshes: Set[asyncio.Task] = set()
+
 
 class PriceService:
-    def __init__(self, price_provider: PriceProvider, cache: Cache):
+    """Cached price lookups.
+
+    Prices younger than soft_ttl are fresh. With hard_ttl > soft_ttl, a price
+    between the two is served immediately marked stale while one background
+    refresh runs (stale-while-revalidate); only past hard_ttl does the caller
+    wait for upstream. hard_ttl defaults to soft_ttl, which disables the mode.
+    """
+
+    def __init__(
+        self,
+        price_provider: PriceProvider,
+        cache: Cache,
+        single_flight: Optional[SingleFlight] = None,
+        soft_ttl: int = 180,
+        hard_ttl: Optional[int] = None,
+        demand: Optional[TickerDemand] = None
+    ):
         self.price_provider = price_provider
         self.cache = cache
-        self.cache_ttl = 180
+        self.single_flight = single_flight or price_fetches
+        self.demand = demand if demand is not None else price_demand
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl or soft_ttl, soft_ttl)
+
+    @property
+    def cache_ttl(self) -> int:
+        return self.hard_ttl
+
+    def _from_cache(self, cached_price: dict) -> StockPrice:
+        stock_price = StockPrice(**cached_price)
+        age = (datetime.now() - stock_price.timestamp).total_seconds()
+        stock_price.stale = age >= self.soft_ttl
+        return stock_price
 
     async def get_current_price(self, ticker: str) -> Optional[StockPrice]:
-        logger.info(f"Fetching price for ticker: {ticker}")
-        
+        logger.info("Fetching price for ticker: %s", ticker)
+        self.demand.record(ticker)
+
         cache_key = f"price:{ticker}"
-        
+
         cached_price = await self.cache.get(cache_key)
         if cached_price:
-            logger.info(f"Price found in cache for {ticker}: {cached_price['price']}")
-            return StockPrice(**cached_price)
+            stock_price = self._from_cache(cached_price)
+            if stock_price.stale:
+                logger.info("Serving stale price for %s: %s, revalidating in background", ticker, stock_price.price)
+                self.single_flight.start(cache_key, lambda: self._fetch_and_cache(ticker, cache_key))
+            else:
+                logger.info("Price found in cache for %s: %s", ticker, stock_price.price)
+            return stock_price
 
-        logger.info(f"Cache miss for {ticker}, fetching from external provider")
+        logger.info("Cache miss for %s, fetching from external provider", ticker)
+        return await self.single_flight.do(cache_key, lambda: self._fetch_and_cache(ticker, cache_key))
+
+    async def _fetch_and_cache(self, ticker: str, cache_key: str) -> Optional[StockPrice]:
         result = await self.price_provider.get_price(ticker)
-        
+
         if result:
             price, source = result
             stock_price = StockPrice(
@@ -36,9 +86,85 @@ class PriceService:
                 source=source,
                 timestamp=datetime.now()
             )
-            await self.cache.set(cache_key, stock_price.model_dump(), self.cache_ttl)
-            logger.info(f"Price cached for {ticker}: {price} from {source} (TTL: {self.cache_ttl}s)")
+            await self.cache.set(cache_key, stock_price.model_dump(exclude={"stale"}), self.cache_ttl)
+            logger.info("Price cached for %s: %s from %s (TTL: %ss/%ss)", ticker, price, source, self.soft_ttl, self.hard_ttl)
             return stock_price
-        
-        logger.warning(f"Unable to fetch price for ticker: {ticker}")
-        return None
\ No newline at end of file
+
+        logger.warning("Unable to fetch price for ticker: %s", ticker)
+        return None
+
+    async def get_current_prices(self, tickers: List[str]) -> Dict[str, StockPrice]:
+        """Price several tickers; cached ones come from the cache and all misses go upstream in one batch"""
+        logger.info("Fetching prices for %s tickers", len(tickers))
+
+        prices: Dict[str, StockPrice] = {}
+        misses: List[str] = []
+        stale: List[str] = []
+        for ticker in tickers:
+            self.demand.record(ticker)
+            cached_price = await self.cache.get(f"price:{ticker}")
+            if cached_price:
+                stock_price = self._from_cache(cached_price)
+                prices[ticker] = stock_price
+                if stock_price.stale:
+                    stale.append(ticker)
+            else:
+                misses.append(ticker)
+
+        if stale:
+            logger.info("Serving stale prices for %s, revalidating in background", stale)
+            task = asyncio.ensure_future(self._revalidate_many(stale))
+            _background_refreshes.add(task)
+            task.add_done_callback(_background_refreshes.discard)
+
+        if misses:
+            logger.info("Cache miss for %s, fetching from external provider in one batch", misses)
+            fetched = await self._fetch_many(misses)
+            for ticker in misses:
+                stock_price = fetched.get(f"price:{ticker}")
+                if stock_price:
+                    prices[ticker] = stock_price
+
+        return prices
+
+    async def cached_age(self, ticker: str) -> Optional[float]:
+        """Seconds since the cached price was fetched, or None if it is not cached; not counted as a lookup"""
+        cached_price = await self.cache.peek(f"price:{ticker}")
+        if not cached_price:
+            return None
+        return (datetime.now() - StockPrice(**cached_price).timestamp).total_seconds()
+
+    async def refresh_prices(self, tickers: List[str]) -> Dict[str, StockPrice]:
+        """Fetch tickers upstream in one batch and cache them, whatever their cached age"""
+        fetched = await self._fetch_many(tickers)
+        return {ticker: fetched[f"price:{ticker}"] for ticker in tickers if fetched.get(f"price:{ticker}")}
+
+    async def _fetch_many(self, tickers: List[str]) -> Dict[str, Optional[StockPrice]]:
+        return await self.single_flight.do_many(
+            [f"price:{ticker}" for ticker in tickers],
+            self._fetch_and_cache_many
+        )
+
+    async def _revalidate_many(self, tickers: List[str]) -> None:
+        try:
+            await self._fetch_many(tickers)
+        except Exception as e:
+            logger.warning("Background revalidation failed for %s: %s", tickers, e)
+
+    async def _fetch_and_cache_many(self, cache_keys: List[str]) -> Dict[str, StockPrice]:
+        tickers = [cache_key[len("price:"):] for cache_key in cache_keys]
+        results = await self.price_provider.get_prices(tickers)
+
+        fetched: Dict[str, StockPrice] = {}
+        now = datetime.now()
+        for ticker, (price, source) in results.items():
+            stock_price = StockPrice(ticker=ticker, price=price, source=source, timestamp=now)
+            cache_key = f"price:{ticker}"
+            await self.cache.set(cache_key, stock_price.model_dump(exclude={"stale"}), self.cache_ttl)
+            fetched[cache_key] = stock_price
+
+        logger.info("Prices cached for %s of %s tickers (TTL: %ss/%ss)", len(fetched), len(tickers), self.soft_ttl, self.hard_ttl)
+        return fetched
+
+    def fetch_stats(self) -> dict:
+        return self.single_flight.stats()
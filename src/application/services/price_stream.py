@@ -0,0 +1,131 @@
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from src.application.services.price_service import PriceService
+from src.domain.entities.stock_price import StockPrice
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class PriceSubscription:
+    """One client's view of the stream.
+
+    Only the latest undelivered price per ticker is kept, so a consumer that
+    falls behind skips intermediate prices instead of growing a queue or
+    holding up the poller.
+    """
+
+    def __init__(self, tickers: List[str]):
+        self.tickers = tickers
+        self._pending: Dict[str, StockPrice] = {}
+        self._ready = asyncio.Event()
+        self.delivered = 0
+        self.conflated = 0
+
+    def offer(self, stock_price: StockPrice) -> None:
+        if stock_price.ticker in self._pending:
+            self.conflated += 1
+        self._pending[stock_price.ticker] = stock_price
+        self._ready.set()
+
+    async def next(self, timeout: Optional[float] = None) -> List[StockPrice]:
+        """Prices that changed since the last call; empty if none arrived within timeout"""
+        if not self._pending:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        updates = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+        self.delivered += len(updates)
+        return updates
+
+
+class PriceStreamHub:
+    """Fans price updates out to subscribers with one poller per distinct ticker.
+
+    A poller starts with the first subscriber to a ticker and stops with the
+    last one. It reads through PriceService, so it shares the price cache and
+    single-flight with the request path, and upstream load grows with the
+    number of tickers rather than the number of clients.
+    """
+
+    def __init__(self, price_service_factory: Callable[[], PriceService], interval_seconds: float = 5.0):
+        self.price_service_factory = price_service_factory
+        self.interval_seconds = interval_seconds
+        self._subscribers: Dict[str, Set[PriceSubscription]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._latest: Dict[str, StockPrice] = {}
+        self.polls = 0
+        self.poll_errors = 0
+        self.published = 0
+
+    def subscribe(self, tickers: Iterable[str]) -> PriceSubscription:
+        subscription = PriceSubscription(list(dict.fromkeys(tickers)))
+        for ticker in subscription.tickers:
+            self._subscribers.setdefault(ticker, set()).add(subscription)
+            # New subscribers start from the last known price instead of waiting a full interval
+            if ticker in self._latest:
+                subscription.offer(self._latest[ticker])
+            if ticker not in self._pollers:
+                self._pollers[ticker] = asyncio.ensure_future(self._poll(ticker))
+        return subscription
+
+    def unsubscribe(self, subscription: PriceSubscription) -> None:
+        for ticker in subscription.tickers:
+            subscribers = self._subscribers.get(ticker)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[ticker]
+                self._latest.pop(ticker, None)
+                poller = self._pollers.pop(ticker, None)
+                if poller:
+                    poller.cancel()
+
+    async def _poll(self, ticker: str) -> None:
+        price_service = self.price_service_factory()
+        while True:
+            try:
+                stock_price = await price_service.get_current_price(ticker)
+                self.polls += 1
+            except Exception as e:
+                self.poll_errors += 1
+                logger.warning(f"Price stream poll failed for {ticker}: {str(e)}")
+                stock_price = None
+
+            if stock_price and self._is_new(stock_price):
+                self._latest[ticker] = stock_price
+                self.published += 1
+                for subscription in self._subscribers.get(ticker, ()):
+                    subscription.offer(stock_price)
+
+            await asyncio.sleep(self.interval_seconds)
+
+    def _is_new(self, stock_price: StockPrice) -> bool:
+        latest = self._latest.get(stock_price.ticker)
+        return latest is None or (latest.price, latest.timestamp) != (stock_price.price, stock_price.timestamp)
+
+    async def stop(self) -> None:
+        """Cancel every poller, e.g. on application shutdown"""
+        pollers = list(self._pollers.values())
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+        self._pollers.clear()
+        self._subscribers.clear()
+        self._latest.clear()
+
+    def stats(self) -> dict:
+        subscriptions = set().union(*self._subscribers.values()) if self._subscribers else set()
+        return {
+            "tickers": len(self._pollers),
+            "subscriptions": len(subscriptions),
+            "polls": self.polls,
+            "poll_errors": self.poll_errors,
+            "published": self.published,
+            "conflated": sum(subscription.conflated for subscription in subscriptions)
+        }
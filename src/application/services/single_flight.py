@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight task.
+
+    The first caller for a key starts the work; every caller that arrives while it
+    is still running awaits the same task. The task is shielded so a cancelled
+    waiter does not cancel the fetch for everyone else.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.originated = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.start(key, fn))
+
+    def start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start fn for key unless it is already in flight, without waiting for it"""
+        task = self._inflight.get(key)
+        if task is None:
+            self.originated += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.coalesced += 1
+        return task
+
+    async def do_many(self, keys: List[str], fn: Callable[[List[str]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Like do(), but keys not already in flight are fetched together by one call.
+
+        fn receives the keys that need fetching and returns a dict keyed by them;
+        keys it leaves out resolve to None. Single-key callers arriving meanwhile
+        coalesce onto the batch.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        fresh: List[str] = []
+        for key in keys:
+            task = self._inflight.get(key)
+            if task is None:
+                fresh.append(key)
+            else:
+                self.coalesced += 1
+                tasks[key] = task
+
+        if fresh:
+            self.originated += len(fresh)
+            batch = asyncio.ensure_future(fn(fresh))
+            for key in fresh:
+                task = asyncio.ensure_future(self._pick(batch, key))
+                self._inflight[key] = task
+                task.add_done_callback(lambda t, key=key: self._forget(key, t))
+                tasks[key] = task
+
+        results = await asyncio.gather(*(asyncio.shield(task) for task in tasks.values()))
+        return dict(zip(tasks.keys(), results))
+
+    @staticmethod
+    async def _pick(batch: asyncio.Future, key: str) -> Any:
+        return (await batch).get(key)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the outcome as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> dict:
+        return {
+            "originated": self.originated,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight()
+        }
@@ -0,0 +1,32 @@
+from collections import Counter
+from typing import List
+
+
+class TickerDemand:
+    """Decaying per-ticker request counts.
+
+    Every price request adds one; decay() halves all counts, so a ticker that
+    stops being asked for drops out after a few periods.
+    """
+
+    def __init__(self, max_tickers: int = 10000):
+        self.max_tickers = max_tickers
+        self._counts: Counter = Counter()
+
+    def record(self, ticker: str) -> None:
+        if ticker in self._counts or len(self._counts) < self.max_tickers:
+            self._counts[ticker] += 1
+
+    def top(self, n: int) -> List[str]:
+        return [ticker for ticker, _ in self._counts.most_common(n)]
+
+    def decay(self) -> None:
+        for ticker in list(self._counts):
+            count = self._counts[ticker] // 2
+            if count:
+                self._counts[ticker] = count
+            else:
+                del self._counts[ticker]
+
+    def __len__(self) -> int:
+        return len(self._counts)
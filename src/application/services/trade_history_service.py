@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from src.domain.entities.trade import Trade
+from src.domain.repositories.trade_history_repository import TradeHistoryRepository, TradeKey
+
+
+class TradeHistoryService:
+    def __init__(self, trade_history_repository: TradeHistoryRepository):
+        self.trade_history_repository = trade_history_repository
+
+    async def get_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Tuple[List[Trade], Optional[TradeKey]]:
+        """Return one page and the key to continue after, or None on the last page"""
+        # One extra row tells whether another page exists without a COUNT
+        trades = await self.trade_history_repository.find_page(user_id, limit + 1, after, ticker, since, until)
+        if len(trades) <= limit:
+            return trades, None
+        trades = trades[:limit]
+        last = trades[-1]
+        return trades, (last.created_at, last.id)
+
+    def stream(
+        self,
+        user_id: str,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[Trade]:
+        return self.trade_history_repository.iter_trades(user_id, after, ticker, since, until)
\ No newline at end of file
@@ -1,11 +1,18 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Dict, List, Optional
 from fastapi import HTTPException, status
 from src.application.services.balance_service import BalanceService
 from src.application.services.price_service import PriceService
-from src.domain.entities.trade import Trade, TradeType
+from src.domain.entities.trade import Trade, TradeOrder, TradeOrderResult, TradeType
 from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.stock_price import StockPrice
 from src.domain.repositories.stock_balance_repository import StockBalanceRepository
+from src.domain.repositories.trade_execution_repository import (
+    InsufficientFundsError,
+    InsufficientStockError,
+    TradeExecutionRepository
+)
 from src.domain.repositories.trade_repository import TradeRepository
 
 
@@ -15,12 +22,14 @@ class TradeService:
         trade_repository: TradeRepository,
         stock_balance_repository: StockBalanceRepository,
         balance_service: BalanceService,
-        price_service: PriceService
+        price_service: PriceService,
+        trade_execution_repository: Optional[TradeExecutionRepository] = None
     ):
         self.trade_repository = trade_repository
         self.stock_balance_repository = stock_balance_repository
         self.balance_service = balance_service
         self.price_service = price_service
+        self.trade_execution_repository = trade_execution_repository
 
     async def execute_trade(
         self,
@@ -31,6 +40,8 @@ class TradeService:
         price: Decimal
     ) -> Trade:
         current_price_data = await self.price_service.get_current_price(ticker)
+        if current_price_data and current_price_data.stale:
+            current_price_data = (await self._fresh_prices([ticker])).get(ticker)
         if not current_price_data:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,6 +64,9 @@ class TradeService:
 
         total_amount = quantity * price
 
+        if self.trade_execution_repository:
+            return await self._execute_atomically(user_id, ticker, trade_type, quantity, price, total_amount)
+
         if trade_type == TradeType.BUY:
             await self._execute_buy(user_id, ticker, quantity, price, total_amount)
         else:
@@ -70,6 +84,106 @@ class TradeService:
 
         return await self.trade_repository.create(trade)
 
+    async def execute_batch(self, user_id: str, orders: List[TradeOrder], all_or_nothing: bool = True) -> List[TradeOrderResult]:
+        """Validate a basket against one price lookup and execute it in a single transaction.
+
+        Returns one result per order, in order. With all_or_nothing a single
+        rejected order leaves every order unexecuted; otherwise the valid
+        orders still run.
+        """
+        if self.trade_execution_repository is None:
+            raise RuntimeError("TradeService was built without a trade execution repository")
+
+        tickers = list(dict.fromkeys(order.ticker for order in orders))
+        current_prices = await self.price_service.get_current_prices(tickers)
+        stale = [ticker for ticker, stock_price in current_prices.items() if stock_price.stale]
+        if stale:
+            refreshed = await self._fresh_prices(stale)
+            for ticker in stale:
+                current_prices.pop(ticker)
+            current_prices.update(refreshed)
+
+        errors: List[Optional[str]] = []
+        for order in orders:
+            current_price_data = current_prices.get(order.ticker)
+            if not current_price_data:
+                errors.append("Unable to get current price for ticker")
+            elif order.trade_type == TradeType.BUY and order.price < current_price_data.price:
+                errors.append(f"Buy price must be >= current market price ({current_price_data.price})")
+            elif order.trade_type == TradeType.SELL and order.price > current_price_data.price:
+                errors.append(f"Sell price must be <= current market price ({current_price_data.price})")
+            else:
+                errors.append(None)
+
+        trades: List[Optional[Trade]] = [None] * len(orders)
+        if not (all_or_nothing and any(errors)):
+            valid = [i for i, error in enumerate(errors) if error is None]
+            executed = await self.trade_execution_repository.execute_batch(
+                [
+                    Trade(
+                        user_id=user_id,
+                        ticker=orders[i].ticker,
+                        trade_type=orders[i].trade_type,
+                        quantity=orders[i].quantity,
+                        price=orders[i].price,
+                        total_amount=orders[i].quantity * orders[i].price,
+                        created_at=datetime.now()
+                    )
+                    for i in valid
+                ],
+                all_or_nothing
+            )
+            for i, result in zip(valid, executed):
+                if isinstance(result, Trade):
+                    trades[i] = result
+                else:
+                    errors[i] = str(result)
+
+        if all_or_nothing and any(errors):
+            return [
+                TradeOrderResult(order=order, error=error or "Not executed: another order in the batch was rejected")
+                for order, error in zip(orders, errors)
+            ]
+        return [
+            TradeOrderResult(order=order, trade=trade, error=error)
+            for order, trade, error in zip(orders, trades, errors)
+        ]
+
+    async def _fresh_prices(self, tickers: List[str]) -> Dict[str, StockPrice]:
+        # Stale-while-revalidate is for reads; orders are never validated against a stale price
+        return await self.price_service.refresh_prices(tickers)
+
+    async def _execute_atomically(
+        self,
+        user_id: str,
+        ticker: str,
+        trade_type: TradeType,
+        quantity: Decimal,
+        price: Decimal,
+        total_amount: Decimal
+    ) -> Trade:
+        trade = Trade(
+            user_id=user_id,
+            ticker=ticker,
+            trade_type=trade_type,
+            quantity=quantity,
+            price=price,
+            total_amount=total_amount,
+            created_at=datetime.now()
+        )
+        try:
+            return await self.trade_execution_repository.execute_trade(trade)
+        except InsufficientFundsError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Insufficient funds"
+            )
+        except InsufficientStockError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Insufficient stock quantity"
+            )
+
     async def _execute_buy(self, user_id: str, ticker: str, quantity: Decimal, price: Decimal, total_amount: Decimal):
         balance = await self.balance_service.get_balance(user_id)
         if not balance or balance.cash_balance < total_amount:
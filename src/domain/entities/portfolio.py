@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel
+from src.domain.entities.stock_balance import StockBalance
+
+
+class Portfolio(BaseModel):
+    user_id: str
+    cash_balance: Decimal
+    holdings: List[StockBalance]
+    total_invested_value: Decimal
+
+
+class HoldingValuation(BaseModel):
+    holding: StockBalance
+    cost_basis: Decimal
+    market_price: Optional[Decimal] = None
+    market_value: Optional[Decimal] = None
+    unrealized_pnl: Optional[Decimal] = None
+    unrealized_pnl_percent: Optional[Decimal] = None
+    price_source: Optional[str] = None
+    quote_age_seconds: Optional[float] = None
+    price_stale: Optional[bool] = None
+
+
+class PortfolioValuation(BaseModel):
+    portfolio: Portfolio
+    holdings: List[HoldingValuation]
+    total_market_value: Decimal
+    total_unrealized_pnl: Decimal
+    unpriced_tickers: List[str]
\ No newline at end of file
@@ -8,4 +8,5 @@ class StockPrice(BaseModel):
     ticker: str
     price: Decimal
     source: str
-    timestamp: datetime
\ No newline at end of file
+    timestamp: datetime
+    stale: bool = False
\ No newline at end of file
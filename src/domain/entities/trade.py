@@ -18,4 +18,17 @@ class Trade(BaseModel):
     quantity: Decimal
     price: Decimal
     total_amount: Decimal
-    created_at: Optional[datetime] = None
\ No newline at end of file
+    created_at: Optional[datetime] = None
+
+
+class TradeOrder(BaseModel):
+    ticker: str
+    trade_type: TradeType
+    quantity: Decimal
+    price: Decimal
+
+
+class TradeOrderResult(BaseModel):
+    order: TradeOrder
+    trade: Optional[Trade] = None
+    error: Optional[str] = None
\ No newline at end of file
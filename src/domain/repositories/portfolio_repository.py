@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from src.domain.entities.portfolio import Portfolio
+
+
+class PortfolioRepository(ABC):
+    @abstractmethod
+    async def find_by_user_id(self, user_id: str) -> Portfolio:
+        """Cash, holdings and invested value read together in one consistent snapshot"""
+        pass
\ No newline at end of file
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+
+
+class TickerActivityRepository(ABC):
+    @abstractmethod
+    async def find_hot_tickers(self, traded_since: datetime, limit: int) -> List[str]:
+        """Held tickers and tickers traded since traded_since, most active first"""
+        pass
\ No newline at end of file
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import List, Union
+from src.domain.entities.trade import Trade
+
+
+class InsufficientFundsError(ValueError):
+    pass
+
+
+class InsufficientStockError(ValueError):
+    pass
+
+
+class TradeExecutionRepository(ABC):
+    @abstractmethod
+    async def execute_trade(self, trade: Trade) -> Trade:
+        """Apply the cash movement, the position change and the trade record atomically.
+
+        Raises InsufficientFundsError or InsufficientStockError without
+        changing anything when the trade cannot be covered.
+        """
+        pass
+
+    @abstractmethod
+    async def execute_batch(self, trades: List[Trade], all_or_nothing: bool = True) -> List[Union[Trade, ValueError]]:
+        """Execute trades in order against one account in a single transaction.
+
+        Each result is the executed Trade or the InsufficientFundsError /
+        InsufficientStockError that rejected it; later orders see the effect
+        of earlier ones. With all_or_nothing, a single rejection rolls the
+        whole batch back and the Trade results are only what would have run.
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from src.domain.entities.trade import Trade
+
+
+# (created_at, id) of the last trade already seen
+TradeKey = Tuple[datetime, str]
+
+
+class TradeHistoryRepository(ABC):
+    """Trade history in (created_at DESC, id) order, read by keyset rather than offset"""
+
+    @abstractmethod
+    async def find_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Trade]:
+        pass
+
+    @abstractmethod
+    def iter_trades(
+        self,
+        user_id: str,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[Trade]:
+        """Yield every matching trade without holding the history in memory"""
+        pass
\ No newline at end of file
@@ -1,11 +1,18 @@
+import asyncio
 import httpx
 from decimal import Decimal
-from typing import Optional, Tuple
-from src.application.ports.price_provider import PriceProvider
+from typing import Dict, List, Optional, Tuple
+from src.application.ports.price_provider import PriceProvider, PriceProviderUnavailable
+from src.infrastructure.config.http_client import http_clients
 from src.infrastructure.config.settings import settings
 
 
 class AlphavantageProvider(PriceProvider):
+    client_name = "alphavantage"
+    # Alphavantage has no multi-symbol quote endpoint, so batches are fanned out
+    # over the pooled client with bounded concurrency
+    max_concurrency = 5
+
     def __init__(self):
         self.base_url = "https://www.alphavantage.co/query"
         self.api_key = settings.alphavantage_api_key
@@ -15,20 +22,51 @@ class AlphavantageProvider(PriceProvider):
             if not self.api_key:
                 return None
                 
-            async with httpx.AsyncClient() as client:
-                params = {
-                    "function": "GLOBAL_QUOTE",
-                    "symbol": ticker,
-                    "apikey": self.api_key
-                }
-                response = await client.get(self.base_url, params=params, timeout=10.0, headers={"User-Agent": "Mozilla/5.0"})
-                response.raise_for_status()
-                
-                data = response.json()
-                price = data.get("Global Quote", {}).get("05. price")
-                
-                if price is not None:
-                    return (Decimal(str(price)), "alphavantage")
-                return None
+            client = http_clients.get_client(self.client_name)
+            params = {
+                "function": "GLOBAL_QUOTE",
+                "symbol": ticker,
+                "apikey": self.api_key
+            }
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
+            
+            data = response.json()
+            # Rate limiting is reported with HTTP 200 and a "Note"/"Information" message
+            if "Note" in data or "Information" in data:
+                raise PriceProviderUnavailable("Alphavantage rate limit reached")
+            price = data.get("Global Quote", {}).get("05. price")
+            
+            if price is not None:
+                return (Decimal(str(price)), "alphavantage")
+            return None
+        except PriceProviderUnavailable:
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429 or e.response.status_code >= 500:
+                raise PriceProviderUnavailable(f"Alphavantage HTTP {e.response.status_code}") from e
+            return None
+        except (httpx.TimeoutException, httpx.TransportError) as e:
+            raise PriceProviderUnavailable(f"Alphavantage unreachable: {str(e)}") from e
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+    async def get_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        if not self.api_key:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(ticker: str) -> Optional[Tuple[Decimal, str]]:
+            async with semaphore:
+                return await self.get_price(ticker)
+
+        results = await asyncio.gather(*(fetch(ticker) for ticker in tickers), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+        return {
+            ticker: result
+            for ticker, result in zip(tickers, results)
+            if result is not None and not isinstance(result, BaseException)
+        }
\ No newline at end of file
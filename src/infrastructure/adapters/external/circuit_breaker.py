@@ -0,0 +1,152 @@
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for one upstream.
+
+    closed    -> calls go through; the last `window` outcomes from the past
+                 `window_seconds` are tracked.
+    open      -> calls are skipped until `cooldown_seconds` have passed. Entered
+                 when the error rate or the slow-call rate crosses its threshold
+                 over at least `min_calls` outcomes.
+    half_open -> one probe call is let through; success closes the breaker,
+                 failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window: int = 20,
+        window_seconds: float = 60.0,
+        min_calls: int = 5,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate_threshold: float = 0.8,
+        cooldown_seconds: float = 30.0
+    ):
+        self.window = window
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = self.CLOSED
+        # (recorded_at, failed, slow) per call
+        self._outcomes: Deque[Tuple[float, bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+
+    def is_available(self) -> bool:
+        """Whether a call would be let through right now, without claiming it"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            return time.monotonic() - self._opened_at >= self.cooldown_seconds
+        return not self._probe_in_flight
+
+    def try_acquire(self) -> bool:
+        """Claim permission for one call; in half-open only a single probe is allowed"""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def release(self) -> None:
+        """Give back a claimed call that never completed (e.g. a cancelled hedge)"""
+        self._probe_in_flight = False
+
+    def record_success(self, latency_seconds: float) -> None:
+        slow = latency_seconds >= self.slow_call_seconds
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            if slow:
+                self._open()
+            else:
+                self._close()
+            return
+        self._outcomes.append((time.monotonic(), False, slow))
+        self._evaluate()
+
+    def record_failure(self, latency_seconds: float) -> None:
+        if self.state == self.HALF_OPEN:
+            self._probe_in_flight = False
+            self._open()
+            return
+        self._outcomes.append((time.monotonic(), True, latency_seconds >= self.slow_call_seconds))
+        self._evaluate()
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def _evaluate(self) -> None:
+        self._prune()
+        if self.state != self.CLOSED or len(self._outcomes) < self.min_calls:
+            return
+        if self.failure_rate() >= self.failure_rate_threshold or self.slow_call_rate() >= self.slow_call_rate_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        self.state = self.CLOSED
+        self._outcomes.clear()
+
+    def failure_rate(self) -> float:
+        self._prune()
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, failed, _ in self._outcomes if failed) / len(self._outcomes)
+
+    def slow_call_rate(self) -> float:
+        self._prune()
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, _, slow in self._outcomes if slow) / len(self._outcomes)
+
+    def health_score(self) -> float:
+        """1.0 for a healthy upstream down to 0.0 for an open breaker.
+
+        Rates are smoothed with min_calls imaginary good calls so a single
+        failure only demotes a provider, and rounded to one decimal so small
+        differences do not reshuffle the chain. Old outcomes age out of the
+        window, which lets a demoted provider win its place back.
+        """
+        if self.state == self.OPEN:
+            return 0.0
+        self._prune()
+        calls = len(self._outcomes) + self.min_calls
+        failures = sum(1 for _, failed, _ in self._outcomes if failed)
+        slow = sum(1 for _, _, is_slow in self._outcomes if is_slow)
+        score = (1 - failures / calls) * (1 - 0.5 * slow / calls)
+        if self.state == self.HALF_OPEN:
+            score *= 0.5
+        return round(score, 1)
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "health_score": self.health_score(),
+            "failure_rate": round(self.failure_rate(), 4),
+            "slow_call_rate": round(self.slow_call_rate(), 4),
+            "calls_in_window": len(self._outcomes),
+            "times_opened": self.times_opened
+        }
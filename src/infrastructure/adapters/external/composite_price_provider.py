@@ -1,37 +1,226 @@
+import asyncio
+import time
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import httpx
 from src.application.ports.price_provider import PriceProvider
 from src.infrastructure.adapters.external.yahoo_price_provider import YahooPriceProvider
 from src.infrastructure.adapters.external.alphavantage_price_provider import AlphavantageProvider
+from src.infrastructure.adapters.external.circuit_breaker import CircuitBreaker
+from src.infrastructure.adapters.external.latency_histogram import LatencyHistogram
+from src.infrastructure.config.metrics import price_provider_requests, price_provider_seconds
+from src.infrastructure.config.settings import settings
 from src.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Shared across CompositePriceProvider instances, which are built per request
+latency_histograms: Dict[str, LatencyHistogram] = {}
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_latency_histogram(provider_name: str) -> LatencyHistogram:
+    histogram = latency_histograms.get(provider_name)
+    if histogram is None:
+        histogram = latency_histograms[provider_name] = LatencyHistogram()
+    return histogram
+
+
+def get_circuit_breaker(provider_name: str) -> CircuitBreaker:
+    breaker = circuit_breakers.get(provider_name)
+    if breaker is None:
+        breaker = circuit_breakers[provider_name] = CircuitBreaker(
+            window=settings.price_breaker_window,
+            window_seconds=settings.price_breaker_window_seconds,
+            min_calls=settings.price_breaker_min_calls,
+            failure_rate_threshold=settings.price_breaker_failure_rate,
+            slow_call_seconds=settings.price_breaker_slow_call_seconds,
+            slow_call_rate_threshold=settings.price_breaker_slow_call_rate,
+            cooldown_seconds=settings.price_breaker_cooldown_seconds
+        )
+    return breaker
+
+
+def failure_outcome(error: Exception) -> str:
+    """Outcome label for a failed call: timeout, also when wrapped in another error, or failure"""
+    cause = error.__cause__ or error
+    return "timeout" if isinstance(cause, (TimeoutError, httpx.TimeoutException)) else "failure"
+
+
+def provider_health() -> Dict[str, dict]:
+    """Breaker state and latency per provider seen so far"""
+    names = sorted(set(circuit_breakers) | set(latency_histograms))
+    return {
+        name: {
+            "breaker": get_circuit_breaker(name).snapshot(),
+            "latency": get_latency_histogram(name).snapshot()
+        }
+        for name in names
+    }
+
 
 class CompositePriceProvider(PriceProvider):
-    def __init__(self):
-        self.providers: List[PriceProvider] = [
+    """Fallback chain over several price providers.
+
+    "sequential" tries each provider only after the previous one failed.
+    "hedged" also starts the next provider when the current one has not
+    answered within its observed p95 latency; the first price wins and the
+    other calls are cancelled.
+
+    Every provider sits behind a circuit breaker: providers with an open
+    breaker are skipped, and the rest are ordered by health score.
+    """
+
+    def __init__(self, providers: Optional[List[PriceProvider]] = None, strategy: Optional[str] = None):
+        self.providers: List[PriceProvider] = providers if providers is not None else [
             YahooPriceProvider(),
             AlphavantageProvider()
         ]
+        self.strategy = strategy or settings.price_fetch_strategy
+
+    def hedge_delay(self, provider: PriceProvider) -> float:
+        """Seconds to wait on provider before starting the next one"""
+        histogram = get_latency_histogram(provider.__class__.__name__)
+        p95 = histogram.quantile(0.95)
+        if p95 is None or histogram.total < settings.price_hedge_min_samples:
+            delay_ms = settings.price_hedge_default_delay_ms
+        else:
+            delay_ms = p95 * 1000
+        return min(max(delay_ms, settings.price_hedge_min_delay_ms), settings.price_hedge_max_delay_ms) / 1000
+
+    def _available_providers(self) -> List[PriceProvider]:
+        available = [
+            provider for provider in self.providers
+            if get_circuit_breaker(provider.__class__.__name__).is_available()
+        ]
+        # Stable sort keeps the configured order between equally healthy providers
+        return sorted(available, key=lambda p: -get_circuit_breaker(p.__class__.__name__).health_score())
+
+    async def _call(self, provider: PriceProvider, fn: Callable[[], Awaitable[Any]], record_latency: bool = True) -> Any:
+        """Run one provider call through its breaker; failures and skips return None"""
+        provider_name = provider.__class__.__name__
+        breaker = get_circuit_breaker(provider_name)
+        if not breaker.try_acquire():
+            price_provider_requests.inc((provider_name, "skipped"))
+            logger.info("Skipping provider %s: circuit %s", provider_name, breaker.state)
+            return None
+
+        start = time.perf_counter()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Cancelled hedge losers are not recorded; their latency is unknown
+            breaker.release()
+            raise
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            breaker.record_failure(elapsed)
+            if record_latency:
+                get_latency_histogram(provider_name).record(elapsed)
+            labels = (provider_name, failure_outcome(e))
+            price_provider_requests.inc(labels)
+            price_provider_seconds.observe(labels, elapsed)
+            logger.warning("Provider %s failed: %s (circuit %s)", provider_name, e, breaker.state)
+            return None
+
+        elapsed = time.perf_counter() - start
+        breaker.record_success(elapsed)
+        if record_latency:
+            get_latency_histogram(provider_name).record(elapsed)
+        labels = (provider_name, "success")
+        price_provider_requests.inc(labels)
+        price_provider_seconds.observe(labels, elapsed)
+        return result
 
     async def get_price(self, ticker: str) -> Optional[Tuple[Decimal, str]]:
-        logger.info(f"Attempting to get price for {ticker} using fallback chain")
-        
-        for i, provider in enumerate(self.providers):
+        providers = self._available_providers()
+        if not providers:
+            logger.error("No price provider available for %s: all circuits open", ticker)
+            return None
+        if self.strategy == "hedged" and len(providers) > 1:
+            return await self._get_price_hedged(ticker, providers)
+        return await self._get_price_sequential(ticker, providers)
+
+    async def _get_price_sequential(self, ticker: str, providers: List[PriceProvider]) -> Optional[Tuple[Decimal, str]]:
+        logger.info("Attempting to get price for %s using fallback chain", ticker)
+
+        for i, provider in enumerate(providers):
             provider_name = provider.__class__.__name__
-            try:
-                logger.info(f"Trying provider {i+1}/{len(self.providers)}: {provider_name} for {ticker}")
-                result = await provider.get_price(ticker)
-                if result is not None:
-                    price, source = result
-                    logger.info(f"Price found for {ticker}: {price} (provider: {provider_name}, source: {source})")
-                    return result
-                else:
-                    logger.warning(f"Provider {provider_name} returned None for {ticker}")
-            except Exception as e:
-                logger.warning(f"Provider {provider_name} failed for {ticker}: {str(e)}")
-                continue
-        
-        logger.error(f"All providers failed to get price for {ticker}")
-        return None
\ No newline at end of file
+            logger.info("Trying provider %s/%s: %s for %s", i + 1, len(providers), provider_name, ticker)
+            result = await self._call(provider, lambda: provider.get_price(ticker))
+            if result is not None:
+                price, source = result
+                logger.info("Price found for %s: %s (provider: %s, source: %s)", ticker, price, provider_name, source)
+                return result
+            else:
+                logger.warning("Provider %s returned None for %s", provider_name, ticker)
+
+        logger.error("All providers failed to get price for %s", ticker)
+        return None
+
+    async def _get_price_hedged(self, ticker: str, providers: List[PriceProvider]) -> Optional[Tuple[Decimal, str]]:
+        logger.info("Attempting to get price for %s using hedged chain", ticker)
+
+        queue = list(providers)
+        pending: Dict[asyncio.Task, str] = {}
+        last_started: Optional[PriceProvider] = None
+
+        def start_next() -> None:
+            nonlocal last_started
+            provider = queue.pop(0)
+            last_started = provider
+            pending[asyncio.ensure_future(self._call(provider, lambda: provider.get_price(ticker)))] = provider.__class__.__name__
+
+        start_next()
+        try:
+            while pending:
+                timeout = self.hedge_delay(last_started) if queue else None
+                done, _ = await asyncio.wait(pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    logger.info("Hedging %s: %s slower than %.3fs, starting %s", ticker, pending[next(iter(pending))], timeout, queue[0].__class__.__name__)
+                    start_next()
+                    continue
+
+                for task in done:
+                    provider_name = pending.pop(task)
+                    result = task.result()
+                    if result is not None:
+                        price, source = result
+                        logger.info("Price found for %s: %s (provider: %s, source: %s)", ticker, price, provider_name, source)
+                        return result
+                    logger.warning("Provider %s returned None for %s", provider_name, ticker)
+
+                # A provider failed outright, so move on without waiting for the hedge delay
+                if queue:
+                    start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        logger.error("All providers failed to get price for %s", ticker)
+        return None
+
+    async def get_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        logger.info("Attempting to get %s prices using fallback chain", len(tickers))
+
+        prices: Dict[str, Tuple[Decimal, str]] = {}
+        remaining = list(tickers)
+
+        providers = self._available_providers()
+        for i, provider in enumerate(providers):
+            if not remaining:
+                break
+            provider_name = provider.__class__.__name__
+            logger.info("Trying provider %s/%s: %s for %s tickers", i + 1, len(providers), provider_name, len(remaining))
+            # Batch latency says little about single-quote latency, so keep it out of the hedge histogram
+            batch = list(remaining)
+            result = await self._call(provider, lambda: provider.get_prices(batch), record_latency=False)
+            prices.update(result or {})
+            remaining = [ticker for ticker in remaining if ticker not in prices]
+            if remaining:
+                logger.warning("Provider %s returned no price for %s", provider_name, remaining)
+
+        if remaining:
+            logger.error("All providers failed to get price for %s", remaining)
+        return prices
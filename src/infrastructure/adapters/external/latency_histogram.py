@@ -0,0 +1,49 @@
+import bisect
+from typing import List, Optional
+
+# Upper bounds in seconds, roughly log-spaced from 5 ms to 30 s
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.5,
+    0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 30.0
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with exponential decay.
+
+    Once max_samples observations accumulate, every bucket is halved, so the
+    quantiles follow recent behaviour instead of the whole process lifetime.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, max_samples: int = 1000):
+        self.buckets = tuple(buckets)
+        self.counts: List[float] = [0.0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.max_samples = max_samples
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += 1
+        if self.total >= self.max_samples:
+            self.counts = [count / 2 for count in self.counts]
+            self.total /= 2
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile, None if empty"""
+        if self.total <= 0:
+            return None
+        target = q * self.total
+        cumulative = 0.0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict:
+        return {
+            "samples": round(self.total),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99)
+        }
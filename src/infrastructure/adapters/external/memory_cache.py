@@ -1,28 +1,60 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 from src.application.ports.cache import Cache
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class MemoryCache(Cache):
-    def __init__(self):
-        self._cache: Dict[str, tuple[Any, datetime]] = {}
+    """In-process TTL cache bounded to max_entries with LRU eviction.
+
+    Expiry uses the monotonic clock, so wall-clock jumps cannot resurrect or
+    prematurely drop entries. Expired keys are dropped lazily on read and by a
+    background sweep started with start_expiry().
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self._lock = asyncio.Lock()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._expiry_task: Optional[asyncio.Task] = None
 
     async def get(self, key: str) -> Optional[Any]:
         async with self._lock:
             if key in self._cache:
                 value, expiry = self._cache[key]
-                if datetime.now() < expiry:
+                if time.monotonic() < expiry:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
                     return value
                 else:
                     del self._cache[key]
+                    self.expirations += 1
+            self.misses += 1
+            return None
+
+    async def peek(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
             return None
 
     async def set(self, key: str, value: Any, ttl_seconds: int = 180) -> None:
         async with self._lock:
-            expiry = datetime.now() + timedelta(seconds=ttl_seconds)
+            expiry = time.monotonic() + ttl_seconds
             self._cache[key] = (value, expiry)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.evictions += 1
 
     async def delete(self, key: str) -> None:
         async with self._lock:
@@ -31,7 +63,45 @@ class MemoryCache(Cache):
 
     async def cleanup_expired(self):
         async with self._lock:
-            now = datetime.now()
+            now = time.monotonic()
             expired_keys = [k for k, (_, expiry) in self._cache.items() if now >= expiry]
             for key in expired_keys:
-                del self._cache[key]
\ No newline at end of file
+                del self._cache[key]
+            self.expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def start_expiry(self, interval_seconds: float = 60):
+        """Schedule cleanup_expired on the running loop every interval_seconds"""
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expire_periodically(interval_seconds))
+
+    async def stop_expiry(self):
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+
+    async def _expire_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug(f"Expired {removed} cache entries, {len(self._cache)} remaining")
+            except Exception as e:
+                logger.error(f"Cache expiry sweep failed: {str(e)}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+from src.application.ports.cache import Cache
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at);
+"""
+
+
+def _encode(value: Any) -> str:
+    def default(obj):
+        if isinstance(obj, Decimal):
+            return {"__decimal__": str(obj)}
+        if isinstance(obj, datetime):
+            return {"__datetime__": obj.isoformat()}
+        raise TypeError(f"Cannot cache value of type {type(obj).__name__}")
+    return json.dumps(value, default=default, separators=(",", ":"))
+
+
+def _decode(raw: str) -> Any:
+    def object_hook(obj):
+        if "__decimal__" in obj:
+            return Decimal(obj["__decimal__"])
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        return obj
+    return json.loads(raw, object_hook=object_hook)
+
+
+class SqliteCache(Cache):
+    """TTL cache in a SQLite file in WAL mode, shared by every worker on a host.
+
+    WAL lets readers run alongside the single writer, so gets run inline on
+    the event loop while sets and deletes go to one writer thread per
+    process. An inline primary-key read takes about 20us at p50, and a hop
+    through a reader thread costs five times that, so gets deliberately
+    block. Their worst case is bounded instead: the reader waits at most
+    read_timeout_seconds on a lock and then reports a miss. Values are JSON
+    with Decimal and datetime preserved. Expiry uses wall-clock time
+    because entries outlive any one process; when the table grows past
+    max_entries the entries closest to expiry are evicted. The size in
+    stats() is the row count as of the last eviction check or sweep.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, evict_every: int = 100, read_timeout_seconds: float = 0.05):
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.read_timeout_seconds = read_timeout_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.read_errors = 0
+        self.size = 0
+        self._writes = 0
+        self._pid: Optional[int] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._expiry_task: Optional[asyncio.Task] = None
+
+    def _connect(self, check_same_thread: bool = True, timeout: float = 5) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=check_same_thread)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _ensure_open(self) -> None:
+        # Connections must not cross a fork, so each worker process opens its own
+        if self._pid == os.getpid():
+            return
+        self._writer = self._connect(check_same_thread=False)
+        self._writer.executescript(SCHEMA)
+        self.size = self._writer.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        self._reader = self._connect(timeout=self.read_timeout_seconds)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-cache")
+        self._pid = os.getpid()
+
+    async def _write(self, fn, *args):
+        self._ensure_open()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _select(self, key: str) -> Optional[tuple]:
+        self._ensure_open()
+        try:
+            return self._reader.execute("SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        except sqlite3.OperationalError as e:
+            # Locked past read_timeout_seconds: a miss costs one upstream fetch, a longer wait stalls the loop
+            self.read_errors += 1
+            logger.warning(f"Shared cache read failed, treating {key} as a miss: {str(e)}")
+            return None
+
+    def get_nowait(self, key: str) -> Optional[Any]:
+        row = self._select(key)
+        if row is None:
+            self.misses += 1
+            return None
+        if time.time() >= row[1]:
+            # Left for the sweep; deleting here would turn every expired read into a write
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _decode(row[0])
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    def peek_nowait(self, key: str) -> Optional[Any]:
+        row = self._select(key)
+        if row is None or time.time() >= row[1]:
+            return None
+        return _decode(row[0])
+
+    async def peek(self, key: str) -> Optional[Any]:
+        return self.peek_nowait(key)
+
+    def _set(self, key: str, raw: str, expires_at: float) -> None:
+        self._writer.execute(
+            "INSERT INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+            (key, raw, expires_at)
+        )
+        self._writes += 1
+        if self._writes % self.evict_every == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        self.size = self._writer.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        excess = self.size - self.max_entries
+        if excess > 0:
+            self._writer.execute(
+                "DELETE FROM cache_entries WHERE key IN (SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+            self.size = self.max_entries
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 180) -> None:
+        await self._write(self._set, key, _encode(value), time.time() + ttl_seconds)
+
+    def _delete(self, key: str) -> None:
+        self._writer.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    async def delete(self, key: str) -> None:
+        await self._write(self._delete, key)
+
+    def _cleanup_expired(self) -> int:
+        removed = self._writer.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)).rowcount
+        self._evict()
+        return removed
+
+    async def cleanup_expired(self) -> int:
+        return await self._write(self._cleanup_expired)
+
+    def start_expiry(self, interval_seconds: float = 60):
+        """Schedule cleanup_expired on the running loop every interval_seconds"""
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expire_periodically(interval_seconds))
+
+    async def stop_expiry(self):
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+
+    async def _expire_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug(f"Expired {removed} shared cache entries")
+            except Exception as e:
+                logger.error(f"Shared cache expiry sweep failed: {str(e)}")
+
+    def close(self) -> None:
+        if self._pid == os.getpid():
+            self._executor.shutdown(wait=True)
+            self._reader.close()
+            self._writer.close()
+        self._pid = None
+
+    def __len__(self) -> int:
+        """Exact row count; a blocking COUNT(*), so stats() reports the last known size instead"""
+        self._ensure_open()
+        return self._reader.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": self.size,
+            "max_entries": self.max_entries,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "read_errors": self.read_errors
+        }
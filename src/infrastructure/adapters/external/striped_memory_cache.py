@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from src.application.ports.cache import Cache
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "expiry", "referenced")
+
+    def __init__(self, value: Any, expiry: float):
+        self.value = value
+        self.expiry = expiry
+        self.referenced = False
+
+
+class StripedMemoryCache(Cache):
+    """In-process TTL cache with lock-free reads and per-shard write locks.
+
+    Reads are a single dict lookup, which is atomic under the GIL, so they never
+    wait on writers. Writes take a threading.Lock for their shard only, which
+    makes the cache safe to share between the event loop and threadpool code.
+    Each shard is bounded and evicts with the CLOCK (second-chance) policy: a
+    read only flags the entry as referenced, and eviction skips flagged entries
+    once. This approximates LRU without reordering on the read path.
+    """
+
+    def __init__(self, max_entries: int = 10000, shards: int = 16):
+        # Round shards up to a power of two so the shard is a mask of the hash
+        self.shard_count = 1 << max(0, shards - 1).bit_length()
+        self._mask = self.shard_count - 1
+        self._shards: List[Dict[str, _Entry]] = [{} for _ in range(self.shard_count)]
+        self._locks = [threading.Lock() for _ in range(self.shard_count)]
+        self.max_entries = max_entries
+        self._shard_capacity = max(1, -(-max_entries // self.shard_count))
+        # Counters are updated without locks and may undercount under heavy threading
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._expiry_task: Optional[asyncio.Task] = None
+
+    def get_nowait(self, key: str) -> Optional[Any]:
+        entry = self._shards[hash(key) & self._mask].get(key)
+        if entry is not None and time.monotonic() < entry.expiry:
+            entry.referenced = True
+            self.hits += 1
+            return entry.value
+        self.misses += 1
+        return None
+
+    def peek_nowait(self, key: str) -> Optional[Any]:
+        entry = self._shards[hash(key) & self._mask].get(key)
+        if entry is not None and time.monotonic() < entry.expiry:
+            return entry.value
+        return None
+
+    def set_nowait(self, key: str, value: Any, ttl_seconds: int = 180) -> None:
+        index = hash(key) & self._mask
+        shard = self._shards[index]
+        entry = _Entry(value, time.monotonic() + ttl_seconds)
+        with self._locks[index]:
+            # Re-insert so the key moves to the back of the clock
+            shard.pop(key, None)
+            shard[key] = entry
+            if len(shard) > self._shard_capacity:
+                self._evict_one(shard)
+
+    def delete_nowait(self, key: str) -> None:
+        index = hash(key) & self._mask
+        with self._locks[index]:
+            self._shards[index].pop(key, None)
+
+    def _evict_one(self, shard: Dict[str, _Entry]) -> None:
+        # Caller holds the shard lock. Bounded by one full pass over the shard.
+        now = time.monotonic()
+        for _ in range(len(shard)):
+            key = next(iter(shard))
+            entry = shard[key]
+            if entry.expiry <= now:
+                del shard[key]
+                self.expirations += 1
+                return
+            if entry.referenced:
+                entry.referenced = False
+                del shard[key]
+                shard[key] = entry
+                continue
+            del shard[key]
+            self.evictions += 1
+            return
+        del shard[next(iter(shard))]
+        self.evictions += 1
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    async def peek(self, key: str) -> Optional[Any]:
+        return self.peek_nowait(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int = 180) -> None:
+        self.set_nowait(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self.delete_nowait(key)
+
+    async def cleanup_expired(self):
+        removed = 0
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                now = time.monotonic()
+                expired_keys = [k for k, entry in shard.items() if now >= entry.expiry]
+                for key in expired_keys:
+                    del shard[key]
+            removed += len(expired_keys)
+            # Yield between shards so a large sweep does not stall the loop
+            await asyncio.sleep(0)
+        self.expirations += removed
+        return removed
+
+    def start_expiry(self, interval_seconds: float = 60):
+        """Schedule cleanup_expired on the running loop every interval_seconds"""
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._expire_periodically(interval_seconds))
+
+    async def stop_expiry(self):
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            try:
+                await self._expiry_task
+            except asyncio.CancelledError:
+                pass
+            self._expiry_task = None
+
+    async def _expire_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug(f"Expired {removed} cache entries, {len(self)} remaining")
+            except Exception as e:
+                logger.error(f"Cache expiry sweep failed: {str(e)}")
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "shards": self.shard_count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -1,43 +1,110 @@
+import asyncio
 import httpx
 from decimal import Decimal
-from typing import Optional, Tuple
-from src.application.ports.price_provider import PriceProvider
+from typing import Dict, List, Optional, Tuple
+from src.application.ports.price_provider import PriceProvider, PriceProviderUnavailable
+from src.infrastructure.config.http_client import http_clients
 from src.infrastructure.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
 class YahooPriceProvider(PriceProvider):
+    client_name = "yahoo"
+    # Yahoo's spark endpoint rejects requests with more symbols than this
+    batch_size = 20
+
     def __init__(self):
         self.base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
+        self.spark_url = "https://query1.finance.yahoo.com/v7/finance/spark"
 
     async def get_price(self, ticker: str) -> Optional[Tuple[Decimal, str]]:
         logger.info(f"Fetching price from Yahoo Finance for {ticker}")
         
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/{ticker}?interval=1d&range=1d"
-                logger.debug(f"Making request to Yahoo Finance: {url}")
-
-                response = await client.get(url, timeout=10.0, headers={"User-Agent": "Mozilla/5.0"})
-                response.raise_for_status()
-                logger.debug(f"Yahoo Finance response status: {response.status_code}")
-                
-                data = response.json()
-                price = data.get("chart", {}).get("result", [{}])[0].get("meta", {}).get("regularMarketPrice")
-                
-                if price is not None:
-                    logger.info(f"Yahoo Finance returned price for {ticker}: {price}")
-                    return (Decimal(str(price)), "yahoo_finance")
-                else:
-                    logger.warning(f"Yahoo Finance returned no price data for {ticker}")
-                    return None
+            client = http_clients.get_client(self.client_name)
+            url = f"{self.base_url}/{ticker}?interval=1d&range=1d"
+            logger.debug(f"Making request to Yahoo Finance: {url}")
+
+            response = await client.get(url)
+            response.raise_for_status()
+            logger.debug(f"Yahoo Finance response status: {response.status_code} ({response.http_version})")
+            
+            data = response.json()
+            price = data.get("chart", {}).get("result", [{}])[0].get("meta", {}).get("regularMarketPrice")
+            
+            if price is not None:
+                logger.info(f"Yahoo Finance returned price for {ticker}: {price}")
+                return (Decimal(str(price)), "yahoo_finance")
+            else:
+                logger.warning(f"Yahoo Finance returned no price data for {ticker}")
+                return None
         except httpx.HTTPStatusError as e:
             logger.error(f"Yahoo Finance HTTP error for {ticker}: {e.response.status_code} - {e.response.text}")
+            if self._is_upstream_failure(e.response.status_code):
+                raise PriceProviderUnavailable(f"Yahoo Finance HTTP {e.response.status_code}") from e
             return None
-        except httpx.TimeoutException:
+        except httpx.TimeoutException as e:
             logger.error(f"Yahoo Finance timeout for {ticker}")
-            return None
+            raise PriceProviderUnavailable("Yahoo Finance timeout") from e
+        except httpx.TransportError as e:
+            logger.error(f"Yahoo Finance connection error for {ticker}: {str(e)}")
+            raise PriceProviderUnavailable(f"Yahoo Finance connection error: {str(e)}") from e
         except Exception as e:
             logger.error(f"Yahoo Finance unexpected error for {ticker}: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    async def get_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        chunks = [tickers[i:i + self.batch_size] for i in range(0, len(tickers), self.batch_size)]
+        results = await asyncio.gather(*(self._get_spark_prices(chunk) for chunk in chunks), return_exceptions=True)
+
+        prices: Dict[str, Tuple[Decimal, str]] = {}
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+        for result in results:
+            if not isinstance(result, BaseException):
+                prices.update(result)
+        return prices
+
+    @staticmethod
+    def _is_upstream_failure(status_code: int) -> bool:
+        return status_code == 429 or status_code >= 500
+
+    async def _get_spark_prices(self, tickers: List[str]) -> Dict[str, Tuple[Decimal, str]]:
+        logger.info(f"Fetching {len(tickers)} prices from Yahoo Finance in one request")
+
+        try:
+            client = http_clients.get_client(self.client_name)
+            params = {"symbols": ",".join(tickers), "interval": "1d", "range": "1d"}
+
+            response = await client.get(self.spark_url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+            prices: Dict[str, Tuple[Decimal, str]] = {}
+            for item in data.get("spark", {}).get("result") or []:
+                symbol = item.get("symbol")
+                responses = item.get("response") or [{}]
+                price = responses[0].get("meta", {}).get("regularMarketPrice")
+                if symbol in tickers and price is not None:
+                    prices[symbol] = (Decimal(str(price)), "yahoo_finance")
+
+            missing = len(tickers) - len(prices)
+            if missing:
+                logger.warning(f"Yahoo Finance returned no price data for {missing} of {len(tickers)} tickers")
+            return prices
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Yahoo Finance HTTP error for batch {tickers}: {e.response.status_code} - {e.response.text}")
+            if self._is_upstream_failure(e.response.status_code):
+                raise PriceProviderUnavailable(f"Yahoo Finance HTTP {e.response.status_code}") from e
+            return {}
+        except httpx.TimeoutException as e:
+            logger.error(f"Yahoo Finance timeout for batch {tickers}")
+            raise PriceProviderUnavailable("Yahoo Finance timeout") from e
+        except httpx.TransportError as e:
+            logger.error(f"Yahoo Finance connection error for batch {tickers}: {str(e)}")
+            raise PriceProviderUnavailable(f"Yahoo Finance connection error: {str(e)}") from e
+        except Exception as e:
+            logger.error(f"Yahoo Finance unexpected error for batch {tickers}: {str(e)}")
+            return {}
\ No newline at end of file
@@ -0,0 +1,116 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+
+
+class ApiKeyCache:
+    """TTL + LRU cache of api_key -> User, with negative entries for unknown keys.
+
+    Known and unknown keys live in separate LRUs so a flood of random keys can
+    only evict other negative entries, never authenticated users.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, negative_ttl_seconds: float = 30, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._users: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._unknown: "OrderedDict[str, float]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, api_key: str) -> Tuple[bool, Optional[User]]:
+        """Return (found, user); found with user None means a cached unknown key"""
+        now = time.monotonic()
+        entry = self._users.get(api_key)
+        if entry is not None:
+            user, expiry = entry
+            if now < expiry:
+                self._users.move_to_end(api_key)
+                self.hits += 1
+                return True, user
+            del self._users[api_key]
+
+        expiry = self._unknown.get(api_key)
+        if expiry is not None:
+            if now < expiry:
+                self.negative_hits += 1
+                return True, None
+            del self._unknown[api_key]
+
+        self.misses += 1
+        return False, None
+
+    def store(self, api_key: str, user: Optional[User]) -> None:
+        now = time.monotonic()
+        if user is not None:
+            self._unknown.pop(api_key, None)
+            self._put(self._users, api_key, (user, now + self.ttl_seconds))
+        elif self.negative_ttl_seconds > 0:
+            self._put(self._unknown, api_key, now + self.negative_ttl_seconds)
+
+    def _put(self, entries: OrderedDict, key: str, value) -> None:
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def invalidate(self, api_key: str) -> None:
+        """Drop a key, e.g. after it was rotated or revoked"""
+        self._users.pop(api_key, None)
+        self._unknown.pop(api_key, None)
+        self.invalidations += 1
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached key belonging to a user"""
+        for api_key in [key for key, (user, _) in self._users.items() if user.id == user_id]:
+            del self._users[api_key]
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._unknown.clear()
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "users": len(self._users),
+            "unknown_keys": len(self._unknown),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+
+class CachedUserRepository(UserRepository):
+    """UserRepository decorator that answers find_by_api_key from an ApiKeyCache"""
+
+    def __init__(self, repository: UserRepository, cache: ApiKeyCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def find_by_api_key(self, api_key: str) -> Optional[User]:
+        found, user = self.cache.lookup(api_key)
+        if found:
+            return user
+
+        user = await self.repository.find_by_api_key(api_key)
+        self.cache.store(api_key, user)
+        return user
+
+    async def create(self, user: User) -> User:
+        created = await self.repository.create(user)
+        # The key may have been cached as unknown before it existed
+        self.cache.invalidate(created.api_key)
+        return created
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        return await self.repository.find_by_id(user_id)
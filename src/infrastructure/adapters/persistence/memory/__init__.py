@@ -0,0 +1,17 @@
+from src.infrastructure.adapters.persistence.memory.memory_balance_repository import MemoryBalanceRepository
+from src.infrastructure.adapters.persistence.memory.memory_user_repository import MemoryUserRepository
+from src.infrastructure.adapters.persistence.memory.memory_stock_balance_repository import MemoryStockBalanceRepository
+from src.infrastructure.adapters.persistence.memory.memory_trade_repository import MemoryTradeRepository
+from src.infrastructure.adapters.persistence.memory.memory_trade_execution_repository import MemoryTradeExecutionRepository
+from src.infrastructure.adapters.persistence.memory.memory_portfolio_repository import MemoryPortfolioRepository
+from src.infrastructure.adapters.persistence.memory.memory_ticker_activity_repository import MemoryTickerActivityRepository
+
+__all__ = [
+    'MemoryBalanceRepository',
+    'MemoryUserRepository',
+    'MemoryStockBalanceRepository',
+    'MemoryTradeRepository',
+    'MemoryTradeExecutionRepository',
+    'MemoryPortfolioRepository',
+    'MemoryTickerActivityRepository'
+]
@@ -0,0 +1,52 @@
+from typing import Optional
+from datetime import datetime, timezone
+import uuid
+import logging
+
+from src.domain.entities.balance import Balance
+from src.domain.repositories.balance_repository import BalanceRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger, round_money
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryBalanceRepository(BalanceRepository):
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def find_by_user_id(self, user_id: str) -> Optional[Balance]:
+        balance = self.ledger.balances.get(user_id)
+        return balance.model_copy() if balance else None
+
+    async def create(self, balance: Balance) -> Balance:
+        if balance.user_id in self.ledger.balances:
+            raise ValueError(f"Balance already exists [user_id={balance.user_id}]")
+
+        now = datetime.now(timezone.utc)
+        created = Balance(
+            id=balance.id or str(uuid.uuid4()),
+            user_id=balance.user_id,
+            cash_balance=round_money(balance.cash_balance),
+            created_at=now,
+            updated_at=now
+        )
+        await self.ledger.commit([self.ledger.put_balance(created)])
+
+        logger.info("[MemoryBalanceRepository:create] - Balance created [id=%s, user_id=%s]", created.id, created.user_id)
+        return created.model_copy()
+
+    async def update(self, balance: Balance) -> Balance:
+        existing = self.ledger.balances.get(balance.user_id)
+        if existing is None or existing.id != balance.id:
+            error_msg = f"Balance not found [id={balance.id}]"
+            logger.error("[MemoryBalanceRepository:update] - %s", error_msg)
+            raise ValueError(error_msg)
+
+        updated = existing.model_copy(update={
+            'cash_balance': round_money(balance.cash_balance),
+            'updated_at': datetime.now(timezone.utc)
+        })
+        await self.ledger.commit([self.ledger.put_balance(updated)])
+        return updated.model_copy()
@@ -0,0 +1,33 @@
+from decimal import Decimal
+from typing import Optional
+import logging
+
+from src.domain.entities.portfolio import Portfolio
+from src.domain.repositories.portfolio_repository import PortfolioRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryPortfolioRepository(PortfolioRepository):
+    """Portfolio read model over the ledger; consistent because nothing yields while it is built"""
+
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def find_by_user_id(self, user_id: str) -> Portfolio:
+        balance = self.ledger.balances.get(user_id)
+        holdings = self.ledger.positions.get(user_id, {})
+        positions = [holdings[ticker].model_copy() for ticker in sorted(holdings)]
+
+        portfolio = Portfolio(
+            user_id=user_id,
+            cash_balance=balance.cash_balance if balance else Decimal("0"),
+            holdings=positions,
+            total_invested_value=sum((p.quantity * p.average_price for p in positions), Decimal("0"))
+        )
+
+        logger.debug("[MemoryPortfolioRepository:find_by_user_id] - Found %s holdings [user_id=%s]", len(positions), user_id)
+        return portfolio
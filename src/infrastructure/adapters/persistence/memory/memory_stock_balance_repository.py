@@ -0,0 +1,63 @@
+from typing import List, Optional
+from datetime import datetime, timezone
+import uuid
+import logging
+
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.repositories.stock_balance_repository import StockBalanceRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger, round_money, round_quantity
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryStockBalanceRepository(StockBalanceRepository):
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def find_by_user_id(self, user_id: str) -> List[StockBalance]:
+        holdings = self.ledger.positions.get(user_id)
+        return [position.model_copy() for position in holdings.values()] if holdings else []
+
+    async def find_by_user_id_and_ticker(self, user_id: str, ticker: str) -> Optional[StockBalance]:
+        position = self.ledger.find_position(user_id, ticker)
+        return position.model_copy() if position else None
+
+    async def create(self, stock_balance: StockBalance) -> StockBalance:
+        if self.ledger.find_position(stock_balance.user_id, stock_balance.ticker) is not None:
+            raise ValueError(f"Stock balance already exists [user_id={stock_balance.user_id}, ticker={stock_balance.ticker}]")
+
+        now = datetime.now(timezone.utc)
+        created = StockBalance(
+            id=stock_balance.id or str(uuid.uuid4()),
+            user_id=stock_balance.user_id,
+            ticker=stock_balance.ticker,
+            quantity=round_quantity(stock_balance.quantity),
+            average_price=round_money(stock_balance.average_price),
+            current_price=round_money(stock_balance.current_price),
+            created_at=now,
+            updated_at=now
+        )
+        await self.ledger.commit([self.ledger.put_position(created)])
+        return created.model_copy()
+
+    async def update(self, stock_balance: StockBalance) -> StockBalance:
+        key = self.ledger.position_keys.get(stock_balance.id)
+        if key is None:
+            error_msg = f"Stock balance not found [id={stock_balance.id}]"
+            logger.error("[MemoryStockBalanceRepository:update] - %s", error_msg)
+            raise ValueError(error_msg)
+
+        updated = self.ledger.find_position(*key).model_copy(update={
+            'quantity': round_quantity(stock_balance.quantity),
+            'average_price': round_money(stock_balance.average_price),
+            'current_price': round_money(stock_balance.current_price),
+            'updated_at': datetime.now(timezone.utc)
+        })
+        await self.ledger.commit([self.ledger.put_position(updated)])
+        return updated.model_copy()
+
+    async def delete(self, stock_balance_id: str) -> None:
+        if stock_balance_id in self.ledger.position_keys:
+            await self.ledger.commit([self.ledger.delete_position(stock_balance_id)])
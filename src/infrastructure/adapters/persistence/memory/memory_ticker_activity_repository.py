@@ -0,0 +1,28 @@
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+import bisect
+
+from src.domain.repositories.ticker_activity_repository import TickerActivityRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger, utc
+from src.infrastructure.config.metrics import instrument_repository
+
+
+@instrument_repository
+class MemoryTickerActivityRepository(TickerActivityRepository):
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def find_hot_tickers(self, traded_since: datetime, limit: int) -> List[str]:
+        # Ranked by open positions plus recent trades, as in the Postgres query
+        activity = Counter(
+            ticker
+            for holdings in self.ledger.positions.values()
+            for ticker, position in holdings.items()
+            if position.quantity > 0
+        )
+        traded_since = utc(traded_since)
+        for trades in self.ledger.trades.values():
+            start = bisect.bisect_left(trades, traded_since, key=lambda trade: trade.created_at)
+            activity.update(trade.ticker for trade in trades[start:])
+        return [ticker for ticker, _ in sorted(activity.items(), key=lambda item: (-item[1], item[0]))[:limit]]
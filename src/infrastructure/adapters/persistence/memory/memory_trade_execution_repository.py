@@ -0,0 +1,167 @@
+from typing import Dict, List, Optional, Union
+from decimal import Decimal
+from datetime import datetime, timezone
+import uuid
+import logging
+
+from src.domain.entities.balance import Balance
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.trade import Trade, TradeType
+from src.domain.repositories.trade_execution_repository import (
+    InsufficientFundsError,
+    InsufficientStockError,
+    TradeExecutionRepository
+)
+from src.infrastructure.adapters.persistence.postgres.row_mapping import construct
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger, round_money, round_quantity
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryTradeExecutionRepository(TradeExecutionRepository):
+    """Executes trades against the ledger and logs each call as a single WAL transaction.
+
+    The checks and the state change run without yielding to the event loop,
+    so no other trade can interleave; the caller then waits for the group
+    commit. New entities are built without validation from values that are
+    already typed, rounded to the scale of the matching Postgres column.
+    """
+
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    def _position_operation(self, user_id: str, ticker: str, stored: Optional[StockBalance], quantity: Decimal, average_price: Decimal, current_price: Decimal, now: datetime) -> Optional[list]:
+        """Store the position left by a trade; a closed position is removed"""
+        quantity = round_quantity(quantity)
+        if quantity == 0:
+            return self.ledger.delete_position(stored.id) if stored is not None else None
+        return self.ledger.put_position(construct(StockBalance, {
+            'id': stored.id if stored is not None else str(uuid.uuid4()),
+            'user_id': user_id,
+            'ticker': ticker,
+            'quantity': quantity,
+            'average_price': round_money(average_price),
+            'current_price': round_money(current_price),
+            'created_at': stored.created_at if stored is not None else now,
+            'updated_at': now
+        }))
+
+    def _balance_operation(self, balance: Balance, cash: Decimal, now: datetime) -> list:
+        return self.ledger.put_balance(construct(Balance, {
+            'id': balance.id,
+            'user_id': balance.user_id,
+            'cash_balance': round_money(cash),
+            'created_at': balance.created_at,
+            'updated_at': now
+        }))
+
+    @staticmethod
+    def _executed(trade: Trade, now: datetime) -> Trade:
+        return construct(Trade, {
+            'id': trade.id or str(uuid.uuid4()),
+            'user_id': trade.user_id,
+            'ticker': trade.ticker,
+            'trade_type': trade.trade_type,
+            'quantity': round_quantity(trade.quantity),
+            'price': round_money(trade.price),
+            'total_amount': round_money(trade.total_amount),
+            'created_at': now
+        })
+
+    async def execute_trade(self, trade: Trade) -> Trade:
+        ledger = self.ledger
+        balance = ledger.balances.get(trade.user_id)
+        stored = ledger.find_position(trade.user_id, trade.ticker)
+
+        if trade.trade_type == TradeType.BUY:
+            if balance is None or balance.cash_balance < trade.total_amount:
+                logger.info("[MemoryTradeExecutionRepository:execute_trade] - Trade rejected [user_id=%s, ticker=%s, reason=Insufficient funds]", trade.user_id, trade.ticker)
+                raise InsufficientFundsError("Insufficient funds")
+            cash = balance.cash_balance - trade.total_amount
+            if stored is None:
+                quantity, average_price = trade.quantity, trade.price
+            else:
+                quantity = stored.quantity + trade.quantity
+                average_price = (stored.quantity * stored.average_price + trade.quantity * trade.price) / quantity
+        else:
+            # A sell needs a balance row to credit, as in the Postgres path
+            if balance is None or stored is None or stored.quantity < trade.quantity:
+                logger.info("[MemoryTradeExecutionRepository:execute_trade] - Trade rejected [user_id=%s, ticker=%s, reason=Insufficient stock quantity]", trade.user_id, trade.ticker)
+                raise InsufficientStockError("Insufficient stock quantity")
+            cash = balance.cash_balance + trade.total_amount
+            quantity, average_price = stored.quantity - trade.quantity, stored.average_price
+
+        now = datetime.now(timezone.utc)
+        executed = self._executed(trade, now)
+        operations = [self._balance_operation(balance, cash, now)]
+        position_operation = self._position_operation(trade.user_id, trade.ticker, stored, quantity, average_price, trade.price, now)
+        if position_operation is not None:
+            operations.append(position_operation)
+        operations.append(ledger.add_trade(executed))
+
+        await ledger.commit(operations)
+
+        logger.debug("[MemoryTradeExecutionRepository:execute_trade] - Trade executed [id=%s, user_id=%s, ticker=%s, type=%s]", executed.id, executed.user_id, executed.ticker, executed.trade_type)
+        return executed.model_copy()
+
+    async def execute_batch(self, trades: List[Trade], all_or_nothing: bool = True) -> List[Union[Trade, ValueError]]:
+        if not trades:
+            return []
+        user_id = trades[0].user_id
+        if any(trade.user_id != user_id for trade in trades):
+            raise ValueError("All trades in a batch must belong to the same user")
+
+        ledger = self.ledger
+        now = datetime.now(timezone.utc)
+        balance = ledger.balances.get(user_id)
+        cash = balance.cash_balance if balance else None
+        # ticker -> [quantity, average_price, current_price, stored position or None]
+        positions: Dict[str, list] = {}
+        results: List[Union[Trade, ValueError]] = []
+
+        # Replay in order so every order sees the cash and shares left by the previous ones
+        for trade in trades:
+            position = positions.get(trade.ticker)
+            if position is None:
+                stored = ledger.find_position(user_id, trade.ticker)
+                position = [stored.quantity, stored.average_price, stored.current_price, stored] if stored else None
+
+            if trade.trade_type == TradeType.BUY:
+                if cash is None or cash < trade.total_amount:
+                    results.append(InsufficientFundsError("Insufficient funds"))
+                    continue
+                cash -= trade.total_amount
+                if position is None:
+                    position = [Decimal("0"), Decimal("0"), trade.price, None]
+                quantity = position[0] + trade.quantity
+                position[1] = (position[0] * position[1] + trade.quantity * trade.price) / quantity
+                position[0] = quantity
+            else:
+                if cash is None or position is None or position[0] < trade.quantity:
+                    results.append(InsufficientStockError("Insufficient stock quantity"))
+                    continue
+                cash += trade.total_amount
+                position[0] -= trade.quantity
+            position[2] = trade.price
+            positions[trade.ticker] = position
+            results.append(self._executed(trade, now))
+
+        executed = [result for result in results if isinstance(result, Trade)]
+        rejected = len(results) - len(executed)
+        if not executed or (all_or_nothing and rejected):
+            logger.info("[MemoryTradeExecutionRepository:execute_batch] - Batch not applied [user_id=%s, executed=0, rejected=%s]", user_id, rejected)
+            return results
+
+        operations = [self._balance_operation(balance, cash, now)]
+        for ticker, (quantity, average_price, current_price, stored) in positions.items():
+            position_operation = self._position_operation(user_id, ticker, stored, quantity, average_price, current_price, now)
+            if position_operation is not None:
+                operations.append(position_operation)
+        operations.extend(ledger.add_trade(trade) for trade in executed)
+
+        await ledger.commit(operations)
+
+        logger.info("[MemoryTradeExecutionRepository:execute_batch] - Batch executed [user_id=%s, executed=%s, rejected=%s]", user_id, len(executed), rejected)
+        return [result.model_copy() if isinstance(result, Trade) else result for result in results]
@@ -0,0 +1,58 @@
+from typing import AsyncIterator, List, Optional
+from datetime import datetime, timezone
+from itertools import islice
+import uuid
+import logging
+
+from src.domain.entities.trade import Trade
+from src.domain.repositories.trade_history_repository import TradeHistoryRepository, TradeKey
+from src.domain.repositories.trade_repository import TradeRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger, round_money, round_quantity
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryTradeRepository(TradeRepository, TradeHistoryRepository):
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def create(self, trade: Trade) -> Trade:
+        created = trade.model_copy(update={
+            'id': trade.id or str(uuid.uuid4()),
+            'quantity': round_quantity(trade.quantity),
+            'price': round_money(trade.price),
+            'total_amount': round_money(trade.total_amount),
+            'created_at': datetime.now(timezone.utc)
+        })
+        await self.ledger.commit([self.ledger.add_trade(created)])
+
+        logger.info("[MemoryTradeRepository:create] - Trade created [id=%s, user_id=%s, ticker=%s, type=%s]", created.id, created.user_id, created.ticker, created.trade_type)
+        return created.model_copy()
+
+    async def find_by_user_id(self, user_id: str) -> List[Trade]:
+        return [trade.model_copy() for trade in reversed(self.ledger.trades.get(user_id, []))]
+
+    async def find_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Trade]:
+        return [trade.model_copy() for trade in islice(self.ledger.trade_history(user_id, after, ticker, since, until), limit)]
+
+    async def iter_trades(
+        self,
+        user_id: str,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[Trade]:
+        # Trades recorded while the stream is open land after its starting point and are not yielded
+        for trade in self.ledger.trade_history(user_id, after, ticker, since, until):
+            yield trade.model_copy()
@@ -0,0 +1,45 @@
+from typing import Optional
+from datetime import datetime, timezone
+import uuid
+import logging
+
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.config.memory_ledger import MemoryLedger, memory_ledger
+from src.infrastructure.config.metrics import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class MemoryUserRepository(UserRepository):
+    def __init__(self, ledger: Optional[MemoryLedger] = None):
+        self.ledger = ledger or memory_ledger
+
+    async def find_by_api_key(self, api_key: str) -> Optional[User]:
+        user_id = self.ledger.user_ids_by_api_key.get(api_key)
+        if user_id is None:
+            logger.debug("[MemoryUserRepository:find_by_api_key] - User not found [api_key=%s...]", api_key[:8])
+            return None
+        return self.ledger.users[user_id].model_copy()
+
+    async def create(self, user: User) -> User:
+        if user.api_key in self.ledger.user_ids_by_api_key:
+            raise ValueError(f"API key already in use [email={user.email}]")
+
+        now = datetime.now(timezone.utc)
+        created = User(
+            id=user.id or str(uuid.uuid4()),
+            email=user.email,
+            api_key=user.api_key,
+            created_at=now,
+            updated_at=now
+        )
+        await self.ledger.commit([self.ledger.put_user(created)])
+
+        logger.info("[MemoryUserRepository:create] - User created [id=%s, email=%s]", created.id, created.email)
+        return created.model_copy()
+
+    async def find_by_id(self, user_id: str) -> Optional[User]:
+        user = self.ledger.users.get(user_id)
+        return user.model_copy() if user else None
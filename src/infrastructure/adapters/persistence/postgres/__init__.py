@@ -2,10 +2,16 @@ from src.infrastructure.adapters.persistence.postgres.postgres_balance_repositor
 from src.infrastructure.adapters.persistence.postgres.postgres_user_repository import PostgresUserRepository
 from src.infrastructure.adapters.persistence.postgres.postgres_stock_balance_repository import PostgresStockBalanceRepository
 from src.infrastructure.adapters.persistence.postgres.postgres_trade_repository import PostgresTradeRepository
+from src.infrastructure.adapters.persistence.postgres.postgres_trade_execution_repository import PostgresTradeExecutionRepository
+from src.infrastructure.adapters.persistence.postgres.postgres_portfolio_repository import PostgresPortfolioRepository
+from src.infrastructure.adapters.persistence.postgres.postgres_ticker_activity_repository import PostgresTickerActivityRepository
 
 __all__ = [
     'PostgresBalanceRepository',
     'PostgresUserRepository',
     'PostgresStockBalanceRepository',
-    'PostgresTradeRepository'
+    'PostgresTradeRepository',
+    'PostgresTradeExecutionRepository',
+    'PostgresPortfolioRepository',
+    'PostgresTickerActivityRepository'
 ]
@@ -0,0 +1,67 @@
+from decimal import Decimal
+import json
+import logging
+
+from src.domain.entities.portfolio import Portfolio
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.repositories.portfolio_repository import PortfolioRepository
+from src.infrastructure.config.metrics import instrument_repository
+from src.infrastructure.config.postgres_database import postgres_db
+
+logger = logging.getLogger(__name__)
+
+# One round trip for the whole portfolio: the cash balance joined with the
+# holdings aggregated as JSON, and the invested value summed in SQL on numeric.
+# Users without a balance row or without holdings still get a row back.
+PORTFOLIO_QUERY = """
+    SELECT
+        COALESCE(b.cash_balance, 0) AS cash_balance,
+        COALESCE(h.holdings, '[]'::json) AS holdings,
+        COALESCE(h.total_invested_value, 0) AS total_invested_value
+    FROM (SELECT $1::text AS user_id) u
+    LEFT JOIN ibkr_balances b ON b.user_id = u.user_id
+    LEFT JOIN LATERAL (
+        SELECT
+            json_agg(json_build_object(
+                'id', sb.id,
+                'user_id', sb.user_id,
+                'ticker', sb.ticker,
+                'quantity', sb.quantity,
+                'average_price', sb.average_price,
+                'current_price', sb.current_price,
+                'created_at', sb.created_at,
+                'updated_at', sb.updated_at
+            ) ORDER BY sb.ticker) AS holdings,
+            SUM(sb.quantity * sb.average_price) AS total_invested_value
+        FROM ibkr_stock_balances sb
+        WHERE sb.user_id = u.user_id
+    ) h ON true
+"""
+
+
+@instrument_repository
+class PostgresPortfolioRepository(PortfolioRepository):
+    """Portfolio read model over ibkr_balances and ibkr_stock_balances"""
+
+    async def find_by_user_id(self, user_id: str) -> Portfolio:
+        try:
+            async with postgres_db.acquire() as connection:
+                logger.debug(f"[PostgresPortfolioRepository:find_by_user_id] - Executing query [user_id={user_id}]")
+
+                row = await connection.fetchrow(PORTFOLIO_QUERY, user_id)
+
+                # numeric values arrive as JSON numbers; parse them straight into Decimal
+                holdings = json.loads(row['holdings'], parse_float=Decimal, parse_int=Decimal)
+
+                portfolio = Portfolio(
+                    user_id=user_id,
+                    cash_balance=row['cash_balance'],
+                    holdings=[StockBalance(**holding) for holding in holdings],
+                    total_invested_value=row['total_invested_value']
+                )
+
+                logger.debug(f"[PostgresPortfolioRepository:find_by_user_id] - Found {len(portfolio.holdings)} holdings [user_id={user_id}]")
+                return portfolio
+        except Exception as e:
+            logger.error(f"[PostgresPortfolioRepository:find_by_user_id] - Error reading portfolio [user_id={user_id}, error={str(e)}]")
+            raise
\ No newline at end of file
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import List
+import logging
+
+from src.domain.repositories.ticker_activity_repository import TickerActivityRepository
+from src.infrastructure.config.metrics import instrument_repository
+from src.infrastructure.config.postgres_database import postgres_db
+
+logger = logging.getLogger(__name__)
+
+# Ranked by open positions plus recent trades; the trade side uses idx_ibkr_trades_created_at
+HOT_TICKERS_QUERY = """
+    SELECT ticker
+    FROM (
+        SELECT ticker, COUNT(*) AS activity FROM ibkr_stock_balances WHERE quantity > 0 GROUP BY ticker
+        UNION ALL
+        SELECT ticker, COUNT(*) AS activity FROM ibkr_trades WHERE created_at >= $1 GROUP BY ticker
+    ) activity
+    GROUP BY ticker
+    ORDER BY SUM(activity) DESC, ticker
+    LIMIT $2
+"""
+
+
+@instrument_repository
+class PostgresTickerActivityRepository(TickerActivityRepository):
+    async def find_hot_tickers(self, traded_since: datetime, limit: int) -> List[str]:
+        async with postgres_db.acquire() as connection:
+            try:
+                logger.debug(f"[PostgresTickerActivityRepository:find_hot_tickers] - Executing query [traded_since={traded_since}, limit={limit}]")
+
+                rows = await connection.fetch(HOT_TICKERS_QUERY, traded_since, limit)
+                return [row['ticker'] for row in rows]
+            except Exception as e:
+                logger.error(f"[PostgresTickerActivityRepository:find_hot_tickers] - Error finding hot tickers [error={str(e)}]")
+                raise
\ No newline at end of file
@@ -0,0 +1,270 @@
+from typing import Dict, List, Union
+from decimal import Decimal
+from datetime import datetime
+import uuid
+import logging
+
+from src.domain.entities.trade import Trade, TradeType
+from src.domain.repositories.trade_execution_repository import (
+    InsufficientFundsError,
+    InsufficientStockError,
+    TradeExecutionRepository
+)
+from src.infrastructure.adapters.persistence.postgres.row_mapping import TRADE_COLUMNS, to_trade
+from src.infrastructure.config.metrics import instrument_repository
+from src.infrastructure.config.postgres_database import postgres_db
+
+logger = logging.getLogger(__name__)
+
+# One statement: debit cash only if it covers the trade (the UPDATE row-locks the
+# balance and re-checks the condition after any concurrent writer commits), then
+# upsert the position and record the trade from the debited row. If the debit
+# matches nothing, the other CTEs see no rows and nothing is written.
+BUY_QUERY = f"""
+    WITH debit AS (
+        UPDATE ibkr_balances
+        SET cash_balance = cash_balance - $5::numeric, updated_at = $7::timestamptz
+        WHERE user_id = $1 AND cash_balance >= $5::numeric
+        RETURNING user_id
+    ),
+    holding AS (
+        INSERT INTO ibkr_stock_balances AS sb
+            (id, user_id, ticker, quantity, average_price, current_price, created_at, updated_at)
+        SELECT $8::text, user_id, $2::text, $3::numeric, $4::numeric, $4::numeric, $7::timestamptz, $7::timestamptz FROM debit
+        ON CONFLICT (user_id, ticker) DO UPDATE
+        SET quantity = sb.quantity + EXCLUDED.quantity,
+            average_price = (sb.quantity * sb.average_price + EXCLUDED.quantity * EXCLUDED.average_price)
+                            / (sb.quantity + EXCLUDED.quantity),
+            current_price = EXCLUDED.current_price,
+            updated_at = EXCLUDED.updated_at
+        RETURNING id
+    )
+    INSERT INTO ibkr_trades ({TRADE_COLUMNS})
+    SELECT $6::text, debit.user_id, $2::text, 'buy', $3::numeric, $4::numeric, $5::numeric, $7::timestamptz
+    FROM debit, holding
+    RETURNING {TRADE_COLUMNS}
+"""
+
+# One statement: lock the balance row first (the same order as a buy, so buys and
+# sells on one account cannot deadlock), take the shares only if the position
+# covers them, credit the cash, and record the trade. The position id and
+# remaining quantity come back so a fully closed position can be removed.
+SELL_QUERY = f"""
+    WITH account AS (
+        SELECT user_id FROM ibkr_balances WHERE user_id = $1 FOR UPDATE
+    ),
+    holding AS (
+        UPDATE ibkr_stock_balances
+        SET quantity = quantity - $3::numeric, current_price = $4::numeric, updated_at = $7::timestamptz
+        WHERE user_id IN (SELECT user_id FROM account) AND ticker = $2::text AND quantity >= $3::numeric
+        RETURNING id, user_id, quantity
+    ),
+    credit AS (
+        UPDATE ibkr_balances
+        SET cash_balance = cash_balance + $5::numeric, updated_at = $7::timestamptz
+        WHERE user_id IN (SELECT user_id FROM holding)
+    ),
+    trade AS (
+        INSERT INTO ibkr_trades ({TRADE_COLUMNS})
+        SELECT $6::text, user_id, $2::text, 'sell', $3::numeric, $4::numeric, $5::numeric, $7::timestamptz FROM holding
+        RETURNING {TRADE_COLUMNS}
+    )
+    SELECT trade.*, holding.id AS position_id, holding.quantity AS remaining_quantity
+    FROM trade, holding
+"""
+
+# Guarded by quantity = 0 so a buy that landed in between keeps its position
+DELETE_CLOSED_POSITION_QUERY = "DELETE FROM ibkr_stock_balances WHERE id = $1 AND quantity = 0"
+
+# Batches lock the balance row and then the positions in ticker order, the same
+# balance-first order as single trades, then write the net result.
+LOCK_BALANCE_QUERY = "SELECT cash_balance FROM ibkr_balances WHERE user_id = $1 FOR UPDATE"
+
+LOCK_POSITIONS_QUERY = """
+    SELECT id, ticker, quantity, average_price
+    FROM ibkr_stock_balances
+    WHERE user_id = $1 AND ticker = ANY($2::text[])
+    ORDER BY ticker
+    FOR UPDATE
+"""
+
+UPDATE_BALANCE_QUERY = """
+    UPDATE ibkr_balances
+    SET cash_balance = cash_balance + $2::numeric, updated_at = $3::timestamptz
+    WHERE user_id = $1
+"""
+
+UPSERT_POSITION_QUERY = """
+    INSERT INTO ibkr_stock_balances
+        (id, user_id, ticker, quantity, average_price, current_price, created_at, updated_at)
+    VALUES ($1::text, $2::text, $3::text, $4::numeric, $5::numeric, $6::numeric, $7::timestamptz, $7::timestamptz)
+    ON CONFLICT (user_id, ticker) DO UPDATE
+    SET quantity = EXCLUDED.quantity,
+        average_price = EXCLUDED.average_price,
+        current_price = EXCLUDED.current_price,
+        updated_at = EXCLUDED.updated_at
+"""
+
+DELETE_POSITIONS_QUERY = "DELETE FROM ibkr_stock_balances WHERE id = ANY($1::text[])"
+
+
+@instrument_repository
+class PostgresTradeExecutionRepository(TradeExecutionRepository):
+    """Executes a trade in a single SQL statement on one pooled connection.
+
+    Replaces the read-modify-write sequence over the balance, stock balance and
+    trade repositories (up to six connections and no transaction) with one round
+    trip, plus one more when a sell closes the position.
+
+    Batches run in one transaction: lock the rows, replay the orders on Decimal,
+    then write the balance delta, one executemany for the positions and one
+    COPY for the trades.
+    """
+
+    async def execute_trade(self, trade: Trade) -> Trade:
+        async with postgres_db.acquire() as connection:
+            try:
+                trade_id = trade.id or str(uuid.uuid4())
+                now = datetime.utcnow()
+
+                logger.debug(f"[PostgresTradeExecutionRepository:execute_trade] - Executing trade [user_id={trade.user_id}, ticker={trade.ticker}, type={trade.trade_type}]")
+
+                if trade.trade_type == TradeType.BUY:
+                    row = await connection.fetchrow(
+                        BUY_QUERY,
+                        trade.user_id,
+                        trade.ticker,
+                        trade.quantity,
+                        trade.price,
+                        trade.total_amount,
+                        trade_id,
+                        now,
+                        str(uuid.uuid4())
+                    )
+                    if not row:
+                        raise InsufficientFundsError("Insufficient funds")
+                else:
+                    row = await connection.fetchrow(
+                        SELL_QUERY,
+                        trade.user_id,
+                        trade.ticker,
+                        trade.quantity,
+                        trade.price,
+                        trade.total_amount,
+                        trade_id,
+                        now
+                    )
+                    if not row:
+                        raise InsufficientStockError("Insufficient stock quantity")
+                    if row['remaining_quantity'] == 0:
+                        await connection.execute(DELETE_CLOSED_POSITION_QUERY, row['position_id'])
+
+                logger.info(f"[PostgresTradeExecutionRepository:execute_trade] - Trade executed [id={row['id']}, user_id={row['user_id']}, ticker={row['ticker']}, type={row['trade_type']}]")
+
+                return to_trade(row)
+            except (InsufficientFundsError, InsufficientStockError) as e:
+                logger.info(f"[PostgresTradeExecutionRepository:execute_trade] - Trade rejected [user_id={trade.user_id}, ticker={trade.ticker}, reason={str(e)}]")
+                raise
+            except Exception as e:
+                logger.error(f"[PostgresTradeExecutionRepository:execute_trade] - Error executing trade [user_id={trade.user_id}, ticker={trade.ticker}, error={str(e)}]")
+                raise
+
+    async def execute_batch(self, trades: List[Trade], all_or_nothing: bool = True) -> List[Union[Trade, ValueError]]:
+        if not trades:
+            return []
+        user_id = trades[0].user_id
+        if any(trade.user_id != user_id for trade in trades):
+            raise ValueError("All trades in a batch must belong to the same user")
+
+        async with postgres_db.acquire() as connection:
+            try:
+                now = datetime.utcnow()
+                tickers = sorted({trade.ticker for trade in trades})
+
+                logger.debug(f"[PostgresTradeExecutionRepository:execute_batch] - Executing batch [user_id={user_id}, trades={len(trades)}, all_or_nothing={all_or_nothing}]")
+
+                async with connection.transaction():
+                    cash = await connection.fetchval(LOCK_BALANCE_QUERY, user_id)
+                    rows = await connection.fetch(LOCK_POSITIONS_QUERY, user_id, tickers)
+
+                    positions: Dict[str, dict] = {
+                        row['ticker']: {
+                            'id': row['id'],
+                            'quantity': row['quantity'],
+                            'average_price': row['average_price'],
+                            'existed': True
+                        }
+                        for row in rows
+                    }
+                    cash_delta = Decimal("0")
+                    touched = set()
+                    results: List[Union[Trade, ValueError]] = []
+
+                    # Replay in order so every order sees the cash and shares left by the previous ones
+                    for trade in trades:
+                        position = positions.get(trade.ticker)
+                        if trade.trade_type == TradeType.BUY:
+                            if cash is None or cash + cash_delta < trade.total_amount:
+                                results.append(InsufficientFundsError("Insufficient funds"))
+                                continue
+                            cash_delta -= trade.total_amount
+                            if position is None:
+                                position = positions[trade.ticker] = {
+                                    'id': str(uuid.uuid4()),
+                                    'quantity': Decimal("0"),
+                                    'average_price': Decimal("0"),
+                                    'existed': False
+                                }
+                            quantity = position['quantity'] + trade.quantity
+                            position['average_price'] = (
+                                position['quantity'] * position['average_price'] + trade.quantity * trade.price
+                            ) / quantity
+                            position['quantity'] = quantity
+                        else:
+                            # A sell needs a balance row to credit, as in the single-trade path
+                            if cash is None or position is None or position['quantity'] < trade.quantity:
+                                results.append(InsufficientStockError("Insufficient stock quantity"))
+                                continue
+                            cash_delta += trade.total_amount
+                            position['quantity'] -= trade.quantity
+                        position['current_price'] = trade.price
+                        touched.add(trade.ticker)
+                        results.append(trade.model_copy(update={'id': trade.id or str(uuid.uuid4()), 'created_at': now}))
+
+                    executed = [result for result in results if isinstance(result, Trade)]
+                    rejected = len(results) - len(executed)
+                    if not executed or (all_or_nothing and rejected):
+                        logger.info(f"[PostgresTradeExecutionRepository:execute_batch] - Batch not applied [user_id={user_id}, executed=0, rejected={rejected}]")
+                        return results
+
+                    await connection.execute(UPDATE_BALANCE_QUERY, user_id, cash_delta, now)
+
+                    upserts = [
+                        (position['id'], user_id, ticker, position['quantity'], position['average_price'], position['current_price'], now)
+                        for ticker, position in positions.items()
+                        if ticker in touched and position['quantity'] > 0
+                    ]
+                    if upserts:
+                        await connection.executemany(UPSERT_POSITION_QUERY, upserts)
+
+                    closed = [
+                        position['id'] for ticker, position in positions.items()
+                        if ticker in touched and position['quantity'] == 0 and position['existed']
+                    ]
+                    if closed:
+                        await connection.execute(DELETE_POSITIONS_QUERY, closed)
+
+                    await connection.copy_records_to_table(
+                        'ibkr_trades',
+                        columns=TRADE_COLUMNS.split(', '),
+                        records=[
+                            (t.id, t.user_id, t.ticker, t.trade_type.value, t.quantity, t.price, t.total_amount, t.created_at)
+                            for t in executed
+                        ]
+                    )
+
+                logger.info(f"[PostgresTradeExecutionRepository:execute_batch] - Batch executed [user_id={user_id}, executed={len(executed)}, rejected={rejected}]")
+                return results
+            except Exception as e:
+                logger.error(f"[PostgresTradeExecutionRepository:execute_batch] - Error executing batch [user_id={user_id}, error={str(e)}]")
+                raise
\ No newline at end of file
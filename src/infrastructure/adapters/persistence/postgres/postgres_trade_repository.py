@@ -1,71 +1,65 @@
-from typing import List
-from decimal import Decimal
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 import uuid
 import logging
 
-from src.domain.entities.trade import Trade, TradeType
+from src.domain.entities.trade import Trade
+from src.domain.repositories.trade_history_repository import TradeHistoryRepository, TradeKey
 from src.domain.repositories.trade_repository import TradeRepository
+from src.infrastructure.adapters.persistence.postgres.row_mapping import TRADE_COLUMNS, to_trade
+from src.infrastructure.config.metrics import instrument_repository
 from src.infrastructure.config.postgres_database import postgres_db
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming through a server-side cursor
+STREAM_PREFETCH = 500
 
-class PostgresTradeRepository(TradeRepository):
+
+@instrument_repository
+class PostgresTradeRepository(TradeRepository, TradeHistoryRepository):
     def __init__(self):
         self.table_name = "ibkr_trades"
 
     async def create(self, trade: Trade) -> Trade:
-        connection = await postgres_db.get_connection()
-        try:
-            # Generate UUID if not provided
-            trade_id = trade.id or str(uuid.uuid4())
-            now = datetime.utcnow()
-
-            query = f"""
-                INSERT INTO {self.table_name} (id, user_id, ticker, trade_type, quantity, price, total_amount, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                RETURNING id, user_id, ticker, trade_type, quantity, price, total_amount, created_at
-            """
-
-            logger.debug(f"[PostgresTradeRepository:create] - Creating trade [user_id={trade.user_id}, ticker={trade.ticker}, type={trade.trade_type}]")
-
-            row = await connection.fetchrow(
-                query,
-                trade_id,
-                trade.user_id,
-                trade.ticker,
-                trade.trade_type.value,
-                float(trade.quantity),
-                float(trade.price),
-                float(trade.total_amount),
-                now
-            )
-
-            logger.info(f"[PostgresTradeRepository:create] - Trade created [id={row['id']}, user_id={row['user_id']}, ticker={row['ticker']}, type={row['trade_type']}]")
-
-            return Trade(
-                id=row['id'],
-                user_id=row['user_id'],
-                ticker=row['ticker'],
-                trade_type=TradeType(row['trade_type']),
-                quantity=Decimal(str(row['quantity'])),
-                price=Decimal(str(row['price'])),
-                total_amount=Decimal(str(row['total_amount'])),
-                created_at=row['created_at']
-            )
-        except Exception as e:
-            logger.error(f"[PostgresTradeRepository:create] - Error creating trade [user_id={trade.user_id}, ticker={trade.ticker}, error={str(e)}]")
-            raise
-        finally:
-            await postgres_db.release_connection(connection)
+        async with postgres_db.acquire() as connection:
+            try:
+                # Generate UUID if not provided
+                trade_id = trade.id or str(uuid.uuid4())
+                now = datetime.utcnow()
+
+                query = f"""
+                    INSERT INTO {self.table_name} (id, user_id, ticker, trade_type, quantity, price, total_amount, created_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                    RETURNING {TRADE_COLUMNS}
+                """
+
+                logger.debug(f"[PostgresTradeRepository:create] - Creating trade [user_id={trade.user_id}, ticker={trade.ticker}, type={trade.trade_type}]")
+
+                row = await connection.fetchrow(
+                    query,
+                    trade_id,
+                    trade.user_id,
+                    trade.ticker,
+                    trade.trade_type.value,
+                    trade.quantity,
+                    trade.price,
+                    trade.total_amount,
+                    now
+                )
+
+                logger.info(f"[PostgresTradeRepository:create] - Trade created [id={row['id']}, user_id={row['user_id']}, ticker={row['ticker']}, type={row['trade_type']}]")
+
+                return to_trade(row)
+            except Exception as e:
+                logger.error(f"[PostgresTradeRepository:create] - Error creating trade [user_id={trade.user_id}, ticker={trade.ticker}, error={str(e)}]")
+                raise
 
     async def find_by_user_id(self, user_id: str) -> List[Trade]:
         try:
-            connection = await postgres_db.get_connection()
-            try:
+            async with postgres_db.acquire() as connection:
                 query = f"""
-                    SELECT id, user_id, ticker, trade_type, quantity, price, total_amount, created_at
+                    SELECT {TRADE_COLUMNS}
                     FROM {self.table_name}
                     WHERE user_id = $1
                     ORDER BY created_at DESC
@@ -74,24 +68,97 @@ class PostgresTradeRepository(TradeRepository):
 
                 rows = await connection.fetch(query, user_id)
 
-                trades = [
-                    Trade(
-                        id=row['id'],
-                        user_id=row['user_id'],
-                        ticker=row['ticker'],
-                        trade_type=TradeType(row['trade_type']),
-                        quantity=Decimal(str(row['quantity'])),
-                        price=Decimal(str(row['price'])),
-                        total_amount=Decimal(str(row['total_amount'])),
-                        created_at=row['created_at']
-                    )
-                    for row in rows
-                ]
+                trades = [to_trade(row) for row in rows]
 
                 logger.debug(f"[PostgresTradeRepository:find_by_user_id] - Found {len(trades)} trades [user_id={user_id}]")
                 return trades
-            finally:
-                await postgres_db.release_connection(connection)
         except Exception as e:
             logger.error(f"[PostgresTradeRepository:find_by_user_id] - Error finding trades [user_id={user_id}, error={str(e)}]")
             return []
+
+    def _history_query(
+        self,
+        user_id: str,
+        after: Optional[TradeKey],
+        ticker: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> Tuple[str, list]:
+        """History query in the order of idx_ibkr_trades_user_created_at_id"""
+        conditions = ["user_id = $1"]
+        params: list = [user_id]
+
+        if after is not None:
+            params.extend(after)
+            # created_at descends and id ascends, so the row comparison has to be spelled out
+            conditions.append(f"(created_at < ${len(params) - 1} OR (created_at = ${len(params) - 1} AND id > ${len(params)}))")
+        if ticker is not None:
+            params.append(ticker)
+            conditions.append(f"ticker = ${len(params)}")
+        if since is not None:
+            params.append(since)
+            conditions.append(f"created_at >= ${len(params)}")
+        if until is not None:
+            params.append(until)
+            conditions.append(f"created_at < ${len(params)}")
+
+        query = f"""
+            SELECT {TRADE_COLUMNS}
+            FROM {self.table_name}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY created_at DESC, id
+        """
+        return query, params
+
+    @staticmethod
+    def _to_trade(row) -> Trade:
+        return to_trade(row)
+
+    async def find_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Trade]:
+        query, params = self._history_query(user_id, after, ticker, since, until)
+        params.append(limit)
+        query += f" LIMIT ${len(params)}"
+
+        async with postgres_db.acquire() as connection:
+            try:
+                logger.debug(f"[PostgresTradeRepository:find_page] - Executing query [user_id={user_id}, limit={limit}, after={after}, ticker={ticker}]")
+
+                rows = await connection.fetch(query, *params)
+                return [self._to_trade(row) for row in rows]
+            except Exception as e:
+                logger.error(f"[PostgresTradeRepository:find_page] - Error finding trades [user_id={user_id}, error={str(e)}]")
+                raise
+
+    async def iter_trades(
+        self,
+        user_id: str,
+        after: Optional[TradeKey] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[Trade]:
+        query, params = self._history_query(user_id, after, ticker, since, until)
+
+        async with postgres_db.acquire() as connection:
+            try:
+                logger.debug(f"[PostgresTradeRepository:iter_trades] - Opening cursor [user_id={user_id}, after={after}, ticker={ticker}]")
+
+                streamed = 0
+                # Cursors live inside a transaction; a read-only snapshot also keeps the stream consistent
+                async with connection.transaction(isolation='repeatable_read', readonly=True):
+                    async for row in connection.cursor(query, *params, prefetch=STREAM_PREFETCH):
+                        yield self._to_trade(row)
+                        streamed += 1
+
+                logger.debug(f"[PostgresTradeRepository:iter_trades] - Streamed {streamed} trades [user_id={user_id}]")
+            except Exception as e:
+                logger.error(f"[PostgresTradeRepository:iter_trades] - Error streaming trades [user_id={user_id}, error={str(e)}]")
+                raise
\ No newline at end of file
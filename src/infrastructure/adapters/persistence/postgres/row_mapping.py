@@ -0,0 +1,153 @@
+"""Row to entity mapping shared by the Postgres repositories.
+
+asyncpg's binary numeric codec decodes NUMERIC columns straight to Decimal
+and encodes Decimal parameters without loss, so money and quantities pass
+through untouched: no float on the way in, no str round trip on the way out.
+
+Trades and stock balances are read in bulk, so they skip pydantic validation:
+the columns already have the declared types.
+"""
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import FrozenSet, Type, TypeVar
+
+from asyncpg import Record
+from pydantic import BaseModel
+
+from src.domain.entities.balance import Balance
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.trade import Trade, TradeType
+from src.domain.entities.user import User
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BALANCE_COLUMNS = "id, user_id, cash_balance, created_at, updated_at"
+STOCK_BALANCE_COLUMNS = "id, user_id, ticker, quantity, average_price, current_price, created_at, updated_at"
+TRADE_COLUMNS = "id, user_id, ticker, trade_type, quantity, price, total_amount, created_at"
+USER_COLUMNS = "id, email, api_key, created_at, updated_at"
+
+TRADE_TYPES = {trade_type.value: trade_type for trade_type in TradeType}
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _all_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    return frozenset(model.model_fields)
+
+
+def _construct_unvalidated(model: Type[M], values: dict) -> M:
+    """Same result as model_construct when every field is given, minus its
+    per-field default handling, which on pydantic 2.5 costs more than
+    validating. Sets pydantic's instance slots directly.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(_all_fields(model)))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    object.__setattr__(instance, '__pydantic_private__', None)
+    return instance
+
+
+def _construct_validated(model: Type[M], values: dict) -> M:
+    return model.model_validate(values)
+
+
+def _unvalidated_matches_pydantic() -> bool:
+    """Check the fast path against model_validate for every model built through it.
+
+    It relies on pydantic internals, so a pydantic upgrade that changes them
+    is caught here, at import, instead of as subtly broken entities.
+    """
+    now = datetime.now(timezone.utc)
+    samples = {
+        User: {'id': 'u', 'email': 'check@example.com', 'api_key': 'k', 'created_at': now, 'updated_at': now},
+        Balance: {'id': 'b', 'user_id': 'u', 'cash_balance': Decimal('1.00'), 'created_at': now, 'updated_at': now},
+        StockBalance: {
+            'id': 's', 'user_id': 'u', 'ticker': 'CHECK', 'quantity': Decimal('1.0000'),
+            'average_price': Decimal('1.00'), 'current_price': Decimal('1.00'), 'created_at': now, 'updated_at': now
+        },
+        Trade: {
+            'id': 't', 'user_id': 'u', 'ticker': 'CHECK', 'trade_type': TradeType.BUY, 'quantity': Decimal('1.0000'),
+            'price': Decimal('1.00'), 'total_amount': Decimal('1.00'), 'created_at': now
+        }
+    }
+    try:
+        for model, values in samples.items():
+            fast = _construct_unvalidated(model, dict(values))
+            validated = model.model_validate(values)
+            if (
+                fast != validated
+                or fast.model_fields_set != validated.model_fields_set
+                or fast.model_dump() != validated.model_dump()
+                or fast.model_copy(update={'id': 'copy'}).model_dump() != validated.model_copy(update={'id': 'copy'}).model_dump()
+            ):
+                return False
+    except Exception:
+        return False
+    return True
+
+
+if _unvalidated_matches_pydantic():
+    _construct = _construct_unvalidated
+else:
+    logger.warning("Unvalidated entity construction does not match this pydantic version; validating every row instead")
+    _construct = _construct_validated
+
+
+def construct(model: Type[M], values: dict) -> M:
+    """Build a model from trusted values; values must hold every field with its declared type.
+
+    Skips validation unless the import-time check found that this pydantic
+    version builds instances differently. Each instance gets its own
+    fields-set, so changing one instance's set leaves the others alone.
+    """
+    return _construct(model, values)
+
+
+def to_balance(row: Record) -> Balance:
+    return Balance(
+        id=row['id'],
+        user_id=row['user_id'],
+        cash_balance=row['cash_balance'],
+        created_at=row['created_at'],
+        updated_at=row['updated_at']
+    )
+
+
+def to_stock_balance(row: Record) -> StockBalance:
+    return construct(StockBalance, {
+        'id': row['id'],
+        'user_id': row['user_id'],
+        'ticker': row['ticker'],
+        'quantity': row['quantity'],
+        'average_price': row['average_price'],
+        'current_price': row['current_price'],
+        'created_at': row['created_at'],
+        'updated_at': row['updated_at']
+    })
+
+
+def to_trade(row: Record) -> Trade:
+    return construct(Trade, {
+        'id': row['id'],
+        'user_id': row['user_id'],
+        'ticker': row['ticker'],
+        'trade_type': TRADE_TYPES[row['trade_type']],
+        'quantity': row['quantity'],
+        'price': row['price'],
+        'total_amount': row['total_amount'],
+        'created_at': row['created_at']
+    })
+
+
+def to_user(row: Record) -> User:
+    return User(
+        id=row['id'],
+        email=row['email'],
+        api_key=row['api_key'],
+        created_at=row['created_at'],
+        updated_at=row['updated_at']
+    )
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 from src.application.services.balance_service import BalanceService
-from src.infrastructure.adapters.persistence.postgres import PostgresBalanceRepository
+from src.infrastructure.config.repositories import create_balance_repository
 from src.infrastructure.middleware.auth import AuthMiddleware
 from src.infrastructure.config.logging_config import get_logger
 
@@ -18,7 +18,7 @@ auth_middleware = AuthMiddleware()
 
 
 def get_balance_service():
-    return BalanceService(PostgresBalanceRepository())
+    return BalanceService(create_balance_repository())
 
 
 @router.get("/v1/balance", response_model=BalanceResponse)
@@ -27,11 +27,11 @@ async def get_balance(
     balance_service: BalanceService = Depends(get_balance_service)
 ):
     user = await auth_middleware.authenticate(request)
-    logger.info(f"Getting balance for user: {user.id}")
+    logger.info("Getting balance for user: %s", user.id)
     
     balance = await balance_service.get_balance(user.id)
     if not balance:
-        logger.info(f"Creating new balance for user: {user.id}")
+        logger.info("Creating new balance for user: %s", user.id)
         balance = await balance_service.create_balance(user.id)
     
     response = BalanceResponse(
@@ -39,5 +39,5 @@ async def get_balance(
         cash_balance=float(balance.cash_balance)
     )
     
-    logger.info(f"Balance response for user {user.id}: cash_balance={response.cash_balance}")
+    logger.info("Balance response for user %s: cash_balance=%s", user.id, response.cash_balance)
     return response
\ No newline at end of file
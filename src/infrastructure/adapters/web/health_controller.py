@@ -1,14 +1,40 @@
-import platform
-import psutil
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
+from src.application.services.price_service import price_fetches
+from src.infrastructure.adapters.external.composite_price_provider import circuit_breakers, provider_health
+from src.infrastructure.config.cache import api_key_cache, price_cache
+from src.infrastructure.config.memory_ledger import memory_ledger
+from src.infrastructure.config.postgres_database import postgres_db
+from src.infrastructure.config.price_prefetch import price_prefetcher
+from src.infrastructure.config.price_stream import price_stream
+from src.infrastructure.config.settings import settings
+from src.infrastructure.config.system_metrics import system_metrics
 
 
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
     server_info: dict
+    price_fetches: dict
+    price_cache: dict
+    price_providers: dict
+    auth_cache: dict
+    database_pool: dict
+    ledger: dict
+    price_stream: dict
+    price_prefetch: dict
+
+
+class LivenessResponse(BaseModel):
+    status: str
+    timestamp: datetime
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    timestamp: datetime
+    checks: dict
     
 
 router = APIRouter()
@@ -16,17 +42,56 @@ router = APIRouter()
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
+    # CPU and memory come from the background sampler, so this never waits
     return HealthResponse(
         status="healthy",
         timestamp=datetime.now(),
-        server_info={
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "architecture": platform.machine(),
-            "python_version": platform.python_version(),
-            "cpu_count": psutil.cpu_count(),
-            "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "memory_available_gb": round(psutil.virtual_memory().available / (1024**3), 2),
-            "cpu_percent": psutil.cpu_percent(interval=1)
-        }
-    )
\ No newline at end of file
+        server_info=system_metrics.snapshot(),
+        price_fetches=price_fetches.stats(),
+        price_cache=price_cache.stats(),
+        price_providers=provider_health(),
+        auth_cache=api_key_cache.stats(),
+        database_pool=postgres_db.stats(),
+        ledger=memory_ledger.stats(),
+        price_stream=price_stream.stats(),
+        price_prefetch=price_prefetcher.stats()
+    )
+
+
+@router.get("/health/live", response_model=LivenessResponse)
+async def liveness_check():
+    """The process is up and the event loop is serving requests"""
+    return LivenessResponse(status="alive", timestamp=datetime.now())
+
+
+@router.get("/health/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response):
+    """503 until the database answers and at least one price provider circuit lets calls through"""
+    checks = {
+        "database": await check_database(),
+        "price_providers": check_price_providers()
+    }
+    ready = all(check["ok"] for check in checks.values())
+    if not ready:
+        response.status_code = 503
+    return ReadinessResponse(status="ready" if ready else "not_ready", timestamp=datetime.now(), checks=checks)
+
+
+async def check_database() -> dict:
+    if settings.persistence_backend == "memory":
+        return {"ok": memory_ledger.is_open and memory_ledger.error is None, "ledger": memory_ledger.stats()}
+    if not settings.database_url:
+        return {"ok": True, "configured": False}
+    if not postgres_db.pool:
+        return {"ok": False, "error": "pool not connected"}
+    try:
+        latency = await postgres_db.ping(settings.health_ready_timeout_seconds)
+    except Exception as e:
+        return {"ok": False, "error": str(e) or type(e).__name__, "pool": postgres_db.stats()}
+    return {"ok": True, "latency_ms": round(latency * 1000, 3), "pool": postgres_db.stats()}
+
+
+def check_price_providers() -> dict:
+    # Providers get a breaker on first use; none yet means nothing has failed
+    available = {name: breaker.is_available() for name, breaker in circuit_breakers.items()}
+    return {"ok": not available or any(available.values()), "available": available}
\ No newline at end of file
@@ -0,0 +1,101 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from src.application.services.price_service import price_fetches
+from src.infrastructure.adapters.external.composite_price_provider import circuit_breakers
+from src.infrastructure.adapters.external.circuit_breaker import CircuitBreaker
+from src.infrastructure.config.cache import api_key_cache, price_cache
+from src.infrastructure.config.logging_config import logging_stats
+from src.infrastructure.config.memory_ledger import memory_ledger
+from src.infrastructure.config.metrics import loop_lag_monitor, metrics
+from src.infrastructure.config.postgres_database import postgres_db
+
+router = APIRouter()
+
+CIRCUIT_STATES = (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)
+
+
+def collect_caches():
+    caches = {"price": price_cache.stats(), "auth": api_key_cache.stats()}
+    yield "cache_hits_total", "counter", "Cache lookups that found an entry", [
+        ({"cache": name}, stats["hits"] + stats.get("negative_hits", 0)) for name, stats in caches.items()
+    ]
+    yield "cache_misses_total", "counter", "Cache lookups that found nothing", [
+        ({"cache": name}, stats["misses"]) for name, stats in caches.items()
+    ]
+    yield "cache_evictions_total", "counter", "Entries evicted to stay under max_entries", [
+        ({"cache": "price"}, caches["price"]["evictions"])
+    ]
+    yield "cache_entries", "gauge", "Entries currently cached", [
+        ({"cache": "price"}, caches["price"]["size"]),
+        ({"cache": "auth"}, caches["auth"]["users"] + caches["auth"]["unknown_keys"])
+    ]
+
+
+def collect_database_pool():
+    stats = postgres_db.stats()
+    if not stats["connected"]:
+        return
+    yield "db_pool_connections", "gauge", "Pooled connections by state", [
+        ({"state": "in_use"}, stats["in_use"]),
+        ({"state": "idle"}, stats["idle"])
+    ]
+    yield "db_pool_max_connections", "gauge", "Pool size limit", [({}, stats["max_size"])]
+    yield "db_pool_waiting", "gauge", "Callers waiting for a connection", [({}, stats["waiting"])]
+    yield "db_pool_acquisitions_total", "counter", "Connections handed out", [({}, stats["acquisitions"])]
+    yield "db_pool_acquire_wait_seconds_total", "counter", "Time spent waiting for a connection", [
+        ({}, postgres_db.wait_seconds_total)
+    ]
+    yield "db_pool_acquire_timeouts_total", "counter", "Acquires that timed out", [({}, stats["acquire_timeouts"])]
+    yield "db_queries_total", "counter", "Statements sent to Postgres (round trips)", [({}, stats["queries"])]
+
+
+def collect_ledger():
+    stats = memory_ledger.stats()
+    if not stats["open"]:
+        return
+    yield "ledger_transactions_total", "counter", "Transactions written to the ledger WAL", [({}, stats["transactions"])]
+    yield "ledger_group_commits_total", "counter", "WAL appends, one fsync each, shared by the transactions waiting at the time", [
+        ({}, stats["group_commits"])
+    ]
+    yield "ledger_wal_bytes_total", "counter", "Bytes appended to the WAL", [({}, stats["bytes_written"])]
+    yield "ledger_pending_transactions", "gauge", "Transactions waiting for the next group commit", [({}, stats["pending"])]
+    yield "ledger_snapshots_total", "counter", "Snapshots written", [({}, stats["snapshots"])]
+    yield "ledger_trades", "gauge", "Trades held in memory", [({}, stats["trades"])]
+
+
+def collect_price_providers():
+    yield "price_provider_circuit_state", "gauge", "1 for the current breaker state of each provider", [
+        ({"provider": name, "state": state}, 1 if breaker.state == state else 0)
+        for name, breaker in circuit_breakers.items()
+        for state in CIRCUIT_STATES
+    ]
+    yield "price_provider_circuit_opened_total", "counter", "Times each breaker opened", [
+        ({"provider": name}, breaker.times_opened) for name, breaker in circuit_breakers.items()
+    ]
+    stats = price_fetches.stats()
+    yield "price_fetches_total", "counter", "Upstream price fetches, originated or coalesced onto one in flight", [
+        ({"kind": "originated"}, stats["originated"]),
+        ({"kind": "coalesced"}, stats["coalesced"])
+    ]
+
+
+def collect_runtime():
+    yield "event_loop_lag_last_seconds", "gauge", "Lag measured by the latest loop-lag probe", [
+        ({}, loop_lag_monitor.last_lag_seconds)
+    ]
+    stats = logging_stats()
+    yield "log_queue_depth", "gauge", "Log records waiting for the writer thread", [({}, stats["queued"])]
+    yield "log_records_dropped_total", "counter", "Log records dropped because the queue was full", [({}, stats["dropped"])]
+    yield "log_records_sampled_out_total", "counter", "Log records skipped by sampling", [({}, stats["sampled_out"])]
+
+
+metrics.add_collector(collect_caches)
+metrics.add_collector(collect_database_pool)
+metrics.add_collector(collect_ledger)
+metrics.add_collector(collect_price_providers)
+metrics.add_collector(collect_runtime)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
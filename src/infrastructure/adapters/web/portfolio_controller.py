@@ -1,9 +1,10 @@
-from typing import List
-from fastapi import APIRouter, Depends, Request
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
 from src.application.services.portfolio_service import PortfolioService
-from src.application.services.balance_service import BalanceService
-from src.infrastructure.adapters.persistence.postgres import PostgresStockBalanceRepository, PostgresBalanceRepository
+from src.infrastructure.config.price_service import create_price_service
+from src.infrastructure.config.repositories import create_portfolio_repository, create_stock_balance_repository
+from src.infrastructure.config.settings import settings
 from src.infrastructure.middleware.auth import AuthMiddleware
 from src.infrastructure.config.logging_config import get_logger
 
@@ -14,6 +15,14 @@ class StockHolding(BaseModel):
     ticker: str
     quantity: float
     average_price: float
+    # Only with ?valuation=live
+    market_price: Optional[float] = None
+    market_value: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
+    unrealized_pnl_percent: Optional[float] = None
+    price_source: Optional[str] = None
+    quote_age_seconds: Optional[float] = None
+    price_stale: Optional[bool] = None
 
 
 class PortfolioResponse(BaseModel):
@@ -21,6 +30,10 @@ class PortfolioResponse(BaseModel):
     holdings: List[StockHolding]
     total_invested_value: float
     cash_balance: float
+    # Only with ?valuation=live
+    total_market_value: Optional[float] = None
+    total_unrealized_pnl: Optional[float] = None
+    unpriced_tickers: Optional[List[str]] = None
 
 
 router = APIRouter()
@@ -28,48 +41,82 @@ auth_middleware = AuthMiddleware()
 
 
 def get_portfolio_service():
-    return PortfolioService(PostgresStockBalanceRepository())
+    return PortfolioService(
+        create_stock_balance_repository(),
+        create_portfolio_repository(),
+        create_price_service(),
+        valuation_batch_size=settings.portfolio_valuation_batch_size,
+        valuation_concurrency=settings.portfolio_valuation_concurrency
+    )
+
 
-def get_balance_service():
-    return BalanceService(PostgresBalanceRepository())
+def to_float(value) -> Optional[float]:
+    return float(value) if value is not None else None
 
 
-@router.get("/v1/portfolio", response_model=PortfolioResponse)
+@router.get("/v1/portfolio", response_model=PortfolioResponse, response_model_exclude_none=True)
 async def get_portfolio(
     request: Request,
-    portfolio_service: PortfolioService = Depends(get_portfolio_service),
-    balance_service: BalanceService = Depends(get_balance_service)
+    valuation: str = Query("cost", pattern="^(cost|live)$", description="live marks every holding to market"),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service)
 ):
     user = await auth_middleware.authenticate(request)
-    logger.info(f"Portfolio request from user {user.id}")
-    
-    # Get stock balances
-    stock_balances = await portfolio_service.get_portfolio(user.id)
-    
-    # Calculate total invested value (quantity * average_price for each holding)
-    total_invested_value = sum(
-        float(sb.quantity) * float(sb.average_price) for sb in stock_balances
-    )
-    
-    # Get user cash balance
-    balance = await balance_service.get_balance(user.id)
-    cash_balance = float(balance.cash_balance) if balance else 0.0
-    
+    logger.info("Portfolio request from user %s: valuation=%s", user.id, valuation)
+
+    if valuation == "live":
+        return await get_live_portfolio(user.id, portfolio_service)
+
+    # Cash, holdings and invested value come from a single query, summed on Decimal in SQL
+    portfolio = await portfolio_service.get_portfolio_summary(user.id)
+
     holdings = [
         StockHolding(
             ticker=sb.ticker,
             quantity=float(sb.quantity),
             average_price=float(sb.average_price)
         )
-        for sb in stock_balances
+        for sb in portfolio.holdings
     ]
-    
+
     response = PortfolioResponse(
         user_id=user.id,
         holdings=holdings,
-        total_invested_value=total_invested_value,
-        cash_balance=cash_balance
+        total_invested_value=float(portfolio.total_invested_value),
+        cash_balance=float(portfolio.cash_balance)
+    )
+
+    logger.info("Portfolio response for user %s: %s holdings, invested_value=%s, cash_balance=%s", user.id, len(holdings), portfolio.total_invested_value, portfolio.cash_balance)
+    return response
+
+
+async def get_live_portfolio(user_id: str, portfolio_service: PortfolioService) -> PortfolioResponse:
+    valuation = await portfolio_service.get_valuation(user_id)
+
+    holdings = [
+        StockHolding(
+            ticker=hv.holding.ticker,
+            quantity=float(hv.holding.quantity),
+            average_price=float(hv.holding.average_price),
+            market_price=to_float(hv.market_price),
+            market_value=to_float(hv.market_value),
+            unrealized_pnl=to_float(hv.unrealized_pnl),
+            unrealized_pnl_percent=to_float(hv.unrealized_pnl_percent),
+            price_source=hv.price_source,
+            quote_age_seconds=hv.quote_age_seconds,
+            price_stale=hv.price_stale
+        )
+        for hv in valuation.holdings
+    ]
+
+    response = PortfolioResponse(
+        user_id=user_id,
+        holdings=holdings,
+        total_invested_value=float(valuation.portfolio.total_invested_value),
+        cash_balance=float(valuation.portfolio.cash_balance),
+        total_market_value=float(valuation.total_market_value),
+        total_unrealized_pnl=float(valuation.total_unrealized_pnl),
+        unpriced_tickers=valuation.unpriced_tickers
     )
-    
-    logger.info(f"Portfolio response for user {user.id}: {len(holdings)} holdings, invested_value={total_invested_value}, cash_balance={cash_balance}")
+
+    logger.info("Live portfolio response for user %s: %s holdings, market_value=%s, unrealized_pnl=%s, unpriced=%s", user_id, len(holdings), valuation.total_market_value, valuation.total_unrealized_pnl, valuation.unpriced_tickers)
     return response
\ No newline at end of file
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel
 from src.application.services.price_service import PriceService
-from src.infrastructure.adapters.external.composite_price_provider import CompositePriceProvider
-from src.infrastructure.adapters.external.memory_cache import MemoryCache
+from src.infrastructure.config.price_service import create_price_service
 from src.infrastructure.middleware.auth import AuthMiddleware
 from src.infrastructure.config.logging_config import get_logger
 
@@ -14,15 +14,22 @@ class PriceResponse(BaseModel):
     price: float
     source: str
     timestamp: str
+    stale: bool = False
 
 
+class PricesResponse(BaseModel):
+    prices: List[PriceResponse]
+    missing: List[str]
+
+
+MAX_BATCH_TICKERS = 50
+
 router = APIRouter()
 auth_middleware = AuthMiddleware()
-cache = MemoryCache()
 
 
 def get_price_service():
-    return PriceService(CompositePriceProvider(), cache)
+    return create_price_service()
 
 
 @router.get("/v1/price/{ticker}", response_model=PriceResponse)
@@ -32,11 +39,11 @@ async def get_price(
     price_service: PriceService = Depends(get_price_service)
 ):
     user = await auth_middleware.authenticate(request)
-    logger.info(f"Price request from user {user.id} for ticker: {ticker}")
+    logger.info("Price request from user %s for ticker: %s", user.id, ticker)
 
     stock_price = await price_service.get_current_price(ticker.upper())
     if not stock_price:
-        logger.warning(f"Price not found for ticker {ticker} requested by user {user.id}")
+        logger.warning("Price not found for ticker %s requested by user %s", ticker, user.id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Price not found for ticker: {ticker}"
@@ -46,8 +53,51 @@ async def get_price(
         ticker=stock_price.ticker,
         price=float(stock_price.price),
         source=stock_price.source,
-        timestamp=stock_price.timestamp.isoformat()
+        timestamp=stock_price.timestamp.isoformat(),
+        stale=stock_price.stale
+    )
+
+    logger.info("Price response for user %s: %s=$%s (source: %s)", user.id, ticker, response.price, response.source)
+    return response
+
+
+@router.get("/v1/prices", response_model=PricesResponse)
+async def get_prices(
+    request: Request,
+    tickers: str = Query(..., description="Comma-separated tickers, e.g. AAPL,MSFT"),
+    price_service: PriceService = Depends(get_price_service)
+):
+    user = await auth_middleware.authenticate(request)
+
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+    if not symbols:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one ticker is required"
+        )
+    if len(symbols) > MAX_BATCH_TICKERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_TICKERS} tickers per request"
+        )
+
+    logger.info("Batch price request from user %s for %s tickers", user.id, len(symbols))
+
+    stock_prices = await price_service.get_current_prices(symbols)
+
+    response = PricesResponse(
+        prices=[
+            PriceResponse(
+                ticker=stock_price.ticker,
+                price=float(stock_price.price),
+                source=stock_price.source,
+                timestamp=stock_price.timestamp.isoformat(),
+                stale=stock_price.stale
+            )
+            for stock_price in (stock_prices[symbol] for symbol in symbols if symbol in stock_prices)
+        ],
+        missing=[symbol for symbol in symbols if symbol not in stock_prices]
     )
 
-    logger.info(f"Price response for user {user.id}: {ticker}=${response.price} (source: {response.source})")
+    logger.info("Batch price response for user %s: %s found, %s missing", user.id, len(response.prices), len(response.missing))
     return response
\ No newline at end of file
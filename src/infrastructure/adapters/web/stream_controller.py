@@ -0,0 +1,64 @@
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from src.infrastructure.adapters.web.price_controller import PriceResponse
+from src.infrastructure.config.price_stream import price_stream
+from src.infrastructure.config.settings import settings
+from src.infrastructure.middleware.auth import AuthMiddleware
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MAX_STREAM_TICKERS = 50
+
+router = APIRouter()
+auth_middleware = AuthMiddleware()
+
+
+@router.get("/v1/stream/prices")
+async def stream_prices(
+    request: Request,
+    tickers: str = Query(..., description="Comma-separated tickers, e.g. AAPL,MSFT")
+):
+    """Server-sent events: one `price` event per update, `: keep-alive` comments while quiet"""
+    user = await auth_middleware.authenticate(request)
+
+    symbols = list(dict.fromkeys(t.strip().upper() for t in tickers.split(",") if t.strip()))
+    if not symbols:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one ticker is required"
+        )
+    if len(symbols) > MAX_STREAM_TICKERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_STREAM_TICKERS} tickers per stream"
+        )
+
+    logger.info("Price stream opened by user %s for %s", user.id, symbols)
+
+    async def events():
+        subscription = price_stream.subscribe(symbols)
+        try:
+            while True:
+                updates = await subscription.next(timeout=settings.price_stream_heartbeat_seconds)
+                if not updates:
+                    yield ": keep-alive\n\n"
+                    continue
+                for stock_price in updates:
+                    response = PriceResponse(
+                        ticker=stock_price.ticker,
+                        price=float(stock_price.price),
+                        source=stock_price.source,
+                        timestamp=stock_price.timestamp.isoformat(),
+                        stale=stock_price.stale
+                    )
+                    yield f"event: price\ndata: {response.model_dump_json()}\n\n"
+        finally:
+            price_stream.unsubscribe(subscription)
+            logger.info("Price stream closed for user %s: %s updates delivered, %s conflated", user.id, subscription.delivered, subscription.conflated)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
\ No newline at end of file
@@ -1,14 +1,23 @@
+import base64
+from datetime import datetime
 from decimal import Decimal
-from fastapi import APIRouter, Depends, Request
-from pydantic import BaseModel
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from src.application.services.balance_service import BalanceService
-from src.application.services.price_service import PriceService
+from src.application.services.trade_history_service import TradeHistoryService
 from src.application.services.trade_service import TradeService
-from src.domain.entities.trade import TradeType
-from src.infrastructure.adapters.external.composite_price_provider import CompositePriceProvider
-from src.infrastructure.adapters.external.memory_cache import MemoryCache
-from src.infrastructure.adapters.persistence.postgres import PostgresStockBalanceRepository, PostgresTradeRepository, \
-    PostgresBalanceRepository
+from src.domain.entities.trade import Trade, TradeOrder, TradeType
+from src.domain.repositories.trade_history_repository import TradeKey
+from src.infrastructure.config.metrics import trades_executed
+from src.infrastructure.config.price_service import create_price_service
+from src.infrastructure.config.repositories import (
+    create_balance_repository,
+    create_stock_balance_repository,
+    create_trade_execution_repository,
+    create_trade_repository
+)
 from src.infrastructure.middleware.auth import AuthMiddleware
 from src.infrastructure.config.logging_config import get_logger
 
@@ -33,22 +42,81 @@ class TradeResponse(BaseModel):
     timestamp: str
 
 
+class TradeHistoryResponse(BaseModel):
+    trades: List[TradeResponse]
+    next_cursor: Optional[str] = None
+
+
+class BatchTradeRequest(BaseModel):
+    orders: List[TradeRequest]
+    mode: str = Field("all_or_nothing", pattern="^(all_or_nothing|best_effort)$")
+
+
+class BatchTradeResult(BaseModel):
+    index: int
+    ticker: str
+    action: str
+    status: str  # "executed" or "rejected"
+    trade: Optional[TradeResponse] = None
+    error: Optional[str] = None
+
+
+class BatchTradeResponse(BaseModel):
+    mode: str
+    executed: int
+    rejected: int
+    results: List[BatchTradeResult]
+
+
+MAX_PAGE_SIZE = 1000
+MAX_BATCH_ORDERS = 100
+
 router = APIRouter()
 auth_middleware = AuthMiddleware()
-cache = MemoryCache()
 
 
 def get_trade_service():
-    balance_service = BalanceService(PostgresBalanceRepository())
-    price_service = PriceService(CompositePriceProvider(), cache)
-    
+    balance_service = BalanceService(create_balance_repository())
+    # An expired price is refetched before an order is checked against it
+    price_service = create_price_service(stale_while_revalidate=False)
+
     return TradeService(
-        PostgresTradeRepository(),
-        PostgresStockBalanceRepository(),
+        create_trade_repository(),
+        create_stock_balance_repository(),
         balance_service,
-        price_service
+        price_service,
+        create_trade_execution_repository()
     )
 
+def get_trade_history_service():
+    return TradeHistoryService(create_trade_repository())
+
+
+def to_trade_response(trade: Trade) -> TradeResponse:
+    return TradeResponse(
+        id=trade.id,
+        user_id=trade.user_id,
+        ticker=trade.ticker,
+        trade_type=trade.trade_type.value,
+        quantity=float(trade.quantity),
+        price=float(trade.price),
+        total_amount=float(trade.total_amount),
+        timestamp=trade.created_at.isoformat() if trade.created_at else ""
+    )
+
+
+def encode_cursor(key: TradeKey) -> str:
+    created_at, trade_id = key
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{trade_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> TradeKey:
+    try:
+        created_at, trade_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), trade_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.post("/v1/trade", response_model=TradeResponse)
 async def execute_trade(
     trade_request: TradeRequest,
@@ -57,7 +125,7 @@ async def execute_trade(
 ):
     user = await auth_middleware.authenticate(request)
     
-    logger.info(f"Trade request from user {user.id}: {trade_request.action} {trade_request.quantity} {trade_request.ticker} @ {trade_request.price}")
+    logger.info("Trade request from user %s: %s %s %s @ %s", user.id, trade_request.action, trade_request.quantity, trade_request.ticker, trade_request.price)
     
     trade_type = TradeType.BUY if trade_request.action.lower() == "buy" else TradeType.SELL
     
@@ -69,16 +137,100 @@ async def execute_trade(
         price=Decimal(str(trade_request.price))
     )
     
-    response = TradeResponse(
-        id=trade.id,
-        user_id=trade.user_id,
-        ticker=trade.ticker,
-        trade_type=trade.trade_type.value,
-        quantity=float(trade.quantity),
-        price=float(trade.price),
-        total_amount=float(trade.total_amount),
-        timestamp=trade.created_at.isoformat() if trade.created_at else ""
+    trades_executed.inc((trade.trade_type.value,))
+    response = to_trade_response(trade)
+    
+    logger.info("Trade executed for user %s: ID=%s, total_amount=%s", user.id, response.id, response.total_amount)
+    return response
+
+
+@router.post("/v1/trades/batch", response_model=BatchTradeResponse)
+async def execute_trade_batch(
+    batch_request: BatchTradeRequest,
+    request: Request,
+    trade_service: TradeService = Depends(get_trade_service)
+):
+    user = await auth_middleware.authenticate(request)
+    
+    if not batch_request.orders:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one order is required"
+        )
+    if len(batch_request.orders) > MAX_BATCH_ORDERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_ORDERS} orders per batch"
+        )
+    
+    logger.info("Batch trade request from user %s: %s orders, mode=%s", user.id, len(batch_request.orders), batch_request.mode)
+    
+    orders = [
+        TradeOrder(
+            ticker=order.ticker.upper(),
+            trade_type=TradeType.BUY if order.action.lower() == "buy" else TradeType.SELL,
+            quantity=Decimal(str(order.quantity)),
+            price=Decimal(str(order.price))
+        )
+        for order in batch_request.orders
+    ]
+    
+    results = await trade_service.execute_batch(user.id, orders, all_or_nothing=batch_request.mode == "all_or_nothing")
+    for result in results:
+        if result.trade:
+            trades_executed.inc((result.trade.trade_type.value,))
+    
+    response = BatchTradeResponse(
+        mode=batch_request.mode,
+        executed=sum(1 for result in results if result.trade),
+        rejected=sum(1 for result in results if not result.trade),
+        results=[
+            BatchTradeResult(
+                index=i,
+                ticker=result.order.ticker,
+                action=result.order.trade_type.value,
+                status="executed" if result.trade else "rejected",
+                trade=to_trade_response(result.trade) if result.trade else None,
+                error=result.error
+            )
+            for i, result in enumerate(results)
+        ]
     )
     
-    logger.info(f"Trade executed for user {user.id}: ID={response.id}, total_amount={response.total_amount}")
-    return response
\ No newline at end of file
+    logger.info("Batch trade for user %s: executed=%s, rejected=%s", user.id, response.executed, response.rejected)
+    return response
+
+
+@router.get("/v1/trades", response_model=TradeHistoryResponse)
+async def get_trades(
+    request: Request,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    ticker: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="Only trades at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only trades before this time"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="ndjson streams every matching trade"),
+    trade_history_service: TradeHistoryService = Depends(get_trade_history_service)
+):
+    user = await auth_middleware.authenticate(request)
+    
+    after = decode_cursor(cursor) if cursor else None
+    ticker = ticker.upper() if ticker else None
+    
+    if format == "ndjson":
+        logger.info("Trade history stream for user %s: ticker=%s, since=%s, until=%s", user.id, ticker, since, until)
+        
+        async def lines():
+            async for trade in trade_history_service.stream(user.id, after, ticker, since, until):
+                yield to_trade_response(trade).model_dump_json() + "\n"
+        
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    
+    logger.info("Trade history request from user %s: limit=%s, ticker=%s, since=%s, until=%s", user.id, limit, ticker, since, until)
+    
+    trades, next_key = await trade_history_service.get_page(user.id, limit, after, ticker, since, until)
+    
+    return TradeHistoryResponse(
+        trades=[to_trade_response(trade) for trade in trades],
+        next_cursor=encode_cursor(next_key) if next_key else None
+    )
\ No newline at end of file
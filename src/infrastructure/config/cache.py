@@ -0,0 +1,32 @@
+from src.application.ports.cache import Cache
+from src.infrastructure.adapters.external.memory_cache import MemoryCache
+from src.infrastructure.adapters.external.sqlite_cache import SqliteCache
+from src.infrastructure.adapters.external.striped_memory_cache import StripedMemoryCache
+from src.infrastructure.adapters.persistence.cached_user_repository import ApiKeyCache
+from src.infrastructure.config.settings import settings
+
+
+def create_price_cache() -> Cache:
+    """Build the cache backend selected by PRICE_CACHE_BACKEND"""
+    if settings.price_cache_backend == "memory":
+        return MemoryCache(max_entries=settings.price_cache_max_entries)
+    if settings.price_cache_backend == "striped":
+        return StripedMemoryCache(
+            max_entries=settings.price_cache_max_entries,
+            shards=settings.price_cache_shards
+        )
+    if settings.price_cache_backend == "sqlite":
+        return SqliteCache(settings.price_cache_sqlite_path, max_entries=settings.price_cache_max_entries)
+    raise ValueError(f"Unknown price cache backend: {settings.price_cache_backend}")
+
+
+# One cache for the whole process so /price and /trade share fetched prices;
+# with the sqlite backend it is also shared by every worker on the host
+price_cache = create_price_cache()
+
+# Shared by every AuthMiddleware instance; call api_key_cache.invalidate() when a key is rotated
+api_key_cache = ApiKeyCache(
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+    negative_ttl_seconds=settings.auth_cache_negative_ttl_seconds,
+    max_entries=settings.auth_cache_max_entries
+)
@@ -0,0 +1,49 @@
+from typing import Dict
+import httpx
+from src.infrastructure.config.settings import settings
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpClientRegistry:
+    """Long-lived httpx clients, one per upstream, shared for the whole app"""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=settings.http2_enabled,
+            timeout=httpx.Timeout(settings.http_timeout_seconds, connect=settings.http_connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds
+            ),
+            headers={"User-Agent": "Mozilla/5.0"}
+        )
+
+    async def connect(self, *names: str):
+        """Open clients up front so the first request does not pay for it"""
+        for name in names:
+            self.get_client(name)
+
+    async def disconnect(self):
+        """Close every client and its pooled connections"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def get_client(self, name: str) -> httpx.AsyncClient:
+        """Get the shared client for an upstream, creating it on first use"""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            logger.info(f"Opening pooled HTTP client for {name} (http2={settings.http2_enabled})")
+            client = self._build_client()
+            self._clients[name] = client
+        return client
+
+
+http_clients = HttpClientRegistry()
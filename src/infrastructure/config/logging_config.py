@@ -1,33 +1,150 @@
+import atexit
+import json
 import logging
-import os
+import queue
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from src.infrastructure.config.settings import settings
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_sampling_filters: Dict[str, "SamplingFilter"] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Hands records to the listener thread without formatting them.
+
+    The stock QueueHandler formats and copies every record in prepare(), on
+    the caller's thread; here the listener builds the message instead, so log
+    arguments must not be mutated after the call. Once max_size records are
+    waiting, new ones are dropped rather than blocking the event loop.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, max_size: int):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps 1 in every round(1 / rate) records below WARNING"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.seen = 0
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        self.seen += 1
+        if self.every and (self.seen - 1) % self.every == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """'logger.a=0.1,logger.b=0.5' -> {'logger.a': 0.1, 'logger.b': 0.5}"""
+    rates = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, rate = item.split("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
 
 def setup_logging():
-    """Setup simple logging configuration"""
-    log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
-    
-    # Clear existing handlers to avoid conflicts
+    """Route every record through a bounded queue to a stdout writer thread"""
+    global _listener, _queue_handler
+    log_level = getattr(logging, settings.log_level)
+
+    shutdown_logging()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    
-    # Create console handler
+
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level))
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(formatter)
-    
-    # Configure root logger
-    root_logger.addHandler(console_handler)
-    root_logger.setLevel(getattr(logging, log_level))
-    
+    console_handler.setLevel(log_level)
+    if settings.log_format == "json":
+        console_handler.setFormatter(JsonFormatter())
+    else:
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = DroppingQueueHandler(log_queue, settings.log_queue_size)
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(log_level)
+
+    # uvicorn installs its own synchronous stdout handlers; send its records through the queue too
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    for name, sampling_filter in _sampling_filters.items():
+        logging.getLogger(name).removeFilter(sampling_filter)
+    _sampling_filters.clear()
+    for name, rate in parse_sample_rates(settings.log_sample_rates).items():
+        _sampling_filters[name] = SamplingFilter(rate)
+        logging.getLogger(name).addFilter(_sampling_filters[name])
+
     # Set specific loggers to reduce noise
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+
+def shutdown_logging():
+    """Flush the queue and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> dict:
+    return {
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "sampled_out": sum(sampling_filter.sampled_out for sampling_filter in _sampling_filters.values())
+    }
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name"""
     return logging.getLogger(name)
\ No newline at end of file
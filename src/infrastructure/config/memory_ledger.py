@@ -0,0 +1,554 @@
+"""In-process ledger state, made durable by a write-ahead log.
+
+Every write is applied to the indexed dicts right away and recorded as one
+JSON line per transaction. A single writer task appends whatever lines are
+waiting and fsyncs once, then wakes every caller in that group. Concurrent
+trades therefore share an fsync instead of paying for one each.
+
+A snapshot writes the whole state to snapshot.json and starts a new WAL
+segment. On startup the snapshot is loaded and only the later segments are
+replayed. A torn last line, left by a crash mid-write, is cut off.
+
+Writes are visible to readers before their fsync completes. A crash can
+lose transactions whose callers have not returned yet, but never part of
+one.
+"""
+import asyncio
+import bisect
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.domain.entities.balance import Balance
+from src.domain.entities.stock_balance import StockBalance
+from src.domain.entities.trade import Trade
+from src.domain.entities.user import User
+from src.infrastructure.adapters.persistence.postgres.row_mapping import TRADE_TYPES, construct
+from src.infrastructure.config.logging_config import get_logger
+from src.infrastructure.config.settings import settings
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FILE = "snapshot.json"
+SEGMENT_PATTERN = re.compile(r"^wal-(\d{8})\.log$")
+ENCODER = json.JSONEncoder(separators=(",", ":"))
+# The WAL only needs its data and length on disk, not its timestamps
+sync_file = getattr(os, "fdatasync", os.fsync)
+
+
+# Scales of the Postgres NUMERIC(15,2) and NUMERIC(15,4) columns, which round half away from zero on write
+MONEY_EXPONENT = Decimal("0.01")
+QUANTITY_EXPONENT = Decimal("0.0001")
+
+
+def round_money(value: Decimal) -> Decimal:
+    return value.quantize(MONEY_EXPONENT, ROUND_HALF_UP)
+
+
+def round_quantity(value: Decimal) -> Decimal:
+    return value.quantize(QUANTITY_EXPONENT, ROUND_HALF_UP)
+
+
+def utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Entities carry aware UTC timestamps, as Postgres returns them; naive input is taken as UTC"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+# Rows of one transaction share timestamps, and a balance keeps its created_at
+@lru_cache(maxsize=4096)
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+# Rows are positional lists in the column order of the Postgres tables
+
+
+def encode_user(user: User) -> list:
+    return [user.id, user.email, user.api_key, _iso(user.created_at), _iso(user.updated_at)]
+
+
+def decode_user(row: list) -> User:
+    return construct(User, {
+        'id': row[0],
+        'email': row[1],
+        'api_key': row[2],
+        'created_at': _datetime(row[3]),
+        'updated_at': _datetime(row[4])
+    })
+
+
+def encode_balance(balance: Balance) -> list:
+    return [balance.id, balance.user_id, str(balance.cash_balance), _iso(balance.created_at), _iso(balance.updated_at)]
+
+
+def decode_balance(row: list) -> Balance:
+    return construct(Balance, {
+        'id': row[0],
+        'user_id': row[1],
+        'cash_balance': Decimal(row[2]),
+        'created_at': _datetime(row[3]),
+        'updated_at': _datetime(row[4])
+    })
+
+
+def encode_stock_balance(stock_balance: StockBalance) -> list:
+    return [
+        stock_balance.id, stock_balance.user_id, stock_balance.ticker, str(stock_balance.quantity),
+        str(stock_balance.average_price), str(stock_balance.current_price),
+        _iso(stock_balance.created_at), _iso(stock_balance.updated_at)
+    ]
+
+
+def decode_stock_balance(row: list) -> StockBalance:
+    return construct(StockBalance, {
+        'id': row[0],
+        'user_id': row[1],
+        'ticker': row[2],
+        'quantity': Decimal(row[3]),
+        'average_price': Decimal(row[4]),
+        'current_price': Decimal(row[5]),
+        'created_at': _datetime(row[6]),
+        'updated_at': _datetime(row[7])
+    })
+
+
+def encode_trade(trade: Trade) -> list:
+    return [
+        trade.id, trade.user_id, trade.ticker, trade.trade_type.value, str(trade.quantity),
+        str(trade.price), str(trade.total_amount), _iso(trade.created_at)
+    ]
+
+
+def decode_trade(row: list) -> Trade:
+    return construct(Trade, {
+        'id': row[0],
+        'user_id': row[1],
+        'ticker': row[2],
+        'trade_type': TRADE_TYPES[row[3]],
+        'quantity': Decimal(row[4]),
+        'price': Decimal(row[5]),
+        'total_amount': Decimal(row[6]),
+        'created_at': _datetime(row[7])
+    })
+
+
+def _created_at(trade: Trade) -> datetime:
+    return trade.created_at
+
+
+class MemoryLedger:
+    """Users, balances, positions and trades indexed for the memory repositories.
+
+    Stored entities are never changed in place: every write stores a new
+    instance, so a snapshot can take references instead of copies. The
+    repositories hand out copies of anything a caller might modify.
+    """
+
+    def __init__(self, directory: str, fsync: bool = True):
+        self.directory = directory
+        self.fsync = fsync
+        self._reset()
+
+        self._segment = 0
+        self._wal = None
+        self._wake: Optional[asyncio.Event] = None
+        self._io_lock: Optional[asyncio.Lock] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+
+        self._apply = {
+            "user": lambda row: self._put_user(decode_user(row)),
+            "balance": lambda row: self._put_balance(decode_balance(row)),
+            "position": lambda row: self._put_position(decode_stock_balance(row)),
+            "position_delete": lambda row: self._delete_position(row[0]),
+            "trade": lambda row: self._add_trade(decode_trade(row))
+        }
+
+    def _reset(self) -> None:
+        """Empty state and counters; open() rebuilds the state from disk"""
+        self.users: Dict[str, User] = {}
+        self.user_ids_by_api_key: Dict[str, str] = {}
+        # user_id -> Balance
+        self.balances: Dict[str, Balance] = {}
+        # user_id -> ticker -> StockBalance, and position id -> (user_id, ticker)
+        self.positions: Dict[str, Dict[str, StockBalance]] = {}
+        self.position_keys: Dict[str, Tuple[str, str]] = {}
+        # user_id -> trades in created_at order
+        self.trades: Dict[str, List[Trade]] = {}
+
+        self.transactions = 0
+        self.group_commits = 0
+        self.bytes_written = 0
+        self.snapshots = 0
+        self.replayed = 0
+        self.error: Optional[Exception] = None
+        self._since_snapshot = 0
+        self._pending: List[str] = []
+        self._waiters: List[asyncio.Future] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer_task is not None
+
+    # State changes, shared by live writes and replay
+
+    def _put_user(self, user: User) -> None:
+        previous = self.users.get(user.id)
+        if previous is not None:
+            self.user_ids_by_api_key.pop(previous.api_key, None)
+        self.users[user.id] = user
+        self.user_ids_by_api_key[user.api_key] = user.id
+
+    def _put_balance(self, balance: Balance) -> None:
+        self.balances[balance.user_id] = balance
+
+    def _put_position(self, stock_balance: StockBalance) -> None:
+        self.positions.setdefault(stock_balance.user_id, {})[stock_balance.ticker] = stock_balance
+        self.position_keys[stock_balance.id] = (stock_balance.user_id, stock_balance.ticker)
+
+    def _delete_position(self, stock_balance_id: str) -> None:
+        key = self.position_keys.pop(stock_balance_id, None)
+        if key is not None:
+            user_id, ticker = key
+            del self.positions[user_id][ticker]
+
+    def _add_trade(self, trade: Trade) -> None:
+        trades = self.trades.setdefault(trade.user_id, [])
+        if not trades or trades[-1].created_at <= trade.created_at:
+            trades.append(trade)
+        else:
+            bisect.insort_right(trades, trade, key=_created_at)
+
+    # Writes: apply now and return the WAL operation for commit()
+
+    def _check_writable(self) -> None:
+        if self.error is not None:
+            raise RuntimeError(f"Ledger WAL is unavailable: {self.error}")
+        if not self.is_open:
+            raise RuntimeError("Ledger is not open")
+
+    def put_user(self, user: User) -> list:
+        self._check_writable()
+        self._put_user(user)
+        return ["user", encode_user(user)]
+
+    def put_balance(self, balance: Balance) -> list:
+        self._check_writable()
+        self._put_balance(balance)
+        return ["balance", encode_balance(balance)]
+
+    def put_position(self, stock_balance: StockBalance) -> list:
+        self._check_writable()
+        self._put_position(stock_balance)
+        return ["position", encode_stock_balance(stock_balance)]
+
+    def delete_position(self, stock_balance_id: str) -> list:
+        self._check_writable()
+        self._delete_position(stock_balance_id)
+        return ["position_delete", [stock_balance_id]]
+
+    def add_trade(self, trade: Trade) -> list:
+        self._check_writable()
+        self._add_trade(trade)
+        return ["trade", encode_trade(trade)]
+
+    async def commit(self, operations: List[list]) -> None:
+        """Queue one transaction for the WAL and wait until its group is on disk"""
+        self._pending.append(ENCODER.encode(operations) + "\n")
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.transactions += 1
+        self._since_snapshot += 1
+        self._wake.set()
+        await waiter
+
+    # Reads
+
+    def find_position(self, user_id: str, ticker: str) -> Optional[StockBalance]:
+        holdings = self.positions.get(user_id)
+        return holdings.get(ticker) if holdings else None
+
+    def trade_history(
+        self,
+        user_id: str,
+        after: Optional[Tuple[datetime, str]] = None,
+        ticker: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Iterator[Trade]:
+        """Trades in (created_at DESC, id) order, the order of the Postgres history index"""
+        trades = self.trades.get(user_id, [])
+        since, until = utc(since), utc(until)
+        end = len(trades)
+        if until is not None:
+            end = bisect.bisect_left(trades, until, key=_created_at)
+        if after is not None:
+            after = (utc(after[0]), after[1])
+            end = min(end, bisect.bisect_right(trades, after[0], key=_created_at))
+
+        while end > 0:
+            created_at = trades[end - 1].created_at
+            if since is not None and created_at < since:
+                return
+            start = bisect.bisect_left(trades, created_at, 0, end, key=_created_at)
+            # Trades of one batch share a timestamp; the id breaks the tie
+            for trade in sorted(trades[start:end], key=lambda t: t.id):
+                if after is not None and created_at == after[0] and trade.id <= after[1]:
+                    continue
+                if ticker is not None and trade.ticker != ticker:
+                    continue
+                yield trade
+            end = start
+
+    # Durability
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"wal-{segment:08d}.log")
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(match.group(1))
+            for match in map(SEGMENT_PATTERN.match, os.listdir(self.directory))
+            if match
+        )
+
+    def _replay(self) -> int:
+        """Load the snapshot and the WAL segments after it; returns the next segment number"""
+        next_segment = 0
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path) as f:
+                snapshot = json.load(f)
+            for row in snapshot["users"]:
+                self._put_user(decode_user(row))
+            for row in snapshot["balances"]:
+                self._put_balance(decode_balance(row))
+            for row in snapshot["positions"]:
+                self._put_position(decode_stock_balance(row))
+            for row in snapshot["trades"]:
+                self._add_trade(decode_trade(row))
+            next_segment = snapshot["wal_segment"]
+
+        for segment in self._segments():
+            if segment < next_segment:
+                continue
+            path = self._segment_path(segment)
+            with open(path, "rb+") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        operations = json.loads(line)
+                    except ValueError:
+                        if f.read(1):
+                            raise RuntimeError(f"Corrupt WAL record in {path} at byte {offset}")
+                        # A crash mid-append leaves a partial last line: that transaction never committed
+                        logger.warning("Truncating torn WAL record in %s at byte %s", path, offset)
+                        f.truncate(offset)
+                        break
+                    for name, row in operations:
+                        self._apply[name](row)
+                    self.replayed += 1
+                    offset += len(line)
+            # An empty last segment is appended to again rather than left behind
+            next_segment = segment + 1 if offset else segment
+        return next_segment
+
+    def _open_segment(self, segment: int):
+        self._segment = segment
+        return open(self._segment_path(segment), "a", encoding="utf-8")
+
+    def _append(self, wal, data: str) -> None:
+        wal.write(data)
+        wal.flush()
+        if self.fsync:
+            sync_file(wal.fileno())
+
+    def _sync_directory(self) -> None:
+        if self.fsync:
+            fd = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    async def open(self) -> None:
+        """Replay the snapshot and WAL from directory and start the WAL writer"""
+        if self.is_open:
+            return
+        # A closed ledger may be reopened, e.g. by a second app lifespan: replay into empty state
+        self._reset()
+        os.makedirs(self.directory, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ledger-wal")
+        next_segment = await loop.run_in_executor(self._executor, self._replay)
+        # Replayed transactions are not in the snapshot yet, so the next one (at the latest on close) must run
+        self._since_snapshot = self.replayed
+        self._wal = self._open_segment(next_segment)
+        await loop.run_in_executor(self._executor, self._sync_directory)
+        self._wake = asyncio.Event()
+        self._io_lock = asyncio.Lock()
+        self.error = None
+        self._writer_task = asyncio.create_task(self._write_pending())
+        logger.info(
+            "Ledger opened from %s: %s users, %s trades, %s WAL transactions replayed",
+            self.directory, len(self.users), sum(map(len, self.trades.values())), self.replayed
+        )
+
+    async def _write_pending(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            async with self._io_lock:
+                await self._write(self._wal)
+
+    async def _write(self, wal) -> None:
+        """Append every waiting transaction with one fsync, then release their callers"""
+        lines, waiters = self._pending, self._waiters
+        self._pending, self._waiters = [], []
+        if not lines:
+            return
+        data = "".join(lines)
+        try:
+            if self.fsync:
+                await asyncio.get_running_loop().run_in_executor(self._executor, self._append, wal, data)
+            else:
+                # Without fsync the write only reaches the page cache, which is quick enough to do inline
+                self._append(wal, data)
+        except Exception as e:
+            # The in-memory state is now ahead of the log: refuse further writes
+            self.error = e
+            logger.error("Ledger WAL write failed, ledger is read-only: %s", e)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(RuntimeError(f"Ledger WAL write failed: {e}"))
+            return
+        self.group_commits += 1
+        self.bytes_written += len(data)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _dump(self) -> dict:
+        # References only: stored entities are replaced, never changed, so this is a consistent cut
+        return {
+            "users": list(self.users.values()),
+            "balances": list(self.balances.values()),
+            "positions": [position for holdings in self.positions.values() for position in holdings.values()],
+            "trades": [trade for trades in self.trades.values() for trade in trades]
+        }
+
+    def _write_snapshot(self, state: dict, wal_segment: int) -> None:
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({
+                "wal_segment": wal_segment,
+                "users": [encode_user(user) for user in state["users"]],
+                "balances": [encode_balance(balance) for balance in state["balances"]],
+                "positions": [encode_stock_balance(position) for position in state["positions"]],
+                "trades": [encode_trade(trade) for trade in state["trades"]]
+            }, f, separators=(",", ":"))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(temporary, path)
+        self._sync_directory()
+        for segment in self._segments():
+            if segment < wal_segment:
+                os.remove(self._segment_path(segment))
+
+    async def snapshot(self) -> None:
+        """Write the state to snapshot.json and drop the WAL segments it covers"""
+        if not self.is_open or self.error is not None or not self._since_snapshot:
+            return
+        async with self._io_lock:
+            # Waiting transactions are already part of the state: they finish the old segment
+            state = self._dump()
+            self._since_snapshot = 0
+            old_wal = self._wal
+            self._wal = self._open_segment(self._segment + 1)
+            await self._write(old_wal)
+            old_wal.close()
+            if self.error is not None:
+                return
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._write_snapshot, state, self._segment
+            )
+            self.snapshots += 1
+            logger.info("Ledger snapshot written: %s trades, WAL segment %s", len(state["trades"]), self._segment)
+
+    def start_snapshots(self, interval_seconds: float = 300):
+        """Schedule snapshot on the running loop every interval_seconds"""
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._snapshot_periodically(interval_seconds))
+
+    async def stop_snapshots(self):
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+
+    async def _snapshot_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.snapshot()
+            except Exception as e:
+                logger.error("Ledger snapshot failed: %s", e)
+
+    async def close(self) -> None:
+        """Flush the WAL, leave a final snapshot so the next start skips replay, and stop the writer"""
+        if not self.is_open:
+            return
+        await self.stop_snapshots()
+        try:
+            await self.snapshot()
+        except Exception as e:
+            logger.error("Final ledger snapshot failed: %s", e)
+        async with self._io_lock:
+            await self._write(self._wal)
+        self._writer_task.cancel()
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        self._writer_task = None
+        self._wal.close()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        return {
+            "open": self.is_open,
+            "directory": self.directory,
+            "fsync": self.fsync,
+            "users": len(self.users),
+            "positions": len(self.position_keys),
+            "trades": sum(map(len, self.trades.values())),
+            "transactions": self.transactions,
+            "group_commits": self.group_commits,
+            "pending": len(self._pending),
+            "bytes_written": self.bytes_written,
+            "snapshots": self.snapshots,
+            "wal_segment": self._segment,
+            "replayed": self.replayed,
+            "error": str(self.error) if self.error else None
+        }
+
+
+# Opened from the application lifespan when PERSISTENCE_BACKEND=memory
+memory_ledger = MemoryLedger(settings.ledger_dir, fsync=settings.ledger_fsync)
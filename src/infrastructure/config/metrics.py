@@ -0,0 +1,213 @@
+import asyncio
+import bisect
+import functools
+import inspect
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in seconds, from 1 ms (a warm query) to 10 s (a slow upstream)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+# (name, type, help, [(labels, value)]) produced at scrape time
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Monotonic counter per label tuple"""
+
+    def __init__(self, name: str, help: str, labelnames: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self.values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram per label tuple.
+
+    A label tuple gets its bucket list on first use; after that an
+    observation is one bisect and three increments. Callers on hot paths
+    build their label tuples once and reuse them.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Labels = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [count per bucket..., count above the last bucket]
+        self.counts: Dict[Labels, List[int]] = {}
+        self.sums: Dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        counts = self.counts.get(labels)
+        if counts is None:
+            counts = self.counts[labels] = [0] * (len(self.buckets) + 1)
+            self.sums[labels] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sums[labels] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.labelnames + ("le",)
+        for labels, counts in list(self.counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, labels + (repr(bound),))} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_format_labels(bucket_names, labels + ('+Inf',))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(self.sums[labels])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Counters and histograms updated on the hot path, plus collectors read at scrape time.
+
+    Anything that already keeps its own stats (caches, the pool, breakers)
+    is exposed through a collector, so it costs nothing until /metrics is
+    scraped.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help: str, labelnames: Labels = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames: Labels = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                logger.warning("Metrics collector %s failed: %s", collector.__name__, e)
+                continue
+            for name, metric_type, help, samples in families:
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_request_seconds = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status")
+)
+price_provider_requests = metrics.counter(
+    "price_provider_requests_total", "Price provider calls by outcome (success, failure, timeout, skipped)", ("provider", "outcome")
+)
+price_provider_seconds = metrics.histogram(
+    "price_provider_duration_seconds", "Price provider call latency", ("provider", "outcome")
+)
+db_query_seconds = metrics.histogram(
+    "db_repository_duration_seconds", "Repository method latency (Postgres or memory ledger, by repository class)", ("repository", "method", "outcome")
+)
+trades_executed = metrics.counter(
+    "trades_executed_total", "Executed trades by type; rate() gives trades per second", ("type",)
+)
+event_loop_lag_seconds = metrics.histogram(
+    "event_loop_lag_seconds", "How late the loop-lag probe woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+
+def instrument_repository(cls):
+    """Time every public coroutine method of a repository class in db_repository_duration_seconds"""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(method):
+            setattr(cls, name, _timed(method, cls.__name__, name))
+    return cls
+
+
+def _timed(method, repository: str, name: str):
+    ok_labels = (repository, name, "success")
+    error_labels = (repository, name, "error")
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = await method(*args, **kwargs)
+        except BaseException:
+            db_query_seconds.observe(error_labels, time.perf_counter() - start)
+            raise
+        db_query_seconds.observe(ok_labels, time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+class LoopLagMonitor:
+    """Sleeps for interval_seconds and records how much later than that it woke up"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_lag_seconds = 0.0
+
+    def start(self, interval_seconds: float = 0.5):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._probe(interval_seconds))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _probe(self, interval_seconds: float):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval_seconds)
+            self.last_lag_seconds = max(0.0, time.perf_counter() - start - interval_seconds)
+            event_loop_lag_seconds.observe((), self.last_lag_seconds)
+
+
+loop_lag_monitor = LoopLagMonitor()
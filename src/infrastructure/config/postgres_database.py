@@ -1,34 +1,115 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import asyncpg
 from src.infrastructure.config.settings import settings
 
 
 class PostgresDatabase:
+    """Process-wide asyncpg pool.
+
+    Created and warmed in the application lifespan. Repositories borrow
+    connections with `async with postgres_db.acquire() as connection`;
+    asyncpg prepares each query on first use and reuses it from the
+    per-connection statement cache afterwards, so queries are kept as
+    constant strings. Every statement sent to the server, including the reset
+    the pool runs on release, is counted in `queries`.
+    """
+
     def __init__(self):
         self.pool = None
+        self._connect_lock = asyncio.Lock()
+        self.acquisitions = 0
+        self.waiting = 0
+        self.wait_seconds_total = 0.0
+        self.max_wait_seconds = 0.0
+        self.acquire_timeouts = 0
+        self.queries = 0
 
     async def connect(self):
-        """Create connection pool"""
-        self.pool = await asyncpg.create_pool(
-            settings.database_url,
-            min_size=2,
-            max_size=10,
-            command_timeout=60
-        )
+        """Create and warm the connection pool; concurrent callers share one pool"""
+        async with self._connect_lock:
+            if self.pool:
+                return
+            # create_pool opens min_size connections before returning
+            self.pool = await asyncpg.create_pool(
+                settings.database_url,
+                min_size=settings.db_pool_min_size,
+                max_size=settings.db_pool_max_size,
+                max_inactive_connection_lifetime=settings.db_pool_max_inactive_connection_lifetime_seconds,
+                statement_cache_size=settings.db_statement_cache_size,
+                command_timeout=settings.db_command_timeout_seconds,
+                init=self._init_connection
+            )
+
+    async def _init_connection(self, connection: asyncpg.Connection):
+        connection.add_query_logger(self._count_query)
+
+    def _count_query(self, record) -> None:
+        self.queries += 1
 
     async def disconnect(self):
         """Close connection pool"""
         if self.pool:
             await self.pool.close()
+            self.pool = None
 
-    async def get_connection(self):
-        """Get a connection from the pool"""
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Borrow a pooled connection, recording how long the caller waited for it"""
         if not self.pool:
+            # Scripts and benchmarks that run outside the app lifespan
             await self.connect()
-        return await self.pool.acquire()
 
-    async def release_connection(self, connection):
-        """Release a connection back to the pool"""
-        await self.pool.release(connection)
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            connection = await self.pool.acquire(timeout=settings.db_pool_acquire_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.acquire_timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+            waited = time.perf_counter() - start
+            self.wait_seconds_total += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        self.acquisitions += 1
+        try:
+            yield connection
+        finally:
+            await self.pool.release(connection)
+
+    async def ping(self, timeout: float) -> float:
+        """Round trip through the pool within timeout seconds; returns the seconds it took"""
+        start = time.perf_counter()
+        async with self.pool.acquire(timeout=timeout) as connection:
+            await connection.fetchval("SELECT 1", timeout=timeout)
+        return time.perf_counter() - start
+
+    def stats(self) -> dict:
+        if not self.pool:
+            return {"connected": False}
+        size = self.pool.get_size()
+        idle = self.pool.get_idle_size()
+        in_use = size - idle
+        max_size = self.pool.get_max_size()
+        return {
+            "connected": True,
+            "size": size,
+            "idle": idle,
+            "in_use": in_use,
+            "max_size": max_size,
+            "saturation": round(in_use / max_size, 4) if max_size else 0.0,
+            "waiting": self.waiting,
+            "acquisitions": self.acquisitions,
+            "avg_wait_ms": round(self.wait_seconds_total / self.acquisitions * 1000, 3) if self.acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "acquire_timeouts": self.acquire_timeouts,
+            "queries": self.queries
+        }
 
 
 postgres_db = PostgresDatabase()
@@ -0,0 +1,16 @@
+from src.application.services.price_prefetcher import PricePrefetcher
+from src.infrastructure.config.price_service import create_price_service
+from src.infrastructure.config.repositories import create_ticker_activity_repository
+from src.infrastructure.config.settings import settings
+
+
+# Started from the application lifespan when PRICE_PREFETCH_ENABLED is set
+price_prefetcher = PricePrefetcher(
+    create_price_service,
+    create_ticker_activity_repository(),
+    lead_seconds=settings.price_prefetch_lead_seconds,
+    budget_requests=settings.price_prefetch_budget_requests,
+    batch_size=settings.price_prefetch_batch_size,
+    max_tickers=settings.price_prefetch_max_tickers,
+    trade_lookback_hours=settings.price_prefetch_trade_lookback_hours
+)
@@ -0,0 +1,18 @@
+from src.application.services.price_service import PriceService
+from src.infrastructure.adapters.external.composite_price_provider import CompositePriceProvider
+from src.infrastructure.config.cache import price_cache
+from src.infrastructure.config.settings import settings
+
+
+def create_price_service(stale_while_revalidate: bool = True) -> PriceService:
+    """PriceService over the provider chain and the process-wide price cache.
+
+    Without stale_while_revalidate, a price past its soft TTL is refetched
+    before it is returned; the trade path uses that.
+    """
+    return PriceService(
+        CompositePriceProvider(),
+        price_cache,
+        soft_ttl=settings.price_soft_ttl_seconds,
+        hard_ttl=settings.price_hard_ttl_seconds if stale_while_revalidate else settings.price_soft_ttl_seconds
+    )
\ No newline at end of file
@@ -0,0 +1,7 @@
+from src.application.services.price_stream import PriceStreamHub
+from src.infrastructure.config.price_service import create_price_service
+from src.infrastructure.config.settings import settings
+
+
+# One hub for the whole process so every stream client shares the per-ticker pollers
+price_stream = PriceStreamHub(create_price_service, interval_seconds=settings.price_stream_interval_seconds)
@@ -0,0 +1,69 @@
+"""Repository adapters for the backend selected by PERSISTENCE_BACKEND"""
+from typing import Optional
+
+from src.domain.repositories.balance_repository import BalanceRepository
+from src.domain.repositories.portfolio_repository import PortfolioRepository
+from src.domain.repositories.stock_balance_repository import StockBalanceRepository
+from src.domain.repositories.ticker_activity_repository import TickerActivityRepository
+from src.domain.repositories.trade_execution_repository import TradeExecutionRepository
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.adapters.persistence.memory import (
+    MemoryBalanceRepository,
+    MemoryPortfolioRepository,
+    MemoryStockBalanceRepository,
+    MemoryTickerActivityRepository,
+    MemoryTradeExecutionRepository,
+    MemoryTradeRepository,
+    MemoryUserRepository
+)
+from src.infrastructure.adapters.persistence.postgres import (
+    PostgresBalanceRepository,
+    PostgresPortfolioRepository,
+    PostgresStockBalanceRepository,
+    PostgresTickerActivityRepository,
+    PostgresTradeExecutionRepository,
+    PostgresTradeRepository,
+    PostgresUserRepository
+)
+from src.infrastructure.config.settings import settings
+
+BACKENDS = ("postgres", "memory")
+
+if settings.persistence_backend not in BACKENDS:
+    raise ValueError(f"Unknown persistence backend: {settings.persistence_backend}")
+
+
+def uses_memory_ledger() -> bool:
+    return settings.persistence_backend == "memory"
+
+
+def create_user_repository() -> UserRepository:
+    return MemoryUserRepository() if uses_memory_ledger() else PostgresUserRepository()
+
+
+def create_balance_repository() -> BalanceRepository:
+    return MemoryBalanceRepository() if uses_memory_ledger() else PostgresBalanceRepository()
+
+
+def create_stock_balance_repository() -> StockBalanceRepository:
+    return MemoryStockBalanceRepository() if uses_memory_ledger() else PostgresStockBalanceRepository()
+
+
+def create_trade_repository():
+    """TradeRepository that is also the TradeHistoryRepository"""
+    return MemoryTradeRepository() if uses_memory_ledger() else PostgresTradeRepository()
+
+
+def create_trade_execution_repository() -> TradeExecutionRepository:
+    return MemoryTradeExecutionRepository() if uses_memory_ledger() else PostgresTradeExecutionRepository()
+
+
+def create_portfolio_repository() -> PortfolioRepository:
+    return MemoryPortfolioRepository() if uses_memory_ledger() else PostgresPortfolioRepository()
+
+
+def create_ticker_activity_repository() -> Optional[TickerActivityRepository]:
+    """None when the Postgres backend has no DATABASE_URL"""
+    if uses_memory_ledger():
+        return MemoryTickerActivityRepository()
+    return PostgresTickerActivityRepository() if settings.database_url else None
@@ -13,6 +13,104 @@ class Settings(BaseSettings):
     port: int = int(os.getenv("PORT", "8000"))
     environment: str = os.getenv("ENVIRONMENT", "development")
 
+    # asyncpg pool, created in the application lifespan. Set the statement cache
+    # size to 0 behind a transaction-mode pgbouncer.
+    db_pool_min_size: int = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    db_pool_max_size: int = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    db_pool_max_inactive_connection_lifetime_seconds: float = float(os.getenv("DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME_SECONDS", "300"))
+    db_pool_acquire_timeout_seconds: float = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "10"))
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    db_command_timeout_seconds: float = float(os.getenv("DB_COMMAND_TIMEOUT_SECONDS", "60"))
+
+    # Repository backend: "postgres", or "memory" for the in-process ledger kept durable
+    # by a write-ahead log in ledger_dir (group-committed fsyncs, periodic snapshots)
+    persistence_backend: str = os.getenv("PERSISTENCE_BACKEND", "postgres")
+    ledger_dir: str = os.getenv("LEDGER_DIR", "./data/ledger")
+    ledger_fsync: bool = os.getenv("LEDGER_FSYNC", "true").lower() == "true"
+    ledger_snapshot_interval_seconds: float = float(os.getenv("LEDGER_SNAPSHOT_INTERVAL_SECONDS", "300"))
+
+    # Outbound HTTP client pool (price providers)
+    http_timeout_seconds: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "10"))
+    http_connect_timeout_seconds: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    http_max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    http_keepalive_expiry_seconds: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    http2_enabled: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+    # Provider chain strategy ("sequential" or "hedged"). In hedged mode the next
+    # provider starts once the current one exceeds its observed p95 latency.
+    price_fetch_strategy: str = os.getenv("PRICE_FETCH_STRATEGY", "hedged")
+    price_hedge_default_delay_ms: int = int(os.getenv("PRICE_HEDGE_DEFAULT_DELAY_MS", "1000"))
+    price_hedge_min_delay_ms: int = int(os.getenv("PRICE_HEDGE_MIN_DELAY_MS", "50"))
+    price_hedge_max_delay_ms: int = int(os.getenv("PRICE_HEDGE_MAX_DELAY_MS", "3000"))
+    price_hedge_min_samples: int = int(os.getenv("PRICE_HEDGE_MIN_SAMPLES", "20"))
+
+    # Per-provider circuit breaker
+    price_breaker_window: int = int(os.getenv("PRICE_BREAKER_WINDOW", "20"))
+    price_breaker_window_seconds: float = float(os.getenv("PRICE_BREAKER_WINDOW_SECONDS", "60"))
+    price_breaker_min_calls: int = int(os.getenv("PRICE_BREAKER_MIN_CALLS", "5"))
+    price_breaker_failure_rate: float = float(os.getenv("PRICE_BREAKER_FAILURE_RATE", "0.5"))
+    price_breaker_slow_call_seconds: float = float(os.getenv("PRICE_BREAKER_SLOW_CALL_SECONDS", "5"))
+    price_breaker_slow_call_rate: float = float(os.getenv("PRICE_BREAKER_SLOW_CALL_RATE", "0.8"))
+    price_breaker_cooldown_seconds: float = float(os.getenv("PRICE_BREAKER_COOLDOWN_SECONDS", "30"))
+
+    # API key -> user cache in front of the users table
+    auth_cache_ttl_seconds: float = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "300"))
+    auth_cache_negative_ttl_seconds: float = float(os.getenv("AUTH_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+    auth_cache_max_entries: int = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+    # Price cache: "striped" or "memory" per process, or "sqlite" shared by all workers on a host
+    price_cache_backend: str = os.getenv("PRICE_CACHE_BACKEND", "striped")
+    price_cache_sqlite_path: str = os.getenv("PRICE_CACHE_SQLITE_PATH", "/tmp/broker_simulator_price_cache.db")
+    price_cache_shards: int = int(os.getenv("PRICE_CACHE_SHARDS", "16"))
+    price_cache_max_entries: int = int(os.getenv("PRICE_CACHE_MAX_ENTRIES", "10000"))
+    # Prices older than the soft TTL are served stale and refreshed in the background;
+    # past the hard TTL callers wait for upstream. Equal values disable the mode.
+    price_soft_ttl_seconds: int = int(os.getenv("PRICE_SOFT_TTL_SECONDS", "180"))
+    price_hard_ttl_seconds: int = int(os.getenv("PRICE_HARD_TTL_SECONDS", "600"))
+    price_cache_cleanup_interval_seconds: float = float(os.getenv("PRICE_CACHE_CLEANUP_INTERVAL_SECONDS", "60"))
+
+    # Price streaming: how often each per-ticker poller reads through the price cache,
+    # and how long a quiet stream waits before sending a keep-alive
+    price_stream_interval_seconds: float = float(os.getenv("PRICE_STREAM_INTERVAL_SECONDS", "5"))
+    price_stream_heartbeat_seconds: float = float(os.getenv("PRICE_STREAM_HEARTBEAT_SECONDS", "15"))
+
+    # Prefetch of held, recently traded and frequently requested tickers: entries due to
+    # turn stale within the lead time are refreshed, at most budget_requests batch
+    # requests per cycle. Keep the interval at or below the lead time.
+    price_prefetch_enabled: bool = os.getenv("PRICE_PREFETCH_ENABLED", "true").lower() == "true"
+    price_prefetch_interval_seconds: float = float(os.getenv("PRICE_PREFETCH_INTERVAL_SECONDS", "30"))
+    price_prefetch_lead_seconds: float = float(os.getenv("PRICE_PREFETCH_LEAD_SECONDS", "30"))
+    price_prefetch_budget_requests: int = int(os.getenv("PRICE_PREFETCH_BUDGET_REQUESTS", "10"))
+    price_prefetch_batch_size: int = int(os.getenv("PRICE_PREFETCH_BATCH_SIZE", "20"))
+    price_prefetch_max_tickers: int = int(os.getenv("PRICE_PREFETCH_MAX_TICKERS", "200"))
+    price_prefetch_trade_lookback_hours: float = float(os.getenv("PRICE_PREFETCH_TRADE_LOOKBACK_HOURS", "24"))
+
+    # Live portfolio valuation: tickers per batch price lookup and batches in flight
+    portfolio_valuation_batch_size: int = int(os.getenv("PORTFOLIO_VALUATION_BATCH_SIZE", "50"))
+    portfolio_valuation_concurrency: int = int(os.getenv("PORTFOLIO_VALUATION_CONCURRENCY", "4"))
+
+    # Health checks: CPU and memory for /health are sampled in the background every
+    # interval; /health/ready fails when a database round trip exceeds the timeout
+    health_sample_interval_seconds: float = float(os.getenv("HEALTH_SAMPLE_INTERVAL_SECONDS", "5"))
+    health_ready_timeout_seconds: float = float(os.getenv("HEALTH_READY_TIMEOUT_SECONDS", "2"))
+
+    # /metrics: the event-loop lag probe wakes up every interval
+    metrics_loop_lag_interval_seconds: float = float(os.getenv("METRICS_LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+
+    # Logging: records go through a bounded queue to a background writer thread
+    # ("text" or "json" output). Sample rates keep 1 in 1/rate INFO and DEBUG
+    # records of the named loggers; warnings and errors are always kept.
+    log_level: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    log_format: str = os.getenv("LOG_FORMAT", "text")
+    log_queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    log_sample_rates: str = os.getenv(
+        "LOG_SAMPLE_RATES",
+        "src.infrastructure.middleware.auth=0.1,"
+        "src.application.services.price_service=0.1,"
+        "src.infrastructure.adapters.external.composite_price_provider=0.1"
+    )
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -0,0 +1,74 @@
+import asyncio
+import platform
+from datetime import datetime
+from typing import Optional
+
+import psutil
+from src.infrastructure.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SystemMetricsSampler:
+    """CPU and memory figures refreshed in the background for /health.
+
+    psutil.cpu_percent(interval=None) reports usage since the previous call,
+    so each sample covers one interval without sleeping, and /health returns
+    the latest snapshot without waiting on anything.
+    """
+
+    def __init__(self):
+        self._process = psutil.Process()
+        self._task: Optional[asyncio.Task] = None
+        self.platform_info = {
+            "platform": platform.system(),
+            "platform_version": platform.version(),
+            "architecture": platform.machine(),
+            "python_version": platform.python_version(),
+            "cpu_count": psutil.cpu_count()
+        }
+        self.latest: dict = {}
+        self.sampled_at: Optional[datetime] = None
+
+    def sample(self) -> None:
+        memory = psutil.virtual_memory()
+        self.latest = {
+            "memory_total_gb": round(memory.total / (1024**3), 2),
+            "memory_available_gb": round(memory.available / (1024**3), 2),
+            "memory_percent": memory.percent,
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "process_cpu_percent": self._process.cpu_percent(interval=None),
+            "process_rss_mb": round(self._process.memory_info().rss / (1024**2), 1)
+        }
+        self.sampled_at = datetime.now()
+
+    def start(self, interval_seconds: float = 5):
+        """Sample on the running loop every interval_seconds"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sample_periodically(interval_seconds))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample_periodically(self, interval_seconds: float):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning("System metrics sample failed: %s", e)
+            await asyncio.sleep(interval_seconds)
+
+    def snapshot(self) -> dict:
+        if self.sampled_at is None:
+            # Outside the app lifespan; the first CPU reading is 0.0 until there is a previous call
+            self.sample()
+        return {**self.platform_info, **self.latest, "sampled_at": self.sampled_at.isoformat()}
+
+
+system_metrics = SystemMetricsSampler()
@@ -1,20 +1,22 @@
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from src.domain.entities.user import User
-from src.infrastructure.adapters.persistence.postgres import PostgresUserRepository
+from src.infrastructure.adapters.persistence.cached_user_repository import CachedUserRepository
+from src.infrastructure.config.cache import api_key_cache
 from src.infrastructure.config.logging_config import get_logger
+from src.infrastructure.config.repositories import create_user_repository
 
 logger = get_logger(__name__)
 
 
 class AuthMiddleware:
     def __init__(self):
-        self.user_repository = PostgresUserRepository()
+        self.user_repository = CachedUserRepository(create_user_repository(), api_key_cache)
         self.bearer = HTTPBearer()
 
     async def authenticate(self, request: Request) -> User:
         try:
-            logger.info(f"Authentication attempt for {request.url.path}" )
+            logger.info("Authentication attempt for %s", request.url.path)
 
             authorization = request.headers.get("Authorization")
             if not authorization:
@@ -32,25 +34,29 @@ class AuthMiddleware:
                 )
 
             api_key = authorization.replace("Bearer ", "")
-            logger.info(f"Looking up user with API key: {api_key[:4]}***")
+            logger.info("Looking up user with API key: %s***", api_key[:4])
             
             user = await self.user_repository.find_by_api_key(api_key)
             
             if not user:
-                logger.warning(f"Invalid API key attempted: {api_key[:4]}***")
+                logger.warning("Invalid API key attempted: %s***", api_key[:4])
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid API key"
                 )
 
-            logger.info(f"User authenticated successfully: {user.id} ({user.email})")
+            logger.info("User authenticated successfully: %s (%s)", user.id, user.email)
             return user
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
+            logger.error("Authentication error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Authentication failed"
-            )
\ No newline at end of file
+            )
+
+    def invalidate_api_key(self, api_key: str) -> None:
+        """Forget a cached key so the next request re-checks the database"""
+        api_key_cache.invalidate(api_key)
\ No newline at end of file
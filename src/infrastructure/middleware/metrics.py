@@ -0,0 +1,53 @@
+import time
+from typing import Callable, Dict
+from src.infrastructure.config.metrics import http_request_seconds
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request into http_request_duration_seconds.
+
+    Requests are labelled with the route template (/api/v1/price/{ticker}),
+    not the raw path, so the number of series stays bounded. Streaming
+    responses are timed until the stream ends.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: Dict[Callable, str] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_request_seconds.observe(
+                (scope["method"], self._route_path(scope), str(status_code)),
+                time.perf_counter() - start
+            )
+
+    def _route_path(self, scope) -> str:
+        # The router stores the matched endpoint in the scope; map it back to its path template
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = self._route_paths[endpoint] = route.path
+                    break
+            else:
+                return "unmatched"
+        return path